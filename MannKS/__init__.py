@@ -6,13 +6,13 @@ estimator, with additional support for seasonal analysis, seasonality testing,
 and plotting utilities.
 """
 from .trend_test import trend_test
+from .trend_test_many import trend_test_many
 from .seasonal_trend_test import seasonal_trend_test
 from .check_seasonality import check_seasonality
-from .plotting import plot_seasonal_distribution, plot_rolling_trend, plot_segmented_trend
 from .inspection import inspect_trend_data
-from .regional_test import regional_test
+from .regional_test import regional_test, regional_trend_pipeline, RegionalPipelineResult
 from .classification import classify_trend
-from .preprocessing import prepare_censored_data
+from .preprocessing import prepare_censored_data, read_censored_csv
 from ._bootstrap import block_bootstrap_mann_kendall, block_bootstrap_confidence_intervals
 from .rolling_trend import rolling_trend_test, compare_periods
 from .segmented_trend_test import (
@@ -22,10 +22,36 @@ from .segmented_trend_test import (
     calculate_breakpoint_probability
 )
 from ._surrogate import surrogate_test, SurrogateResult
-from .power import power_test, PowerResult
+from ._cache import set_cache_dir, get_cache_dir, clear_cache
+from ._diagnostics import set_emit_warnings, get_emit_warnings
+
+# Names whose modules pull in slow imports (matplotlib and seaborn for the
+# plots) are loaded on first access, keeping `import MannKS` light for
+# batch and process-pool workers.
+_LAZY_ATTRS = {
+    'plot_seasonal_distribution': '.plotting',
+    'plot_rolling_trend': '.plotting',
+    'plot_segmented_trend': '.plotting',
+    'power_test': '.power',
+    'PowerResult': '.power',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     'trend_test',
+    'trend_test_many',
     'seasonal_trend_test',
     'check_seasonality',
     'plot_seasonal_distribution',
@@ -33,8 +59,11 @@ __all__ = [
     'plot_segmented_trend',
     'inspect_trend_data',
     'regional_test',
+    'regional_trend_pipeline',
+    'RegionalPipelineResult',
     'classify_trend',
     'prepare_censored_data',
+    'read_censored_csv',
     'block_bootstrap_mann_kendall',
     'block_bootstrap_confidence_intervals',
     'rolling_trend_test',
@@ -46,7 +75,12 @@ __all__ = [
     'surrogate_test',
     'SurrogateResult',
     'power_test',
-    'PowerResult'
+    'PowerResult',
+    'set_cache_dir',
+    'get_cache_dir',
+    'clear_cache',
+    'set_emit_warnings',
+    'get_emit_warnings'
 ]
 
 __version__ = "0.6.0"
@@ -1,5 +1,4 @@
 import numpy as np
-import warnings
 from ._stats import (_mk_score_and_var_censored, _sens_estimator_unequal_spacing,
                      _sens_estimator_censored, _sens_estimator_adaptive,
                      _sens_estimator_censored_adaptive)
@@ -305,9 +304,8 @@ def block_bootstrap_confidence_intervals(x, t, censored, cen_type,
         else:
             slopes_b = _sens_estimator_adaptive(x_boot, t_boot, max_pairs=max_pairs, random_state=None)
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=RuntimeWarning)
-            boot_slope = np.nanmedian(slopes_b)
+        # (np.nanmedian warns on an all-NaN sample)
+        boot_slope = np.nanmedian(slopes_b) if np.any(~np.isnan(slopes_b)) else np.nan
         boot_slopes[b] = boot_slope
 
     # Percentile confidence intervals
@@ -0,0 +1,206 @@
+"""
+Opt-in on-disk cache for surrogate banks and periodograms.
+
+Surrogate banks depend only on the input data, the generator settings and the
+seed, so re-running `trend_test(surrogate_method=...)`, `seasonal_trend_test`
+or `power_test` on unchanged data regenerates identical banks. When a cache
+directory is set via `set_cache_dir`, banks and target periodograms are stored
+as `.npy` files keyed by a content hash and loaded back memory-mapped
+(read-only, zero-copy) on later runs.
+
+The cache is bounded by size; the least recently used entries are evicted
+first. Caching is disabled by default, and bypassed inside `_cache_disabled`
+(used for the one-off simulated series of `power_test`).
+"""
+
+import contextvars
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+import numpy as np
+from typing import Optional
+
+# Bump when the generators change in a way that invalidates stored banks
+_CACHE_FORMAT_VERSION = 1
+
+_CACHE_DIR: Optional[str] = None
+_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
+
+_BYPASSED: contextvars.ContextVar = contextvars.ContextVar('MannKS_cache_bypassed', default=False)
+
+
+def set_cache_dir(path: Optional[str], max_size_mb: float = 1024) -> None:
+    """
+    Enables (or disables) the on-disk surrogate cache.
+
+    Args:
+        path (Optional[str]): Directory for cached arrays. Created if missing.
+            Pass None to disable caching.
+        max_size_mb (float): Maximum total size of the cache in megabytes.
+            Least recently used entries are evicted beyond this size.
+    """
+    global _CACHE_DIR, _CACHE_MAX_BYTES
+
+    if path is None:
+        _CACHE_DIR = None
+        return
+
+    if max_size_mb <= 0:
+        raise ValueError("`max_size_mb` must be positive.")
+
+    path = os.path.abspath(os.fspath(path))
+    os.makedirs(path, exist_ok=True)
+    _CACHE_DIR = path
+    _CACHE_MAX_BYTES = int(max_size_mb * 1024 * 1024)
+
+
+def get_cache_dir() -> Optional[str]:
+    """
+    Returns the active cache directory, or None if caching is disabled.
+    """
+    return _CACHE_DIR
+
+
+def clear_cache() -> None:
+    """
+    Removes all cached arrays from the active cache directory.
+    """
+    for fpath, _, _ in _cache_entries():
+        try:
+            os.remove(fpath)
+        except OSError:
+            pass
+
+
+@contextmanager
+def _cache_disabled():
+    """
+    Bypasses the cache in the current context.
+
+    For series that are never tested again (e.g. the simulated series of a
+    power analysis), whose banks would only evict the entries worth keeping.
+    """
+    token = _BYPASSED.set(True)
+    try:
+        yield
+    finally:
+        _BYPASSED.reset(token)
+
+
+def _active_cache_dir() -> Optional[str]:
+    """
+    The directory to read and write, or None if caching is off or bypassed.
+    """
+    return None if _BYPASSED.get() else _CACHE_DIR
+
+
+def _is_cacheable_seed(random_state) -> bool:
+    """
+    Only integer seeds reproduce the same bank; None or Generator objects do not.
+    """
+    return isinstance(random_state, (int, np.integer)) and not isinstance(random_state, bool)
+
+
+def _cache_key(*parts) -> str:
+    """
+    Builds a content hash from arrays and scalar settings.
+    """
+    h = hashlib.sha256()
+    h.update(f"v{_CACHE_FORMAT_VERSION}".encode())
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            arr = np.ascontiguousarray(part)
+            h.update(f"|a{arr.dtype.str}{arr.shape}".encode())
+            h.update(arr.tobytes())
+        else:
+            h.update(f"|{part!r}".encode())
+    return h.hexdigest()
+
+
+def _cache_entries():
+    """
+    Lists (path, size, last_access) for cached arrays.
+    """
+    if _CACHE_DIR is None or not os.path.isdir(_CACHE_DIR):
+        return []
+    entries = []
+    for name in os.listdir(_CACHE_DIR):
+        if not name.endswith('.npy'):
+            continue
+        fpath = os.path.join(_CACHE_DIR, name)
+        try:
+            st = os.stat(fpath)
+        except OSError:
+            continue
+        entries.append((fpath, st.st_size, st.st_mtime))
+    return entries
+
+
+def _cache_load(key: str) -> Optional[np.ndarray]:
+    """
+    Loads a cached array memory-mapped (read-only), or returns None on a miss.
+    """
+    cache_dir = _active_cache_dir()
+    if cache_dir is None:
+        return None
+    fpath = os.path.join(cache_dir, key + '.npy')
+    try:
+        arr = np.load(fpath, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    try:
+        # Mark as recently used for LRU eviction
+        os.utime(fpath)
+    except OSError:
+        pass
+    return arr
+
+
+def _cache_store(key: str, arr: np.ndarray) -> np.ndarray:
+    """
+    Stores an array in the cache and evicts old entries beyond the size limit.
+
+    Returns the array unchanged; storage failures are silently ignored so the
+    cache can never break an analysis.
+    """
+    cache_dir = _active_cache_dir()
+    if cache_dir is None:
+        return arr
+    fpath = os.path.join(cache_dir, key + '.npy')
+    try:
+        # Write atomically so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    except OSError:
+        return arr
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, np.ascontiguousarray(arr))
+        os.replace(tmp_path, fpath)
+    except OSError:
+        # e.g. a full disk: the partial file is outside the size accounting
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return arr
+    _evict()
+    return arr
+
+
+def _evict() -> None:
+    """
+    Removes least recently used entries until the cache fits its size limit.
+    """
+    entries = _cache_entries()
+    total = sum(size for _, size, _ in entries)
+    if total <= _CACHE_MAX_BYTES:
+        return
+    for fpath, size, _ in sorted(entries, key=lambda e: e[2]):
+        try:
+            os.remove(fpath)
+        except OSError:
+            continue
+        total -= size
+        if total <= _CACHE_MAX_BYTES:
+            break
@@ -1,6 +1,10 @@
 import numpy as np
 import pandas as pd
 
+_NS_PER_SECOND = 10**9
+_NS_PER_DAY = 86400 * _NS_PER_SECOND
+_NAT = np.iinfo(np.int64).min
+
 
 def _is_datetime_like(x):
     """
@@ -25,6 +29,79 @@ def _is_datetime_like(x):
     return False
 
 
+def _datetime_ns(t, local=False):
+    """
+    Converts datetime-like values to int64 nanoseconds since the Unix epoch.
+
+    NumPy datetime64 arrays are converted with a cast; pandas and object input
+    (e.g., `datetime` objects or `Timestamp`s) go through a `DatetimeIndex`.
+    Naive values are taken as UTC. Time zone aware values give their UTC
+    instant, or their wall-clock time if `local` is True, which is what the
+    calendar fields (month, hour, ...) are read from. Values in several time
+    zones are converted to UTC first.
+
+    Args:
+        t (array-like): Datetime-like values.
+        local (bool): Whether to return the wall-clock time of time zone
+            aware values.
+
+    Returns:
+        np.ndarray: int64 nanoseconds (NaT as the int64 minimum), in the
+        shape of `t`.
+    """
+    if isinstance(t, np.ndarray) and np.issubdtype(t.dtype, np.datetime64):
+        return t.astype('datetime64[ns]').view(np.int64)
+
+    if isinstance(t, pd.DatetimeIndex):
+        index, shape = t, t.shape
+    elif isinstance(t, pd.Series) and t.dtype.kind == 'M':
+        index, shape = pd.DatetimeIndex(t), t.shape
+    else:
+        arr = np.asarray(t)
+        shape = arr.shape
+        if np.issubdtype(arr.dtype, np.datetime64):
+            return arr.astype('datetime64[ns]').view(np.int64)
+        try:
+            index = pd.DatetimeIndex(pd.to_datetime(arr.ravel()))
+        except (ValueError, TypeError):
+            # Mixed time zones (or naive and aware values) have no common zone
+            index = pd.DatetimeIndex(pd.to_datetime(arr.ravel(), utc=True))
+
+    if local and index.tz is not None:
+        index = index.tz_localize(None)
+    return _index_ns(index).reshape(shape)
+
+
+def _index_ns(index):
+    """
+    int64 nanoseconds since the Unix epoch (UTC) of a `DatetimeIndex`.
+
+    `DatetimeIndex.asi8` counts in the index's own unit on pandas >= 2.0, so
+    the values are cast through NumPy, which works for every supported pandas.
+    """
+    return np.asarray(index.values).astype('datetime64[ns]').view(np.int64)
+
+
+def _datetime_seconds(t, whole=False):
+    """
+    Converts datetime-like values to float seconds since the Unix epoch.
+
+    Args:
+        t (array-like): Datetime-like values.
+        whole (bool): Whether to floor to whole seconds.
+
+    Returns:
+        np.ndarray: Seconds, with NaN for NaT.
+    """
+    ns = _datetime_ns(t)
+    if whole:
+        seconds = np.floor_divide(ns, _NS_PER_SECOND).astype(float)
+    else:
+        seconds = ns / _NS_PER_SECOND
+    seconds[ns == _NAT] = np.nan
+    return seconds
+
+
 def _to_numeric_time(t):
     """
     Converts a time vector to numeric (Unix timestamp) if it is datetime-like.
@@ -38,19 +115,13 @@ def _to_numeric_time(t):
     t_arr = np.asarray(t)
     if t_arr.ndim == 0:
         t_arr = t_arr.reshape(1)
+        t = t_arr
 
     if _is_datetime_like(t_arr):
-        # Handle numpy datetime64
-        if np.issubdtype(t_arr.dtype, np.datetime64):
-            return t_arr.astype('datetime64[s]').astype(float)
-        # Handle pandas Series or Index
-        if isinstance(t, (pd.Series, pd.Index)):
-             return t.astype('int64').to_numpy() / 1e9 # ns to s
-        # Handle object array of datetimes
         try:
-             return np.array([x.timestamp() for x in t_arr], dtype=float)
-        except AttributeError:
-             pass # Fall through to default
+            return _datetime_seconds(t)
+        except (ValueError, TypeError):
+            pass # Fall through to default
 
     # Try forcing float conversion (handles int/float inputs)
     try:
@@ -58,41 +129,105 @@ def _to_numeric_time(t):
     except (ValueError, TypeError):
         # Fallback: try pandas conversion then numeric
         try:
-            converted = pd.to_datetime(t_arr)
-            if isinstance(converted, pd.Timestamp):
-                return converted.timestamp()
-            return converted.astype('int64').to_numpy() / 1e9
+            return _datetime_seconds(pd.to_datetime(t_arr.ravel()))
         except Exception:
              raise ValueError("Could not convert time vector `t` to numeric values.")
 
 
-def _get_dt_prop(dt, prop):
+# --- Calendar fields of wall-clock int64 nanoseconds ---
+# Days are counted from 1970-01-01 (a Thursday), so every field is plain
+# integer arithmetic on whole arrays.
+
+def _days(ns):
+    return np.floor_divide(ns, _NS_PER_DAY)
+
+
+def _year(days):
+    return days.astype('datetime64[D]').astype('datetime64[Y]').astype(np.int64) + 1970
+
+
+def _month(days):
+    return days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64) % 12 + 1
+
+
+def _year_start(year):
+    """Day number of 1 January of each year."""
+    return (year - 1970).astype('datetime64[Y]').astype('datetime64[D]').astype(np.int64)
+
+
+def _day_of_week(days):
+    """Monday=0, ..., Sunday=6."""
+    return (days + 3) % 7
+
+
+def _iso_calendar(days):
+    """ISO 8601 year and week, both taken from the Thursday of the week."""
+    thursday = days - _day_of_week(days) + 3
+    iso_year = _year(thursday)
+    return iso_year, (thursday - _year_start(iso_year)) // 7 + 1
+
+
+def _iso_week_code(days):
+    """ISO week as year * 100 + week."""
+    iso_year, week = _iso_calendar(days)
+    return iso_year * 100 + week
+
+
+def _time_of_day(ns, unit_ns, modulus):
+    return np.floor_divide(ns, unit_ns) % modulus
+
+
+# Define season specifications at module level
+# Structure: season_type -> (expected_period, extraction function of wall-clock ns)
+_SEASON_SPECS = {
+    'year': (1, lambda ns: _year(_days(ns))),
+    'month': (12, lambda ns: _month(_days(ns))),
+    'day_of_week': (7, lambda ns: _day_of_week(_days(ns))),
+    'quarter': (4, lambda ns: (_month(_days(ns)) - 1) // 3 + 1),
+    'hour': (24, lambda ns: _time_of_day(ns, 3600 * _NS_PER_SECOND, 24)),
+    'week_of_year': ([52, 53], lambda ns: _iso_calendar(_days(ns))[1]),
+    'biweekly': ([26, 27], lambda ns: (_iso_calendar(_days(ns))[1] - 1) // 2),
+    'day_of_year': (None, lambda ns: _days(ns) - _year_start(_year(_days(ns))) + 1),
+    'minute': (60, lambda ns: _time_of_day(ns, 60 * _NS_PER_SECOND, 60)),
+    'second': (60, lambda ns: _time_of_day(ns, _NS_PER_SECOND, 60)),
+}
+
+
+def _cycle_codes(ns, season_type):
+    """
+    Identifies the larger time cycle of each wall-clock nanosecond time.
+
+    The cycle is the ISO week for 'day_of_week' (as year * 100 + week), the
+    day for sub-daily seasons (as the seconds at the start of the day) and the
+    year otherwise.
+    """
+    days = _days(ns)
+    if season_type == 'day_of_week':
+        return _iso_week_code(days)
+    if season_type in ['hour', 'minute', 'second']:
+        return (days * 86400).astype(float)
+    return _year(days)
+
+
+def _season_and_cycle(t, season_type):
     """
-    Helper to access datetime properties, handling both Series and scalars.
+    Season and cycle identifiers of datetime-like values in a single pass.
+
+    The values are converted to wall-clock nanoseconds once and both codes
+    are computed from that array.
 
     Args:
-        dt (pd.Series or datetime-like): Datetime object or Series.
-        prop (str): Property name (e.g., 'year', 'month').
+        t (array-like): Datetime-like values.
+        season_type (str): Type of seasonality.
 
     Returns:
-        The accessed property.
+        tuple: (seasons, cycles) as NumPy arrays.
     """
-    return getattr(dt.dt, prop) if isinstance(dt, pd.Series) else getattr(dt, prop)
+    if season_type not in _SEASON_SPECS:
+        raise ValueError(f"Unknown season_type: '{season_type}'. Must be one of {list(_SEASON_SPECS.keys())}")
+    ns = _datetime_ns(t, local=True).ravel()
+    return _SEASON_SPECS[season_type][1](ns), _cycle_codes(ns, season_type)
 
-# Define season specifications at module level
-# Structure: season_type -> (expected_period, extraction_function)
-_SEASON_SPECS = {
-    'year': (1, lambda dt: _get_dt_prop(dt, 'year')),
-    'month': (12, lambda dt: _get_dt_prop(dt, 'month')),
-    'day_of_week': (7, lambda dt: _get_dt_prop(dt, 'dayofweek')),
-    'quarter': (4, lambda dt: _get_dt_prop(dt, 'quarter')),
-    'hour': (24, lambda dt: _get_dt_prop(dt, 'hour')),
-    'week_of_year': ([52, 53], lambda dt: _get_dt_prop(dt, 'isocalendar')().week),
-    'biweekly': ([26, 27], lambda dt: (_get_dt_prop(dt, 'isocalendar')().week - 1) // 2),
-    'day_of_year': (None, lambda dt: _get_dt_prop(dt, 'dayofyear')),
-    'minute': (60, lambda dt: _get_dt_prop(dt, 'minute')),
-    'second': (60, lambda dt: _get_dt_prop(dt, 'second')),
-}
 
 def _infer_period(season_type):
     """
@@ -125,12 +260,13 @@ def _get_season_func(season_type, period=None):
         period (int, optional): Expected period to validate against.
 
     Returns:
-        callable: Function taking a datetime series and returning season identifiers.
+        callable: Function taking datetime-like values and returning season
+        identifiers as a NumPy array.
     """
     if season_type not in _SEASON_SPECS:
         raise ValueError(f"Unknown season_type: '{season_type}'. Must be one of {list(_SEASON_SPECS.keys())}")
 
-    expected_period, season_func = _SEASON_SPECS[season_type]
+    expected_period, extract = _SEASON_SPECS[season_type]
 
     if period is not None and expected_period is not None:
         if isinstance(expected_period, list):
@@ -139,6 +275,9 @@ def _get_season_func(season_type, period=None):
         elif period != expected_period:
             raise ValueError(f"For season_type='{season_type}', period must be {expected_period}.")
 
+    def season_func(dt):
+        return extract(_datetime_ns(dt, local=True).ravel())
+
     return season_func
 
 def _get_cycle_identifier(dt_series, season_type):
@@ -153,25 +292,7 @@ def _get_cycle_identifier(dt_series, season_type):
     Returns:
         np.ndarray: Cycle identifiers.
     """
-    dt_accessor = dt_series.dt if isinstance(dt_series, pd.Series) else dt_series
-
-    if season_type in ['month', 'quarter', 'year', 'day_of_year', 'week_of_year', 'biweekly']:
-        # The cycle is the year
-        return dt_accessor.year.to_numpy()
-
-    elif season_type == 'day_of_week':
-        # The cycle is the week, identified by year and week number
-        iso_cal = dt_accessor.isocalendar()
-        return (iso_cal.year * 100 + iso_cal.week).to_numpy()
-
-    elif season_type in ['hour', 'minute', 'second']:
-        # The cycle is the day, identified by the Unix timestamp of the day's start
-        # Convert to int64 (nanoseconds) and then to float seconds
-        return (dt_accessor.normalize().astype(np.int64) / 10**9)
-
-    else:
-        # Default to year if the concept of a cycle is not obvious
-        return dt_accessor.year.to_numpy()
+    return _cycle_codes(_datetime_ns(dt_series, local=True).ravel(), season_type)
 
 
 def _get_time_ranks(t_values, cycles):
@@ -185,16 +306,9 @@ def _get_time_ranks(t_values, cycles):
     Returns:
         np.ndarray: Array of cycle-based ranks.
     """
-    # Create unique cycle identifiers and sort them to ensure rank order
-    unique_cycles = np.unique(cycles)
-    ranks = np.zeros_like(t_values, dtype=float)
-
-    # Assign sequential ranks to each cycle
-    for i, cycle in enumerate(unique_cycles, start=1):
-        mask = cycles == cycle
-        ranks[mask] = i
-
-    return ranks
+    # Sequential ranks of the sorted unique cycles
+    _, inverse = np.unique(np.asarray(cycles), return_inverse=True)
+    return (inverse.ravel() + 1).astype(float)
 
 
 def _get_theoretical_midpoint(datetime_series):
@@ -239,21 +353,24 @@ def _get_agg_func(agg_period: str):
         agg_period (str): Aggregation period (e.g., 'month', 'year').
 
     Returns:
-        callable: Function taking a datetime series and returning period identifiers.
+        callable: Function taking datetime-like values and returning period
+        identifiers as a NumPy array.
     """
-    def get_dt_prop(dt, prop):
-        return getattr(dt.dt, prop) if isinstance(dt, pd.Series) else getattr(dt, prop)
-
     agg_map = {
-        'year': lambda dt: get_dt_prop(dt, 'year'),
-        'month': lambda dt: get_dt_prop(dt, 'year') * 100 + get_dt_prop(dt, 'month'),
-        'day': lambda dt: get_dt_prop(dt, 'date'),
-        'week': lambda dt: get_dt_prop(dt, 'isocalendar')().year * 100 + get_dt_prop(dt, 'isocalendar')().week,
-        'quarter': lambda dt: get_dt_prop(dt, 'year') * 10 + get_dt_prop(dt, 'quarter'),
+        'year': lambda days: _year(days),
+        'month': lambda days: _year(days) * 100 + _month(days),
+        'day': lambda days: days.astype('datetime64[D]'),
+        'week': _iso_week_code,
+        'quarter': lambda days: _year(days) * 10 + (_month(days) - 1) // 3 + 1,
     }
     agg_period_lower = agg_period.lower()
 
     if agg_period_lower not in agg_map:
         raise ValueError(f"Unknown agg_period: '{agg_period}'. Must be one of {list(agg_map.keys())}")
 
-    return agg_map[agg_period_lower]
+    extract = agg_map[agg_period_lower]
+
+    def agg_func(dt):
+        return extract(_days(_datetime_ns(dt, local=True).ravel()))
+
+    return agg_func
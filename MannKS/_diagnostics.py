@@ -0,0 +1,122 @@
+"""
+Context-local diagnostics channel for the trend tests.
+
+The public tests (`trend_test`, `seasonal_trend_test`, `regional_test`,
+`segmented_trend_test`) open a `_Diagnostics` collector for the duration of a
+call, and the kernels they use report messages to it with `_report` instead of
+`warnings.warn`. The collector is held in a `contextvars.ContextVar`, so
+concurrent calls on different threads (or asyncio tasks) each see their own
+collector, unlike `warnings.catch_warnings`, which swaps process-global state.
+
+Collected messages are returned in the result's `warnings` field. They are
+also issued as Python warnings only when enabled with `set_emit_warnings`.
+Outside any collector, `_report` falls back to `warnings.warn`, so kernels
+called directly (e.g. `surrogate_test`) warn as before.
+"""
+
+import contextvars
+import warnings
+from typing import List, Optional, Tuple, Type
+
+_ACTIVE: contextvars.ContextVar = contextvars.ContextVar('MannKS_diagnostics', default=None)
+
+_EMIT_WARNINGS: bool = False
+
+
+def set_emit_warnings(enabled: bool = True) -> None:
+    """
+    Enables (or disables) issuing collected diagnostics as Python warnings.
+
+    The messages are always available in the `warnings` field of the results.
+    Emission is disabled by default.
+
+    Args:
+        enabled (bool): Whether `trend_test`, `seasonal_trend_test`,
+            `regional_test` and `segmented_trend_test` re-issue their
+            diagnostics through `warnings.warn` (as `UserWarning`).
+    """
+    global _EMIT_WARNINGS
+    _EMIT_WARNINGS = bool(enabled)
+
+
+def get_emit_warnings() -> bool:
+    """
+    Returns True if collected diagnostics are issued as Python warnings.
+    """
+    return _EMIT_WARNINGS
+
+
+class _Diagnostics:
+    """
+    Collects the messages reported during one test call.
+
+    Used as a context manager. On exit, the records are passed to the
+    enclosing collector if there is one (e.g. a trend test run inside a
+    rolling window), otherwise they are issued as warnings if enabled.
+
+    With `propagate=False` the records are only kept, for a worker task to
+    return them to the caller, which passes them on with `_replay`.
+
+    Each record is (message, category, collected), where `collected` is True
+    once the message has passed through a test's collector and is therefore
+    only issued as a warning if enabled; messages reported outside any test
+    warn unconditionally, as `_report` does without a collector.
+    """
+    __slots__ = ('records', 'propagate', '_token')
+
+    def __init__(self, propagate: bool = True):
+        self.records: List[Tuple[str, Type[Warning], bool]] = []
+        self.propagate = propagate
+        self._token = None
+
+    @property
+    def messages(self) -> List[str]:
+        return [record[0] for record in self.records]
+
+    def __enter__(self) -> '_Diagnostics':
+        self._token = _ACTIVE.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _ACTIVE.reset(self._token)
+        self._token = None
+        if not self.propagate:
+            return False
+        outer = _ACTIVE.get()
+        if outer is not None:
+            outer.records.extend((message, category, True) for message, category, _ in self.records)
+        elif _EMIT_WARNINGS:
+            for message, category, _ in self.records:
+                # Attributed to the caller of the public test function
+                warnings.warn(message, category, stacklevel=3)
+        return False
+
+
+def _report(message: str, category: Type[Warning] = UserWarning, stacklevel: int = 1) -> None:
+    """
+    Reports a diagnostic message to the active collector.
+
+    Falls back to `warnings.warn` when no collector is active; `stacklevel`
+    has the same meaning as for `warnings.warn` in that case.
+    """
+    diagnostics: Optional[_Diagnostics] = _ACTIVE.get()
+    if diagnostics is None:
+        warnings.warn(message, category, stacklevel=stacklevel + 1)
+    else:
+        diagnostics.records.append((str(message), category, False))
+
+
+def _replay(records: List[Tuple[str, Type[Warning], bool]]) -> None:
+    """
+    Passes on the records returned by a worker task, in the caller's context.
+
+    They go to the active collector if there is one; otherwise each is issued
+    as a warning exactly as it would have been had the task run in-process.
+    """
+    diagnostics: Optional[_Diagnostics] = _ACTIVE.get()
+    if diagnostics is not None:
+        diagnostics.records.extend(records)
+        return
+    for message, category, collected in records:
+        if not collected or _EMIT_WARNINGS:
+            warnings.warn(message, category, stacklevel=3)
@@ -1,8 +1,8 @@
-import datetime
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
-from ._datetime import _is_datetime_like
+from ._datetime import _is_datetime_like, _datetime_seconds, _index_ns
+from ._diagnostics import _report
 
 
 def _preprocessing(x):
@@ -19,12 +19,9 @@ def _preprocessing(x):
     """
     x = np.asarray(x)
 
-    # Convert datetime objects to numeric timestamps if necessary
+    # Convert datetime objects to numeric timestamps (whole seconds) if necessary
     if _is_datetime_like(x):
-        x = x.astype('datetime64[s]').astype(float)
-    elif x.dtype == 'O' and len(x) > 0:
-        if isinstance(x[0], datetime.datetime):
-            x = np.array([val.timestamp() for val in x])
+        x = _datetime_seconds(x, whole=True)
 
     x = x.astype(float)
 
@@ -55,135 +52,253 @@ def _missing_values_analysis(x, method='skip'):
     return x, len(x)
 
 
-def _aggregate_censored_median(group, is_datetime):
+class _SeriesData:
+    """
+    Struct-of-arrays container for a prepared time series.
+
+    Holds the columns produced by `_prepare_data` as plain NumPy arrays so the
+    statistics can run without building a DataFrame. Columns can be read by
+    name (``data['value']``) like a DataFrame; `to_frame` builds one for the
+    aggregation helpers and plotting.
+
+    Attributes:
+        value (np.ndarray): Data values (float).
+        censored (np.ndarray): Boolean censoring flags.
+        cen_type (np.ndarray): Censor types ('lt', 'gt', 'not').
+        t (np.ndarray): Numeric time (seconds since epoch for datetimes).
+        t_original (np.ndarray): Time values as supplied.
+        original_index (np.ndarray or None): Positions in the input, or None
+            when aggregation broke the link to the input rows.
     """
-    Computes a robust median for a group of observations which may contain
-    censored data, following the LWP-TRENDS R script logic.
 
-    Args:
-        group (pd.DataFrame): Data group to aggregate.
-        is_datetime (bool): Whether the time column is datetime-like.
+    __slots__ = ('value', 'censored', 'cen_type', 't', 't_original', 'original_index')
 
-    Returns:
-        pd.DataFrame: Aggregated group (single row).
+    _columns = ('value', 'censored', 'cen_type', 't_original', 't', 'original_index')
 
-    .. note::
-        The logic for determining if the aggregated median is censored
-        (i.e., `median_val <= max_censored_value`) is a heuristic method.
-        It is designed to replicate the behavior of the LWP-TRENDS R script
-        and may not be statistically robust in all scenarios.
-    """
-    n = len(group)
-    if n == 0:
-        return pd.DataFrame({
-            'value': [], 'censored': [], 'cen_type': [],
-            't_original': [], 't': []
-        })
-
-    # Compute median value
-    median_val = group['value'].median()
+    def __init__(self, value, censored, cen_type, t, t_original, original_index=None):
+        self.value = value
+        self.censored = censored
+        self.cen_type = cen_type
+        self.t = t
+        self.t_original = t_original
+        self.original_index = original_index
 
-    # Determine if median is censored (R logic)
-    if not group['censored'].any():
-        is_censored = False
-        cen_type = 'not'
-    else:
-        # Get maximum censored value
-        max_censored = group.loc[group['censored'], 'value'].max()
-        is_censored = median_val <= max_censored
-
-        if is_censored:
-            # Safely get the most common censor type
-            cen_type_mode = group.loc[group['censored'], 'cen_type'].mode()
-            if len(cen_type_mode) == 0:
-                # All censored values are NaN, default to 'not'
-                cen_type = 'not'
-                is_censored = False
-            else:
-                cen_type = cen_type_mode.iloc[0]
-        else:
-            cen_type = 'not'
+    def __len__(self):
+        return len(self.value)
 
-    row_data = {
-        'value': median_val,
-        'censored': is_censored,
-        'cen_type': cen_type,
-    }
+    def __getitem__(self, name):
+        if name not in self._columns or (name == 'original_index' and self.original_index is None):
+            raise KeyError(name)
+        return getattr(self, name)
 
-    # Always aggregate time using the median of the original timestamps
-    row_data['t_original'] = group['t_original'].median() if is_datetime else np.median(group['t_original'])
-    row_data['t'] = np.median(group['t'])
+    def take(self, indexer):
+        """Returns a new container with the rows selected by a mask or positions."""
+        return _SeriesData(
+            self.value[indexer], self.censored[indexer], self.cen_type[indexer],
+            self.t[indexer], self.t_original[indexer],
+            None if self.original_index is None else self.original_index[indexer]
+        )
 
-    return pd.DataFrame([row_data])
+    def sort_by_time(self, is_datetime):
+        """
+        Returns the rows in time order.
+
+        Uses the same (unstable) quicksort as `DataFrame.sort_values`, so rows
+        with tied times keep the order the DataFrame pipeline gave them.
+        """
+        key = self.t_original if is_datetime else self.t
+        return self.take(np.argsort(key, kind='quicksort'))
+
+    def to_frame(self):
+        """Builds the equivalent DataFrame."""
+        frame = pd.DataFrame({
+            'value': self.value,
+            'censored': self.censored,
+            'cen_type': self.cen_type,
+            't_original': self.t_original,
+            't': self.t,
+        })
+        if self.original_index is not None:
+            frame['original_index'] = self.original_index
+        return frame
+
+    @classmethod
+    def from_frame(cls, frame):
+        """Builds a container from a DataFrame with the `to_frame` columns."""
+        original_index = frame['original_index'].to_numpy() if 'original_index' in frame.columns else None
+        return cls(
+            frame['value'].to_numpy(dtype=float),
+            frame['censored'].to_numpy(dtype=bool),
+            frame['cen_type'].to_numpy(dtype=object),
+            frame['t'].to_numpy(dtype=float),
+            frame['t_original'].to_numpy(),
+            original_index
+        )
 
 
 def _prepare_data(x, t, hicensor):
     """
     Internal helper to prepare and validate data for trend tests.
+
+    Returns:
+        tuple: (data, is_datetime), where `data` is a `_SeriesData` with the
+        rows that have both a value and a time.
     """
     if isinstance(x, pd.DataFrame) and all(col in x.columns for col in ['value', 'censored', 'cen_type']):
-        data = x.copy()
-    elif isinstance(x, pd.DataFrame):
-        # Fallback for simple DataFrame: treat as numeric values.
-        # This bypasses the string check below which iterates column names.
-        x_proc, n_cols = _preprocessing(x)
-        if n_cols > 1:
-            raise ValueError("Input DataFrame `x` must be 1-dimensional (single column) or contain a 'value' column.")
-
-        data = pd.DataFrame({
-            'value': x_proc,
-            'censored': np.zeros(len(x_proc), dtype=bool),
-            'cen_type': np.full(len(x_proc), 'not', dtype=object)
-        })
-    elif hasattr(x, '__iter__') and any(isinstance(i, str) for i in x):
-        raise TypeError("Input data `x` contains strings. Please pre-process it with `prepare_censored_data` first.")
+        value = x['value'].to_numpy(dtype=float, na_value=np.nan)
+        censored = x['censored'].to_numpy(dtype=bool, na_value=False)
+        cen_type = x['cen_type'].to_numpy(dtype=object)
     else:
-        x_proc, n_cols = _preprocessing(x)
-        if n_cols > 1:
-            raise ValueError("Input `x` must be 1-dimensional.")
-
-        data = pd.DataFrame({
-            'value': x_proc,
-            'censored': np.zeros(len(x_proc), dtype=bool),
-            'cen_type': np.full(len(x_proc), 'not', dtype=object)
-        })
+        if isinstance(x, pd.DataFrame):
+            # Fallback for simple DataFrame: treat as numeric values.
+            # This bypasses the string check below which iterates column names.
+            x_proc, n_cols = _preprocessing(x)
+            if n_cols > 1:
+                raise ValueError("Input DataFrame `x` must be 1-dimensional (single column) or contain a 'value' column.")
+        elif hasattr(x, '__iter__') and any(isinstance(i, str) for i in x):
+            raise TypeError("Input data `x` contains strings. Please pre-process it with `prepare_censored_data` first.")
+        else:
+            x_proc, n_cols = _preprocessing(x)
+            if n_cols > 1:
+                raise ValueError("Input `x` must be 1-dimensional.")
+
+        value = x_proc
+        censored = np.zeros(len(x_proc), dtype=bool)
+        cen_type = np.full(len(x_proc), 'not', dtype=object)
 
     t_raw = np.asarray(t)
     is_datetime = _is_datetime_like(t_raw)
     t_numeric, _ = _preprocessing(t_raw)
-    data['t_original'] = t_raw
-    data['t'] = t_numeric
-    data['original_index'] = np.arange(len(data))
+    if len(t_raw) != len(value):
+        raise ValueError(f"`x` and `t` must have the same length (got {len(value)} and {len(t_raw)}).")
 
     # Handle missing values (in BOTH value and time)
     # Note: t_numeric will contain NaNs if the original time was NaT or invalid
-    mask = (~np.isnan(data['value'])) & (~np.isnan(data['t']))
-    data_filtered = data[mask].copy()
+    mask = ~np.isnan(value) & ~np.isnan(t_numeric)
+    data_filtered = _SeriesData(
+        value[mask], censored[mask], cen_type[mask], t_numeric[mask], t_raw[mask],
+        np.flatnonzero(mask)
+    )
 
     # Apply HiCensor rule if requested
     if hicensor:
+        is_lt = data_filtered.cen_type == 'lt'
+        natural_max = data_filtered.value[is_lt].max() if is_lt.any() else None
         if isinstance(hicensor, bool):
-            if 'lt' in data_filtered['cen_type'].values:
-                max_lt_censor = data_filtered.loc[
-                    data_filtered['cen_type'] == 'lt', 'value'].max()
-            else:
-                max_lt_censor = None # No left-censored data, so do nothing
+            max_lt_censor = natural_max # None if there is no left-censored data
         elif isinstance(hicensor, (int, float)):
-            natural_max = data_filtered.loc[
-                data_filtered['cen_type'] == 'lt', 'value'].max()
-            max_lt_censor = min(natural_max, hicensor) if pd.notna(natural_max) else hicensor
+            max_lt_censor = min(natural_max, hicensor) if natural_max is not None else hicensor
         else:
             raise ValueError("hicensor must be bool or numeric")
 
         if max_lt_censor is not None:
-            hi_censor_mask = data_filtered['value'] < max_lt_censor
-            data_filtered.loc[hi_censor_mask, 'censored'] = True
-            data_filtered.loc[hi_censor_mask, 'cen_type'] = 'lt'
-            data_filtered.loc[hi_censor_mask, 'value'] = max_lt_censor
+            hi_censor_mask = data_filtered.value < max_lt_censor
+            data_filtered.censored[hi_censor_mask] = True
+            data_filtered.cen_type[hi_censor_mask] = 'lt'
+            data_filtered.value[hi_censor_mask] = max_lt_censor
 
     return data_filtered, is_datetime
 
 
+def _group_codes(*keys):
+    """
+    Integer code of each row's group, numbered in sorted key order.
+
+    The numbering matches the group order of ``DataFrame.groupby(keys)``.
+    Rows with a missing key get -1 and are dropped by the aggregation
+    helpers, as groupby drops them.
+
+    Args:
+        *keys (array-like): One or more grouping keys of equal length.
+
+    Returns:
+        np.ndarray: Group code of each row.
+    """
+    grouper = pd.DataFrame({
+        i: key.array if isinstance(key, (pd.Series, pd.Index)) else np.asarray(key)
+        for i, key in enumerate(keys)
+    })
+    codes = grouper.groupby(list(grouper.columns), sort=True).ngroup()
+    return codes.to_numpy(dtype=float, na_value=-1).astype(np.int64)
+
+
+def _group_layout(codes):
+    """
+    Rows ordered by group and the boundaries of each group.
+
+    Rows keep their input order within a group (a stable sort), as
+    `groupby` does.
+
+    Args:
+        codes (np.ndarray): Group code of each row (-1 for rows to drop).
+
+    Returns:
+        tuple: (order, starts, counts)
+            - order (np.ndarray): Row positions grouped in code order.
+            - starts (np.ndarray): Start of each group within `order`.
+            - counts (np.ndarray): Size of each group.
+    """
+    codes = np.asarray(codes, dtype=np.int64)
+    order = np.argsort(codes, kind='stable')
+    order = order[codes[order] >= 0]
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]) if len(order) else np.zeros(0, dtype=np.int64)
+    counts = np.diff(np.r_[starts, len(order)])
+    return order, starts, counts
+
+
+def _segment_median(values, starts, counts):
+    """
+    Median of each group of `values` (given in grouped order), as `np.median` computes it.
+    """
+    group = np.repeat(np.arange(len(starts)), counts)
+    sorted_values = values[np.lexsort((values, group))]
+    return (sorted_values[starts + (counts - 1) // 2] + sorted_values[starts + counts // 2]) / 2
+
+
+def _segment_argmin(values, starts, counts):
+    """
+    Position of the first minimum of each group of `values` (given in grouped order).
+    """
+    group = np.repeat(np.arange(len(starts)), counts)
+    return np.lexsort((np.arange(len(values)), values, group))[starts]
+
+
+def _as_datetime_index(t_original):
+    """Converts time values to a DatetimeIndex, keeping their resolution."""
+    return pd.DatetimeIndex(pd.to_datetime(t_original))
+
+
+def _time_increment_rows(t_original, codes, period):
+    """
+    Rows selected by the LWP time-increment rule, one per group in group order.
+
+    Args:
+        t_original (array-like): Datetime-like time of each row.
+        codes (np.ndarray): Group code of each row, e.g. from `_group_codes`.
+        period (str): The pandas frequency string for the period ('Y', 'M', 'Q', etc.).
+
+    Returns:
+        np.ndarray: Positions of the selected rows.
+    """
+    order, starts, counts = _group_layout(codes)
+    if len(order) == 0:
+        return order
+
+    t_ns = _index_ns(_as_datetime_index(t_original))[order]
+
+    # The theoretical window of a group is the period of its earliest timestamp
+    ref_dates = pd.DatetimeIndex(np.minimum.reduceat(t_ns, starts).view('datetime64[ns]'))
+    periods = ref_dates.to_period(period)
+    period_start = _index_ns(periods.start_time)
+    period_end = _index_ns(periods.end_time)
+    midpoint = period_start + (period_end - period_start) // 2
+
+    # The observation closest to the midpoint (first one on ties)
+    distance = np.abs(t_ns - np.repeat(midpoint, counts))
+    return order[_segment_argmin(distance, starts, counts)]
+
+
 def _value_for_time_increment(df: DataFrame, group_key: pd.Series, period: str) -> DataFrame:
     """
     Aggregates data to one observation per time increment using the LWP method.
@@ -191,7 +306,8 @@ def _value_for_time_increment(df: DataFrame, group_key: pd.Series, period: str)
     This function replicates the `ValueForTimeIncr` logic from the LWP-TRENDS
     R script. For each unique time increment (defined by `group_key`), it
     selects the single observation that is closest in time to the theoretical
-    midpoint of that increment.
+    midpoint of that increment. All groups are handled in one vectorised
+    pass (see `_time_increment_rows`).
 
     Args:
         df (pd.DataFrame): The input data frame, must contain 't_original'.
@@ -203,84 +319,131 @@ def _value_for_time_increment(df: DataFrame, group_key: pd.Series, period: str)
     Returns:
         pd.DataFrame: An aggregated DataFrame with one row per unique group.
     """
-    grouped = df.groupby(group_key)
-    aggregated_dfs = []
+    rows = _time_increment_rows(df['t_original'].to_numpy(), _group_codes(group_key), period)
+    return df.iloc[rows].reset_index(drop=True)
 
-    for name, group in grouped:
-        if len(group) == 1:
-            aggregated_dfs.append(group)
-            continue
 
-        # Convert to datetime if not already, to use period logic
-        if not pd.api.types.is_datetime64_any_dtype(group['t_original']):
-            group['t_original'] = pd.to_datetime(group['t_original'])
+def _middle_lwp_midpoints(t_ns, times, starts, counts):
+    """
+    Theoretical midpoint (ns) of each group, following `_get_theoretical_midpoint`.
 
-        # Get the start and end of the period for the group's first timestamp
-        # This defines the theoretical window for the entire group
-        ref_date = group['t_original'].min()
-        period_start = ref_date.to_period(period).start_time
-        period_end = ref_date.to_period(period).end_time
-        midpoint = period_start + (period_end - period_start) / 2
+    A group whose first date falls on the 1st of a month (other than
+    February) spans that calendar month; any other group spans its own
+    range of dates.
+    """
+    first = times[starts]
+    month_start = np.asarray((first.day == 1) & (first.month != 2))
+    month_end = _index_ns(first + pd.DateOffset(months=1)) - 1
+    period_start = np.where(month_start, t_ns[starts], np.minimum.reduceat(t_ns, starts))
+    period_end = np.where(month_start, month_end, np.maximum.reduceat(t_ns, starts))
+    return period_start + (period_end - period_start) // 2
 
-        # Find the observation closest to the midpoint
-        closest_idx = (group['t_original'] - midpoint).abs().idxmin()
-        aggregated_dfs.append(group.loc[[closest_idx]])
 
-    return pd.concat(aggregated_dfs).reset_index(drop=True)
+def _aggregate_groups(data, codes, agg_method, is_datetime):
+    """
+    Aggregates every group of a prepared series to one observation.
 
+    The rows are sorted by group once and each method is computed with
+    segmented operations over the group boundaries:
 
-def _aggregate_by_group(group, agg_method, is_datetime):
-    """
-    Aggregates a group of data points using the specified method.
+    - 'median': median value and time; the median is censored when it does
+      not exceed the largest censored value of the group (a heuristic).
+    - 'robust_median': the same median, following the LWP-TRENDS R script.
+    - 'middle': the observation closest to the mean time of the group.
+    - 'middle_lwp': the observation closest to the theoretical midpoint of
+      the period (datetimes; numeric time is as 'middle').
+
+    The censor type of a censored median is the most common one among the
+    censored values of the group. Censored values without a censor type are
+    ignored for it, and a group with none left gives an uncensored median.
 
     Args:
-        group (pd.DataFrame): Data group to aggregate.
+        data (_SeriesData): Prepared data.
+        codes (np.ndarray): Group code of each row, e.g. from `_group_codes`.
         agg_method (str): Aggregation method ('median', 'robust_median', 'middle', 'middle_lwp').
         is_datetime (bool): Whether the time column is datetime-like.
 
     Returns:
-        pd.DataFrame: Aggregated group (single row).
+        _SeriesData: One row per group, in group order. Methods that select
+        an observation keep its `original_index`; the median methods drop it
+        once any group has been merged.
     """
-    if len(group) <= 1:
-        return group
-
-    if agg_method == 'median':
-        if group['censored'].any():
-            import warnings
-            warnings.warn(
-                "The 'median' aggregation method uses a simple heuristic for censored data, "
-                "which may not be statistically robust. Consider using 'robust_median' for "
-                "more accurate censored data aggregation.", UserWarning)
-        median_val = group['value'].median()
-        is_censored = median_val <= group[group['censored']]['value'].max() if group['censored'].any() else False
-
-        new_row = {
-            'value': median_val,
-            't_original': group['t_original'].median() if is_datetime else np.median(group['t_original']),
-            't': np.median(group['t']),
-            'censored': is_censored,
-            'cen_type': group.loc[group['censored'], 'cen_type'].mode()[0] if is_censored else 'not'
-        }
-        return pd.DataFrame([new_row])
-    elif agg_method == 'robust_median':
-        return _aggregate_censored_median(group, is_datetime)
-    elif agg_method == 'middle':
-        t_numeric_group = group['t'].to_numpy()
-        closest_idx = np.argmin(np.abs(t_numeric_group - np.mean(t_numeric_group)))
-        return group.iloc[[closest_idx]]
-    elif agg_method == 'middle_lwp':
-        if not is_datetime:
-            # For numeric time, 'middle_lwp' is equivalent to 'middle'
-            t_numeric_group = group['t'].to_numpy()
-            closest_idx = np.argmin(np.abs(t_numeric_group - np.mean(t_numeric_group)))
-            return group.iloc[[closest_idx]]
+    order, starts, counts = _group_layout(codes)
+    if agg_method in ('middle', 'middle_lwp'):
+        if agg_method == 'middle_lwp' and is_datetime:
+            times = _as_datetime_index(data.t_original[order])
+            t_ns = _index_ns(times)
+            midpoint = _middle_lwp_midpoints(t_ns, times, starts, counts)
+            distance = np.abs(t_ns - np.repeat(midpoint, counts))
         else:
-            # Use theoretical midpoint for datetime
-            from ._datetime import _get_theoretical_midpoint
-            theoretical_mid = _get_theoretical_midpoint(group['t_original'])
-            closest_idx = np.argmin(np.abs(group['t_original'] - theoretical_mid))
-            return group.iloc[[closest_idx]]
-    return group
+            # For numeric time, 'middle_lwp' is equivalent to 'middle'
+            t = data.t[order]
+            mean = np.add.reduceat(t, starts) / counts if len(t) else t
+            distance = np.abs(t - np.repeat(mean, counts))
+        return data.take(order[_segment_argmin(distance, starts, counts)])
+
+    if agg_method not in ('median', 'robust_median'):
+        return data.take(order)
+
+    merged = counts > 1
+    if not merged.any():
+        return data.take(order[starts])
+
+    value = data.value[order]
+    censored = data.censored[order]
+    cen_type = data.cen_type[order]
+    group = np.repeat(np.arange(len(starts)), counts)
+
+    if agg_method == 'median' and np.any(censored & np.repeat(merged, counts)):
+        _report(
+            "The 'median' aggregation method uses a simple heuristic for censored data, "
+            "which may not be statistically robust. Consider using 'robust_median' for "
+            "more accurate censored data aggregation.", UserWarning)
+
+    median_val = _segment_median(value, starts, counts)
+
+    # The median is censored when it does not exceed the largest censored value
+    has_censored = np.add.reduceat(censored.astype(np.int64), starts) > 0
+    max_censored = np.maximum.reduceat(np.where(censored, value, -np.inf), starts)
+    is_censored = has_censored & (median_val <= max_censored)
+
+    # Most common censor type among the censored values (smallest label on
+    # ties); censored values without a type do not count
+    labelled = censored & pd.notna(cen_type)
+    has_label = np.add.reduceat(labelled.astype(np.int64), starts) > 0
+    is_censored &= has_label
+    mode = np.full(len(starts), 'not', dtype=object)
+    if has_label.any():
+        labels, label_codes = np.unique(cen_type[labelled].astype(str), return_inverse=True)
+        label_counts = np.zeros((len(starts), len(labels)), dtype=np.int64)
+        np.add.at(label_counts, (group[labelled], label_codes), 1)
+        mode[has_label] = labels[np.argmax(label_counts[has_label], axis=1)]
+
+    first = order[starts]
+    if is_datetime:
+        times = _as_datetime_index(data.t_original[order])
+        # Series.median of datetimes: median of the integer values (in the
+        # index's own unit, always ns before pandas 2.0), truncated
+        t_i8 = np.asarray(times.values)
+        unit = np.datetime_data(t_i8.dtype)[0]
+        t_i8 = t_i8.view(np.int64)
+        median_i8 = _segment_median(t_i8.astype(float), starts, counts).astype(np.int64)
+        t_original = pd.DatetimeIndex(np.where(merged, median_i8, t_i8[starts]).view(f'datetime64[{unit}]'))
+        if times.tz is not None:
+            t_original = t_original.tz_localize('UTC').tz_convert(times.tz)
+        t_original = t_original.to_numpy()
+    else:
+        t_original_num = np.asarray(data.t_original[order], dtype=float)
+        t_original = np.where(merged, _segment_median(t_original_num, starts, counts), t_original_num[starts])
+
+    return _SeriesData(
+        np.where(merged, median_val, data.value[first]),
+        np.where(merged, is_censored, data.censored[first]),
+        np.where(merged, np.where(is_censored, mode, 'not'), data.cen_type[first]).astype(object),
+        np.where(merged, _segment_median(data.t[order], starts, counts), data.t[first]),
+        t_original,
+        None
+    )
 
 
 def _get_slope_scaling_factor(unit: str) -> float:
@@ -24,6 +24,18 @@ SIZE_TIER_AGGREGATE = 200000  # Force aggregation
 DEFAULT_MAX_PAIRS = 100000  # For Sen's slope
 DEFAULT_BLOCK_SIZE = 1000   # For MK score windowing
 
+# Automatic aggregation (tier 3): the aggregated series should be small enough
+# for the exact algorithms
+AGGREGATE_TARGET_N = SIZE_TIER_FULL
+# Candidate periods, finest first: (agg_period, pandas frequency, increments per year)
+_AGGREGATION_PERIODS = [
+    ('day', 'D', 365),
+    ('week', 'W', 52),
+    ('month', 'M', 12),
+    ('quarter', 'Q', 4),
+    ('year', 'Y', 1),
+]
+
 
 def detect_size_tier(n: int,
                      user_mode: Optional[str] = None,
@@ -99,6 +111,68 @@ def detect_size_tier(n: int,
         }
 
 
+def select_aggregation_period(t: Union[np.ndarray, pd.Series, pd.DatetimeIndex],
+                              target_n: int = AGGREGATE_TARGET_N,
+                              min_periods: int = 10,
+                              prop_year_tol: float = 0.9,
+                              prop_incr_tol: float = 0.9) -> Optional[Dict]:
+    """
+    Choose the aggregation period for the 'aggregate' strategy.
+
+    Candidate periods are tried from finest (day) to coarsest (year). A period
+    is accepted when aggregating to it leaves at most `target_n` values, and
+    the periods with data cover the record as `inspect_trend_data` requires
+    (proportion of years and of increments with data, measured over the span
+    of the data). The first accepted period is the finest one that brings the
+    series under the target, so as little information as possible is lost.
+
+    Args:
+        t (array-like): Datetime-like observation times.
+        target_n (int): Maximum number of aggregated values.
+        min_periods (int): Minimum number of aggregated values. Coarser
+            periods than one that falls below this are not tried.
+        prop_year_tol (float): Minimum proportion of years with data.
+        prop_incr_tol (float): Minimum proportion of periods with data.
+
+    Returns:
+        dict or None: 'agg_period', 'n_periods' and 'coverage' (the proportion
+        of periods in the span that have data) of the chosen period, or None if
+        no period qualifies.
+    """
+    from .inspection import _increment_availability
+
+    idx = pd.DatetimeIndex(pd.to_datetime(t))
+    if idx.tz is not None:
+        # Periods are calendar-based; use local wall time as to_period would
+        idx = idx.tz_localize(None)
+    years = idx.year.to_numpy(dtype=np.int64)
+
+    for agg_period, freq, per_year in _AGGREGATION_PERIODS:
+        ordinals = idx.to_period(freq).asi8
+        n_periods = len(np.unique(ordinals))
+        if n_periods > target_n:
+            continue
+        if n_periods < min_periods:
+            break
+
+        # Trend period in years spanned by the candidate's periods, so a
+        # partial first or last year is not counted as missing data
+        trend_period = (ordinals.max() - ordinals.min() + 1) / per_year
+        availability = _increment_availability(
+            years, ordinals, trend_period, per_year,
+            prop_year_tol=prop_year_tol, prop_incr_tol=prop_incr_tol,
+            annual=(per_year == 1)
+        )
+        if availability['data_ok']:
+            return {
+                'agg_period': agg_period,
+                'n_periods': n_periods,
+                'coverage': n_periods / (ordinals.max() - ordinals.min() + 1)
+            }
+
+    return None
+
+
 def fast_sens_slope(x: np.ndarray,
                     t: np.ndarray,
                     max_pairs: int = DEFAULT_MAX_PAIRS,
@@ -0,0 +1,252 @@
+"""
+Order statistics over unions of sorted blocks.
+
+Sen's slope and its confidence limits only need a handful of order
+statistics of the pairwise slopes: the median, the two confidence-limit ranks
+and the neighbours of zero for the slope probability. When the slopes come in
+independent groups (seasons, or overlapping rolling-window segments), each
+group is kept as its own sorted NumPy block and the required ranks are
+selected across the blocks, instead of pooling everything into one array
+and sorting it.
+"""
+
+import numpy as np
+from scipy.stats import norm
+from typing import Dict, Iterable, List, Optional
+
+from ._stats import EPSILON, _confidence_interval_ranks
+
+# Below this many remaining candidates, selection falls back to np.partition
+_SELECT_CUTOFF = 4096
+# Blocks smaller than this on average are cheaper to partition together than
+# to search one by one
+_SELECT_MIN_MEAN_BLOCK = 20_000
+
+
+def _select_sorted_blocks(blocks: List[np.ndarray], k: int) -> float:
+    """
+    The k-th smallest value (0-based) in the union of sorted 1D arrays.
+
+    Each round pivots on the weighted median of the middle elements of the
+    remaining ranges, which discards at least a quarter of the candidates.
+
+    Args:
+        blocks (List[np.ndarray]): Sorted arrays.
+        k (int): Rank to select.
+
+    Returns:
+        float: The selected value.
+    """
+    n_blocks = len(blocks)
+    lo = np.zeros(n_blocks, dtype=np.int64)
+    hi = np.array([len(b) for b in blocks], dtype=np.int64)
+
+    while True:
+        sizes = hi - lo
+        if sizes.sum() <= _SELECT_CUTOFF:
+            rest = np.concatenate([b[l:h] for b, l, h in zip(blocks, lo, hi)])
+            return np.partition(rest, k)[k]
+
+        active = np.flatnonzero(sizes)
+        mids = np.array([blocks[i][(lo[i] + hi[i]) // 2] for i in active])
+        order = np.argsort(mids, kind='stable')
+        cum_w = np.cumsum(sizes[active][order])
+        pivot = mids[order[np.searchsorted(cum_w, cum_w[-1] / 2)]]
+
+        less = np.zeros(n_blocks, dtype=np.int64)
+        leq = np.zeros(n_blocks, dtype=np.int64)
+        for i in active:
+            seg = blocks[i][lo[i]:hi[i]]
+            less[i] = np.searchsorted(seg, pivot, side='left')
+            leq[i] = np.searchsorted(seg, pivot, side='right')
+
+        n_less = less.sum()
+        n_leq = leq.sum()
+        if k < n_less:
+            hi = lo + less
+        elif k < n_leq:
+            return pivot
+        else:
+            k -= n_leq
+            lo = lo + leq
+
+
+def _order_statistics(blocks: List[np.ndarray], ks: Iterable[int]) -> Dict[int, float]:
+    """
+    Values at the 0-based ranks `ks` in the union of sorted blocks.
+
+    Large blocks are searched in place with `_select_sorted_blocks`, so big
+    pools are never copied. When the blocks are small on average the
+    per-block overhead dominates, and they are concatenated and partitioned
+    once for all ranks instead.
+    """
+    ks = sorted(set(int(k) for k in ks))
+    total = sum(len(b) for b in blocks)
+    if total >= len(blocks) * _SELECT_MIN_MEAN_BLOCK:
+        return {k: _select_sorted_blocks(blocks, k) for k in ks}
+    merged = np.partition(np.concatenate(blocks), ks)
+    return {k: merged[k] for k in ks}
+
+
+class _SortedBlocks:
+    """
+    A multiset of values stored as separate sorted blocks.
+
+    NaNs are dropped on insertion and counted, mirroring the NaN handling of
+    `np.nanmedian`, `_confidence_intervals` and `_sen_probability`.
+    """
+
+    __slots__ = ('blocks', 'n', 'n_nan', '_cache')
+
+    def __init__(self):
+        self.blocks = []
+        self.n = 0
+        self.n_nan = 0
+        self._cache = {}
+
+    def add(self, values: np.ndarray, is_sorted: bool = False) -> None:
+        """Adds a block of values (sorted here unless `is_sorted`)."""
+        values = np.asarray(values, dtype=float)
+        nan_mask = np.isnan(values)
+        if nan_mask.any():
+            self.n_nan += int(nan_mask.sum())
+            values = values[~nan_mask]
+        if len(values) == 0:
+            return
+        self.blocks.append(values if is_sorted else np.sort(values))
+        self.n += len(values)
+        self._cache.clear()
+
+    def count_le(self, value: float) -> int:
+        """Number of values <= `value`."""
+        return int(sum(np.searchsorted(b, value, side='right') for b in self.blocks))
+
+    def order_statistics(self, ks: Iterable[int]) -> Dict[int, float]:
+        """Values at the 0-based ranks `ks` (results are cached)."""
+        missing = [k for k in set(ks) if k not in self._cache]
+        if missing:
+            self._cache.update(_order_statistics(self.blocks, missing))
+        return self._cache
+
+
+def _slope_summary(
+    pool: _SortedBlocks,
+    var_s: float,
+    alpha: float,
+    ci_method: str = 'lwp',
+    total_pairs: Optional[int] = None,
+    probability: bool = False,
+    quartiles: bool = False
+) -> dict:
+    """
+    Sen's slope statistics of a pool of slopes from a single order-statistic query.
+
+    Reproduces `np.nanmedian`, `_confidence_intervals` and (optionally)
+    `_sen_probability` and the 25th/75th percentiles (`np.percentile`,
+    linear interpolation) of the pooled slopes.
+
+    Args:
+        pool (_SortedBlocks): The slopes.
+        var_s (float): Variance of S used for the confidence limits.
+        alpha (float): Significance level.
+        ci_method (str): 'lwp' (interpolated ranks) or 'direct'.
+        total_pairs (int or None): Total number of pairs if the slopes are a sample.
+        probability (bool): Whether to compute the Sen's slope probabilities.
+        quartiles (bool): Whether to compute the quartiles.
+
+    Returns:
+        dict: Keys 'slope', 'lower_ci', 'upper_ci' and, if requested,
+        'sen_prob', 'sen_prob_max', 'sen_prob_min', 'q25', 'q75'.
+    """
+    n = pool.n
+    out = {'slope': np.nan, 'lower_ci': np.nan, 'upper_ci': np.nan}
+    if probability:
+        out.update(sen_prob=np.nan, sen_prob_max=np.nan, sen_prob_min=np.nan)
+    if quartiles:
+        out.update(q25=np.nan, q75=np.nan)
+    if n == 0:
+        return out
+
+    mid = n // 2
+    needed = [mid] if n % 2 else [mid - 1, mid]
+
+    with_ci = var_s >= EPSILON
+    ci_ks = []
+    if with_ci:
+        rank1, rank2 = _confidence_interval_ranks(n, var_s, alpha, total_pairs)
+        for rank in (rank1, rank2):
+            if ci_method == 'lwp':
+                # np.interp over 1-based ranks, clamped at the ends
+                if rank <= 1:
+                    ci_ks.append((0, 0, 0.0))
+                elif rank >= n:
+                    ci_ks.append((n - 1, n - 1, 0.0))
+                else:
+                    f = int(np.floor(rank))
+                    ci_ks.append((f - 1, f, rank - f))
+            else:
+                idx = int(np.clip(int(np.round(rank - 1)), 0, n - 1))
+                ci_ks.append((idx, idx, 0.0))
+        needed += [k for lo, hi, _ in ci_ks for k in (lo, hi)]
+
+    n_le_zero = None
+    if probability and with_ci:
+        n_le_zero = pool.count_le(0.0)
+        needed += [0, n - 1]
+        if 0 < n_le_zero < n:
+            needed += [n_le_zero - 1, n_le_zero]
+
+    q_ks = []
+    if quartiles and pool.n_nan == 0:
+        for q in (0.25, 0.75):
+            virtual = q * (n - 1)
+            lo = int(np.floor(virtual))
+            q_ks.append((lo, min(lo + 1, n - 1), virtual - lo))
+        needed += [k for lo, hi, _ in q_ks for k in (lo, hi)]
+
+    values = pool.order_statistics(needed)
+
+    if n % 2:
+        out['slope'] = values[mid]
+    else:
+        out['slope'] = np.mean([values[mid - 1], values[mid]])
+
+    if with_ci:
+        limits = []
+        for lo, hi, frac in ci_ks:
+            lower, upper = values[lo], values[hi]
+            limits.append(lower if frac == 0 else (upper - lower) * frac + lower)
+        out['lower_ci'], out['upper_ci'] = limits
+
+    if n_le_zero is not None:
+        # np.interp(0, sorted_slopes, ranks) with its left/right defaults
+        if n_le_zero == 0:
+            r0 = 1
+        elif n_le_zero == n:
+            r0 = n
+        else:
+            a, b = values[n_le_zero - 1], values[n_le_zero]
+            r0 = n_le_zero if a == 0 else (1.0 / (b - a)) * (0 - a) + n_le_zero
+        r0_median = r0_max = r0_min = r0
+
+        # Handle edge cases where all slopes are on one side of zero
+        if values[n - 1] < 0:
+            r0_median = r0_max = n
+            r0_min = 1
+        elif values[0] > 0:
+            r0_median = r0_min = 1
+            r0_max = n
+
+        scaling = (total_pairs if total_pairs is not None else n) / n
+        sd = np.sqrt(var_s)
+        out['sen_prob'] = norm.cdf(((2 * r0_median - n) * scaling) / sd)
+        out['sen_prob_max'] = norm.cdf(((2 * r0_max - n) * scaling) / sd)
+        out['sen_prob_min'] = norm.cdf(((2 * r0_min - n) * scaling) / sd)
+
+    for key, (lo, hi, gamma) in zip(('q25', 'q75'), q_ks):
+        a, b = values[lo], values[hi]
+        # Same lerp as np.percentile's linear method
+        diff = b - a
+        out[key] = a + diff * gamma if gamma < 0.5 else b - diff * (1 - gamma)
+
+    return out
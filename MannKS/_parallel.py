@@ -0,0 +1,163 @@
+"""
+Process-pool helpers shared by the parallel execution paths.
+
+Work is always described as an ordered list of independent tasks with any
+randomness fixed up front (per-task seeds), so results do not depend on the
+number of workers.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ._diagnostics import _Diagnostics, _replay
+
+
+def _resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Converts an `n_jobs` argument to a worker count.
+
+    None or 1 means serial execution; -1 uses all CPUs, -2 all but one, etc.
+    """
+    if n_jobs is None:
+        return 1
+    if not isinstance(n_jobs, (int,)) or isinstance(n_jobs, bool) or n_jobs == 0:
+        raise ValueError("`n_jobs` must be a non-zero integer (or None).")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+@contextmanager
+def _executor(n_jobs: Optional[int], initializer=None, initargs=()):
+    """
+    Yields a ProcessPoolExecutor for `n_jobs` workers, or None for serial runs.
+
+    Callers run tasks in-process when None is yielded, which keeps the serial
+    path free of pickling and process start-up costs.
+    """
+    n_workers = _resolve_n_jobs(n_jobs)
+    if n_workers == 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=initializer, initargs=initargs) as ex:
+        yield ex
+
+
+def _call_collecting_diagnostics(task):
+    """
+    Runs `func(payload)` for a (func, payload) task, returning (result, records).
+
+    The diagnostics reported by the task are collected in the worker's own
+    context (threads and processes do not share the caller's collector) and
+    returned, so the caller can pass them on with `_replay`.
+    """
+    func, payload = task
+    with _Diagnostics(propagate=False) as diagnostics:
+        result = func(payload)
+    return result, diagnostics.records
+
+
+def _map_ordered(
+    func: Callable,
+    payloads: Sequence,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> List:
+    """
+    Applies `func` to every payload and returns the results in payload order.
+
+    Serial runs call `func` in-process. Otherwise the tasks run on `executor`
+    (or a process pool of `n_jobs` workers) and the diagnostics reported by
+    each task are passed on in the parent in task order, as a serial run
+    would. `func` must be a module-level function so it can be pickled.
+    """
+    payloads = list(payloads)
+    if executor is None and (_resolve_n_jobs(n_jobs) == 1 or len(payloads) < 2):
+        return [func(payload) for payload in payloads]
+
+    tasks = [(func, payload) for payload in payloads]
+    if executor is not None:
+        outputs = list(executor.map(_call_collecting_diagnostics, tasks))
+    else:
+        with _executor(min(_resolve_n_jobs(n_jobs), len(tasks))) as ex:
+            outputs = list(ex.map(_call_collecting_diagnostics, tasks))
+
+    results = []
+    for result, records in outputs:
+        _replay(records)
+        results.append(result)
+    return results
+
+
+def _task_seed(random_state, index: int):
+    """
+    Deterministic seed for task `index` derived from `random_state`.
+
+    Integer seeds are expanded with `np.random.SeedSequence` so tasks get
+    independent streams; None (and non-integer states) are passed through.
+    """
+    if isinstance(random_state, (int, np.integer)) and not isinstance(random_state, bool):
+        seq = np.random.SeedSequence(int(random_state), spawn_key=(int(index),))
+        return int(seq.generate_state(1)[0])
+    return random_state
+
+
+@contextmanager
+def _shared_arrays(arrays: Dict[str, np.ndarray]):
+    """
+    Copies arrays into shared memory blocks for the duration of the context.
+
+    Yields picklable descriptors that workers pass to `_take_shared`, so the
+    data is copied once rather than pickled with every task. Object arrays
+    cannot live in shared memory and are carried inline in the descriptor, as
+    are all arrays on Python < 3.8, which has no `multiprocessing.shared_memory`.
+    """
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:
+        shared_memory = None
+
+    blocks = []
+    descriptors = {}
+    try:
+        for key, arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            if shared_memory is None or arr.dtype.hasobject or arr.nbytes == 0:
+                descriptors[key] = ('inline', arr)
+                continue
+            shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+            blocks.append(shm)
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+            descriptors[key] = ('shm', shm.name, arr.shape, arr.dtype.str)
+        yield descriptors
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _take_shared(descriptors: dict, index) -> Dict[str, np.ndarray]:
+    """
+    Returns copies of `arr[index]` for every array described by `_shared_arrays`.
+    """
+    out = {}
+    for key, desc in descriptors.items():
+        if desc[0] == 'inline':
+            out[key] = desc[1][index]
+            continue
+        # Only written by `_shared_arrays` when the module is available
+        from multiprocessing import shared_memory
+
+        _, name, shape, dtype = desc
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+            out[key] = view[index].copy()
+            del view
+        finally:
+            shm.close()
+    return out
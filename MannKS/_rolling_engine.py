@@ -0,0 +1,223 @@
+"""
+Incremental engines for rolling-window trend analysis.
+
+Consecutive rolling windows share most of their observations, so recomputing
+the Mann-Kendall statistics from scratch for every window repeats almost all
+of the work. The engine here keeps the window contents in a Fenwick
+(binary indexed) tree over value ranks, which acts as an order-statistic
+tree: adding or removing one observation updates S and the tie counts in
+O(log n).
+
+Sen's slopes are reused in the same spirit. The time axis is cut into the
+segments between consecutive window boundaries, and the sorted pairwise slopes
+of every segment pair are cached as blocks. A window's slope set is the union
+of the blocks of the segments it spans. The order statistics needed for the
+median and the confidence limits are selected across the blocks without
+merging them.
+"""
+
+import numpy as np
+from typing import List, Optional, Tuple
+
+from ._stats import EPSILON
+from ._order_stats import _SortedBlocks, _slope_summary
+
+
+class _FenwickTree:
+    """
+    Fenwick tree of counts supporting point updates and prefix sums in O(log n).
+    """
+
+    __slots__ = ('size', 'tree')
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int) -> None:
+        i = index + 1
+        tree = self.tree
+        size = self.size
+        while i <= size:
+            tree[i] += delta
+            i += i & (-i)
+
+    def prefix(self, index: int) -> int:
+        """Sum of counts at positions [0, index)."""
+        total = 0
+        i = index
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & (-i)
+        return total
+
+
+def _rolling_mk_scores(
+    x: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    tau_method: str = 'b'
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Mann-Kendall S, variance and Kendall's Tau for sliding windows of uncensored data.
+
+    Observations must already be in time order; window k covers the index range
+    [starts[k], ends[k]). Ties in x contribute zero to S and are tracked for
+    Tau-b. Time ties are ordered by position (the ordinal ranking used by
+    `_mk_score_and_var_censored`), so the variance is n(n-1)(2n+5)/18.
+
+    Windows are processed in order. When both bounds move forward, each
+    observation enters and leaves the tree once, so the whole pass costs
+    O(N log N) regardless of the number of windows.
+
+    Args:
+        x (np.ndarray): Time-ordered data values (no NaNs).
+        starts (np.ndarray): Start index (inclusive) of each window.
+        ends (np.ndarray): End index (exclusive) of each window.
+        tau_method (str): 'a' or 'b' for Kendall's Tau.
+
+    Returns:
+        tuple: (S, var_s, Tau), each a 1D array with one value per window.
+    """
+    x = np.asarray(x, dtype=float)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    n_windows = len(starts)
+
+    _, ranks = np.unique(x, return_inverse=True)
+    ranks = ranks.ravel().tolist()
+    n_levels = (max(ranks) + 1) if ranks else 0
+
+    tree = _FenwickTree(n_levels)
+    counts = [0] * n_levels
+    state = {'s': 0, 'tt': 0, 'size': 0}
+
+    def add(i):
+        r = ranks[i]
+        less = tree.prefix(r)
+        greater = state['size'] - tree.prefix(r + 1)
+        # The newest observation is later than every point in the window
+        state['s'] += less - greater
+        state['tt'] += counts[r]
+        tree.add(r, 1)
+        counts[r] += 1
+        state['size'] += 1
+
+    def remove(i):
+        r = ranks[i]
+        tree.add(r, -1)
+        counts[r] -= 1
+        state['size'] -= 1
+        less = tree.prefix(r)
+        greater = state['size'] - tree.prefix(r + 1)
+        # The oldest observation is earlier than every point in the window
+        state['s'] -= greater - less
+        state['tt'] -= counts[r]
+
+    s_out = np.zeros(n_windows)
+    tt_out = np.zeros(n_windows)
+    lo = hi = 0
+
+    for k in range(n_windows):
+        start, end = int(starts[k]), int(ends[k])
+
+        if start >= hi or start < lo or end < hi:
+            # Disjoint or non-monotone window: empty the tree and refill
+            for i in range(lo, hi):
+                r = ranks[i]
+                tree.add(r, -1)
+                counts[r] -= 1
+            state.update(s=0, tt=0, size=0)
+            lo = hi = start
+
+        while hi < end:
+            add(hi)
+            hi += 1
+        while lo < start:
+            remove(lo)
+            lo += 1
+
+        s_out[k] = state['s']
+        tt_out[k] = state['tt']
+
+    n = (ends - starts).astype(float)
+    var_s = n * (n - 1) * (2 * n + 5) / 18.0
+    n_pairs = n * (n - 1) / 2.0
+    if tau_method == 'a':
+        denom = n_pairs
+    else:
+        denom = np.sqrt(np.maximum(n_pairs - tt_out, 0)) * np.sqrt(n_pairs)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tau = np.where(np.abs(denom) > EPSILON, s_out / denom, 0.0)
+
+    return s_out, var_s, tau
+
+
+class _RollingSlopeBlocks:
+    """
+    Cache of sorted pairwise slopes between segments of the time axis.
+
+    Segment i covers the time-ordered observations [bounds[i], bounds[i+1]).
+    Block (i, j), i <= j, holds the sorted slopes of pairs with one point in
+    segment i and a later point in segment j (both points in i when i == j).
+    Pairs with (near-)equal times are excluded, as in
+    `_sens_estimator_unequal_spacing`.
+    """
+
+    def __init__(self, x: np.ndarray, t: np.ndarray, bounds: np.ndarray):
+        self.x = np.asarray(x, dtype=float)
+        self.t = np.asarray(t, dtype=float)
+        self.bounds = np.asarray(bounds, dtype=np.int64)
+        self.blocks = {}
+
+    def _block(self, i: int, j: int) -> np.ndarray:
+        key = (i, j)
+        block = self.blocks.get(key)
+        if block is None:
+            b = self.bounds
+            xi, ti = self.x[b[i]:b[i + 1]], self.t[b[i]:b[i + 1]]
+            if i == j:
+                r, c = np.triu_indices(len(xi), k=1)
+                x_diff = xi[c] - xi[r]
+                t_diff = ti[c] - ti[r]
+            else:
+                xj, tj = self.x[b[j]:b[j + 1]], self.t[b[j]:b[j + 1]]
+                x_diff = (xj[None, :] - xi[:, None]).ravel()
+                t_diff = (tj[None, :] - ti[:, None]).ravel()
+            valid = np.abs(t_diff) > 1e-10
+            block = np.sort(x_diff[valid] / t_diff[valid])
+            self.blocks[key] = block
+        return block
+
+    def window_blocks(self, a: int, b: int) -> List[np.ndarray]:
+        """
+        Sorted slope blocks covering segments [a, b); drops blocks starting before a.
+        """
+        for key in [key for key in self.blocks if key[0] < a]:
+            del self.blocks[key]
+        return [self._block(i, j) for i in range(a, b) for j in range(i, b)]
+
+
+def _window_slope_stats(
+    blocks: List[np.ndarray],
+    var_s: float,
+    alpha: float,
+    ci_method: str = 'lwp',
+    total_pairs: Optional[int] = None
+) -> Tuple[float, float, float]:
+    """
+    Sen's slope and confidence limits of a window from its sorted slope blocks.
+
+    Reproduces `np.nanmedian` and `_confidence_intervals` on the concatenated
+    slopes while only selecting the required order statistics.
+
+    Returns:
+        tuple: (slope, lower_ci, upper_ci).
+    """
+    pool = _SortedBlocks()
+    for block in blocks:
+        pool.add(block, is_sorted=True)
+    stats = _slope_summary(pool, var_s, alpha, ci_method=ci_method, total_pairs=total_pairs)
+    return stats['slope'], stats['lower_ci'], stats['upper_ci']
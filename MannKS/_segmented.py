@@ -1,10 +1,7 @@
 
 import numpy as np
 import pandas as pd
-import piecewise_regression
 from scipy.stats import gaussian_kde, t as t_dist
-from scipy.signal import find_peaks
-import warnings
 
 def _bootstrap_breakpoints(t, x, n_breakpoints, n_bootstrap=100, alpha_n=0.05, random_state=None):
     """
@@ -28,6 +25,9 @@ def _bootstrap_breakpoints(t, x, n_breakpoints, n_bootstrap=100, alpha_n=0.05, r
     n = len(x)
     all_breakpoints = []
 
+    # piecewise_regression is slow to import, so it is loaded on first use
+    import piecewise_regression
+
     # Initialize random generator
     rng = np.random.default_rng(random_state)
 
@@ -44,8 +44,7 @@ def _bootstrap_breakpoints(t, x, n_breakpoints, n_bootstrap=100, alpha_n=0.05, r
 
         try:
             # We fix the number of breakpoints to what was requested/estimated
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", RuntimeWarning)
+            with np.errstate(all='ignore'):
                 pw_fit = piecewise_regression.Fit(t_boot, x_boot, n_breakpoints=n_breakpoints, verbose=False)
 
             # Extract estimates
@@ -262,6 +261,9 @@ class HybridSegmentedTrend:
         else:
             n_range = range(self.max_breakpoints + 1)
 
+        # piecewise_regression is slow to import, so it is loaded on first use
+        import piecewise_regression
+
         for k in n_range:
             record = {'n_breakpoints': k, 'bic': np.nan, 'aic': np.nan, 'sar': np.nan, 'converged': False}
             try:
@@ -1,6 +1,8 @@
 import numpy as np
-import warnings
+from collections import namedtuple
 from scipy.stats import norm, rankdata, kendalltau
+from ._parallel import _map_ordered
+from ._diagnostics import _report
 
 # --- Module-level Constants ---
 DEFAULT_LT_MULTIPLIER = 0.5  # Half detection limit for left-censored
@@ -150,7 +152,7 @@ def _mk_score_and_var_censored(x, t, censored, cen_type, tau_method='b', mk_test
 
         # Audit validation for heavy ties
         if n_pairs > 0 and (float(tt) / float(n_pairs)) > 0.5:
-            warnings.warn(
+            _report(
                 "Heavy ties detected (>50% tied pairs). Fast MK score approximation "
                 "may have minor rounding errors. Consider using large_dataset_mode='full' "
                 "for exact results.",
@@ -367,6 +369,385 @@ def _mk_score_and_var_censored(x, t, censored, cen_type, tau_method='b', mk_test
     return kenS, varS, D, Tau
 
 
+# Above this many pairs per row, the batched scorer switches from the O(n^2)
+# sign-sum to O(n log n) inversion counting.
+_BATCH_SIGN_SUM_MAX_PAIRS = 20_000
+
+# Elements per chunk of the padded pairwise arrays of `_mk_score_batch` and
+# `_seasonal_mk_scores`. Each chunk holds a few float64 and boolean arrays of
+# this size at once (about 30-40 bytes per element), so the peak is ~50 MB.
+_PAIRWISE_CHUNK_ELEMENTS = 1_250_000
+
+
+def _dense_ranks_rows(values, censored):
+    """
+    Row-wise dense ranks of the tie-broken values used by the MK score.
+
+    Censored values are ranked immediately below uncensored values of the same
+    magnitude (the ordering produced by `dupx = x - delx * cx` in
+    `_mk_score_and_var_censored`), and equal censored values share a rank.
+
+    Args:
+        values (np.ndarray): 2D array (n_rows x n).
+        censored (np.ndarray): 2D boolean array of the same shape.
+
+    Returns:
+        np.ndarray: 2D int64 array of dense ranks (0-based).
+    """
+    uncensored = (~censored).astype(np.int8)
+    order = np.lexsort((uncensored, values), axis=-1)
+    v_sorted = np.take_along_axis(values, order, axis=-1)
+    u_sorted = np.take_along_axis(uncensored, order, axis=-1)
+
+    new_level = np.zeros(values.shape, dtype=np.int64)
+    new_level[:, 1:] = (v_sorted[:, 1:] != v_sorted[:, :-1]) | (u_sorted[:, 1:] != u_sorted[:, :-1])
+    dense_sorted = np.cumsum(new_level, axis=-1)
+
+    ranks = np.empty_like(dense_sorted)
+    np.put_along_axis(ranks, order, dense_sorted, axis=-1)
+    return ranks
+
+
+def _count_preceding_rows(ranks, insert_mask, query_mask):
+    """
+    Batched dominance counting along the rows of a rank matrix.
+
+    For every element j flagged in `query_mask`, counts the elements i < j
+    flagged in `insert_mask` with a strictly smaller and a strictly larger rank,
+    summed over each row. This is an inversion
+    count evaluated level by level as a bottom-up merge, vectorised across rows
+    (O(log n) passes over the whole matrix).
+
+    Args:
+        ranks (np.ndarray): 2D int array (n_rows x n), columns in time order.
+        insert_mask (np.ndarray): 2D boolean array of elements that are counted.
+        query_mask (np.ndarray): 2D boolean array of elements that count.
+
+    Returns:
+        tuple: (n_smaller, n_larger), 1D int64 arrays of per-row counts.
+    """
+    n_rows, n = ranks.shape
+    if n < 2:
+        return np.zeros(n_rows, dtype=np.int64), np.zeros(n_rows, dtype=np.int64)
+
+    width = 1 << int(np.ceil(np.log2(n)))
+    pad = width - n
+
+    # Pad at the end of the time axis with a sentinel that is neither inserted nor queried
+    vals = np.pad(ranks.astype(np.int64), ((0, 0), (0, pad)), constant_values=np.iinfo(np.int32).max)
+    ins = np.pad(insert_mask, ((0, 0), (0, pad)), constant_values=False)
+    qry = np.pad(query_mask, ((0, 0), (0, pad)), constant_values=False)
+
+    n_smaller = np.zeros(n_rows, dtype=np.int64)
+    n_larger = np.zeros(n_rows, dtype=np.int64)
+    block = 1
+    while block < width:
+        shape = (n_rows, width // (2 * block), 2 * block)
+        v = vals.reshape(shape)
+        i_ = ins.reshape(shape)
+        q_ = qry.reshape(shape)
+        is_right = np.zeros(2 * block, dtype=bool)
+        is_right[block:] = True
+
+        left_ins = i_ & ~is_right
+        n_left_ins = left_ins.sum(axis=-1, keepdims=True)
+
+        # Left elements sort after equal right elements -> prefix counts are strictly smaller
+        order_lt = np.argsort(2 * v + ~is_right, axis=-1, kind='stable')
+        cum_lt = np.cumsum(np.take_along_axis(left_ins, order_lt, axis=-1), axis=-1)
+        q_lt = np.take_along_axis(q_ & is_right, order_lt, axis=-1)
+        n_smaller += np.where(q_lt, cum_lt, 0).sum(axis=(1, 2))
+
+        # Left elements sort before equal right elements -> prefix counts are smaller or equal
+        order_le = np.argsort(2 * v + is_right, axis=-1, kind='stable')
+        cum_le = np.cumsum(np.take_along_axis(left_ins, order_le, axis=-1), axis=-1)
+        q_le = np.take_along_axis(q_ & is_right, order_le, axis=-1)
+        n_larger += np.where(q_le, n_left_ins - cum_le, 0).sum(axis=(1, 2))
+
+        # Merge: the 'le' order sorts each new block by rank
+        vals = np.take_along_axis(v, order_le, axis=-1).reshape(n_rows, width)
+        ins = np.take_along_axis(i_, order_le, axis=-1).reshape(n_rows, width)
+        qry = np.take_along_axis(q_, order_le, axis=-1).reshape(n_rows, width)
+        block *= 2
+
+    return n_smaller, n_larger
+
+
+def _mk_score_batch(x, t, censored=None, cen_type=None, mk_test_method='robust',
+                    chunk_elements=_PAIRWISE_CHUNK_ELEMENTS):
+    """
+    Calculates the Mann-Kendall S statistic for every row of a data matrix.
+
+    Batched equivalent of `_mk_score_and_var_censored(..., calc_var=False)` for
+    many series sharing one time vector (e.g. a surrogate bank). Time ranks are
+    computed once; small series are scored with a vectorised sign-sum over all
+    pairs, large series with batched inversion counting (O(n log n) per row).
+
+    Args:
+        x (np.ndarray): 2D array (n_rows x n) of data values.
+        t (np.ndarray): 1D array (n) of time values shared by all rows.
+        censored (np.ndarray, optional): Boolean array (1D, shared, or 2D per row).
+        cen_type (np.ndarray, optional): Censoring types (1D, shared, or 2D per row).
+        mk_test_method (str): 'robust' or 'lwp'.
+        chunk_elements (int): Memory budget (array elements) for the sign-sum
+            path; the peak memory is about 40 bytes per element.
+
+    Returns:
+        np.ndarray: 1D float array of S statistics (one per row).
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    n_rows, n = x.shape
+    if n < 2:
+        return np.zeros(n_rows)
+
+    if censored is None:
+        cx = np.zeros((n_rows, n), dtype=bool)
+    else:
+        cx = np.broadcast_to(np.asarray(censored, dtype=bool), (n_rows, n)).copy()
+
+    xx = x.copy()
+    if mk_test_method == 'lwp' and cen_type is not None:
+        gt_mask = np.broadcast_to(np.asarray(cen_type) == 'gt', (n_rows, n))
+        if np.any(gt_mask):
+            max_gt = np.max(np.where(gt_mask, xx, -np.inf), axis=1, keepdims=True) + 0.1
+            xx = np.where(gt_mask, max_gt, xx)
+            cx = cx & ~gt_mask
+
+    if n > 500 and not np.any(cx) and mk_test_method != 'lwp':
+        # The per-row O(n log n) kendalltau fast path is already optimal here
+        no_cen = np.zeros(n, dtype=bool)
+        no_type = np.full(n, 'not')
+        return np.array([
+            _mk_score_and_var_censored(row, t, no_cen, no_type, mk_test_method=mk_test_method, calc_var=False)[0]
+            for row in xx
+        ], dtype=float)
+
+    # Shared time order ('ordinal' ranking breaks ties by position)
+    time_order = np.argsort(np.asarray(t), kind='stable')
+    xx = xx[:, time_order]
+    cx = cx[:, time_order]
+
+    ranks = _dense_ranks_rows(xx, cx)
+    any_censored = np.any(cx)
+
+    n_pairs = n * (n - 1) // 2
+    if n_pairs <= _BATCH_SIGN_SUM_MAX_PAIRS:
+        i_idx, j_idx = np.triu_indices(n, k=1)
+        rows_per_chunk = max(1, chunk_elements // max(1, n_pairs))
+        s = np.zeros(n_rows)
+        for start in range(0, n_rows, rows_per_chunk):
+            r = ranks[start:start + rows_per_chunk]
+            sign = np.sign(r[:, j_idx] - r[:, i_idx])
+            if any_censored:
+                c = cx[start:start + rows_per_chunk]
+                ci, cj = c[:, i_idx], c[:, j_idx]
+                # Exclude pairs of two censored values, and pairs where the
+                # censored value ranks above the uncensored one (ambiguous).
+                ambiguous = (ci & ~cj & (sign < 0)) | (~ci & cj & (sign > 0))
+                sign = np.where((ci & cj) | ambiguous, 0, sign)
+            s[start:start + rows_per_chunk] = sign.sum(axis=1)
+        return s
+
+    # S = S(all pairs) - S(censored pairs) - ambiguous pairs counted as +1 / -1
+    all_mask = np.ones((n_rows, n), dtype=bool)
+    smaller, larger = _count_preceding_rows(ranks, all_mask, all_mask)
+    s = smaller - larger
+    if any_censored:
+        unc = ~cx
+        cc_smaller, cc_larger = _count_preceding_rows(ranks, cx, cx)
+        # Later censored value above an earlier uncensored one (counted +1)
+        amb_plus, _ = _count_preceding_rows(ranks, unc, cx)
+        # Earlier censored value above a later uncensored one (counted -1)
+        _, amb_minus = _count_preceding_rows(ranks, cx, unc)
+        s = s - (cc_smaller - cc_larger) - amb_plus + amb_minus
+    return s.astype(float)
+
+
+def _mk_score_and_var_batch(x, t, censored=None, cen_type=None, mk_test_method='robust', tie_break_method='robust'):
+    """
+    Calculates the Mann-Kendall S statistic and its variance for every row of a data matrix.
+
+    For uncensored rows the variance of `_mk_score_and_var_censored` reduces to
+    n(n-1)(2n+5)/18 (ties in x are broken by `delx` and time ranks are ordinal),
+    so it is shared by all rows. Rows with censoring fall back to the per-row
+    NADA variance.
+
+    Args:
+        x (np.ndarray): 2D array (n_rows x n) of data values.
+        t (np.ndarray): 1D array (n) of time values shared by all rows.
+        censored (np.ndarray, optional): Boolean array (1D, shared, or 2D per row).
+        cen_type (np.ndarray, optional): Censoring types (1D, shared, or 2D per row).
+        mk_test_method (str): 'robust' or 'lwp'.
+        tie_break_method (str): 'robust' or 'lwp' (censored rows only).
+
+    Returns:
+        tuple: (S, varS), 1D float arrays (one value per row).
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    n_rows, n = x.shape
+
+    s = _mk_score_batch(x, t, censored=censored, cen_type=cen_type, mk_test_method=mk_test_method)
+    var_s = np.full(n_rows, n * (n - 1) * (2 * n + 5) / 18.0)
+
+    if censored is not None and np.any(censored):
+        cen = np.broadcast_to(np.asarray(censored, dtype=bool), (n_rows, n))
+        types = np.broadcast_to(
+            np.asarray(cen_type) if cen_type is not None else np.full(n, 'not'), (n_rows, n)
+        )
+        for i in np.flatnonzero(np.any(cen, axis=1)):
+            var_s[i] = _mk_score_and_var_censored(
+                x[i], t, cen[i], types[i],
+                mk_test_method=mk_test_method, tie_break_method=tie_break_method
+            )[1]
+
+    return s, var_s
+
+
+_SeasonalScores = namedtuple('_SeasonalScores', ['season', 'n', 's', 'var_s', 'd', 'tau', 'order', 'starts'])
+
+
+def _season_mk_task(payload):
+    """
+    Worker entry point for `_seasonal_mk_scores`: scores one season's slice.
+    """
+    x, t, censored, cen_type, kwargs = payload
+    return _mk_score_and_var_censored(x, t, censored, cen_type, **kwargs)
+
+
+def _seasonal_mk_scores(x, t, censored, cen_type, seasons, tau_method='b', mk_test_method='robust',
+                        tie_break_method='robust', calc_var=True, chunk_elements=_PAIRWISE_CHUNK_ELEMENTS,
+                        n_jobs=None, executor=None):
+    """
+    Calculates the Mann-Kendall S, variance, D and Tau of every season in one pass.
+
+    The data are lexsorted once by (season, t). Uncensored seasons are scored
+    together: they are padded into a (season x position) matrix, and S and the
+    x-tie counts are segmented sums over the within-season pairs. Their
+    variance is n(n-1)(2n+5)/18, as in `_mk_score_and_var_censored`. Seasons
+    with censoring, and large seasons that `_mk_score_and_var_censored` scores
+    in O(n log n), are scored by that function on their contiguous slice.
+    Results are identical to calling `_mk_score_and_var_censored` per season.
+
+    Args:
+        x (np.ndarray): Data values.
+        t (np.ndarray): Time values.
+        censored (np.ndarray): Boolean array indicating censoring.
+        cen_type (np.ndarray): Array of censoring types ('lt', 'gt', 'not').
+        seasons (np.ndarray): Season label of each observation.
+        tau_method (str): 'a' or 'b' for Kendall's Tau.
+        mk_test_method (str): 'robust' or 'lwp'.
+        tie_break_method (str): 'robust' or 'lwp' for handling ties in timestamps.
+        calc_var (bool): Whether to calculate the variance, D and Tau.
+        chunk_elements (int): Maximum size of the padded pairwise arrays; the
+            peak memory is about 30 bytes per element.
+        n_jobs (int, optional): Number of worker processes for the individually
+            scored seasons. None or 1 runs serially.
+        executor (concurrent.futures.Executor, optional): Executor to run the
+            individually scored seasons on. Takes precedence over `n_jobs`.
+
+    Returns:
+        _SeasonalScores: Per-season arrays (`season`, `n`, `s`, `var_s`, `d`,
+        `tau`) in sorted season order, plus the sort `order` of the
+        observations and the `starts` of each season in that order.
+    """
+    x = np.asarray(x, dtype=float)
+    t = np.asarray(t, dtype=float)
+    censored = np.asarray(censored, dtype=bool)
+    cen_type = np.asarray(cen_type)
+    seasons = np.asarray(seasons)
+    n_obs = len(x)
+
+    order = np.lexsort((t, seasons))
+    season_sorted = seasons[order]
+    if n_obs:
+        starts = np.flatnonzero(np.r_[True, season_sorted[1:] != season_sorted[:-1]])
+    else:
+        starts = np.zeros(0, dtype=np.int64)
+    counts = np.diff(np.r_[starts, n_obs]).astype(np.int64)
+    n_seasons = len(starts)
+
+    xs, ts, cs, types = x[order], t[order], censored[order], cen_type[order]
+
+    s_out = np.zeros(n_seasons)
+    var_out = np.zeros(n_seasons) if calc_var else np.full(n_seasons, np.nan)
+    d_out = np.zeros(n_seasons) if calc_var else np.full(n_seasons, np.nan)
+    tau_out = np.zeros(n_seasons) if calc_var else np.full(n_seasons, np.nan)
+
+    # Seasons the pairwise kernel does not reproduce are scored individually
+    special = np.zeros(n_seasons, dtype=bool)
+    if n_seasons:
+        special |= np.add.reduceat(cs.astype(np.int64), starts) > 0
+        if mk_test_method == 'lwp':
+            special |= np.add.reduceat((types == 'gt').astype(np.int64), starts) > 0
+    # Large uncensored seasons use the O(n log n) path. Without censoring the
+    # 'lwp' and 'robust' methods give the same S, variance and Tau.
+    large = ~special & (counts > 500)
+    special &= counts > 1
+
+    individual = np.flatnonzero(special | large)
+    payloads = []
+    for k in individual:
+        sl = slice(starts[k], starts[k] + counts[k])
+        payloads.append((xs[sl], ts[sl], cs[sl], types[sl], dict(
+            tau_method=tau_method, mk_test_method='robust' if large[k] else mk_test_method,
+            tie_break_method=tie_break_method, calc_var=calc_var
+        )))
+    season_results = _map_ordered(_season_mk_task, payloads, n_jobs=n_jobs, executor=executor)
+    for k, season_result in zip(individual, season_results):
+        s_out[k], var_out[k], d_out[k], tau_out[k] = season_result
+    special |= large
+
+    # Uncensored seasons: padded pairwise sign sums, grouped by similar size
+    rows = np.flatnonzero(~special & (counts > 1))
+    rows = rows[np.argsort(counts[rows], kind='stable')]
+    tt_out = np.zeros(n_seasons)
+    pos = 0
+    while pos < len(rows):
+        # Rows are sorted by size, so the chunk's largest row is its last one
+        end = pos + 1
+        while end < len(rows) and (end - pos + 1) * int(counts[rows[end]]) ** 2 <= chunk_elements:
+            end += 1
+        chunk = rows[pos:end]
+        m = int(counts[chunk[-1]])
+        cols = np.arange(m)
+        valid = cols[np.newaxis, :] < counts[chunk][:, np.newaxis]
+        idx = np.where(valid, starts[chunk][:, np.newaxis] + cols[np.newaxis, :], 0)
+        xm = xs[idx]
+
+        # diff[r, i, j] = x_j - x_i; observations are in time order within a season
+        diff = xm[:, np.newaxis, :] - xm[:, :, np.newaxis]
+        pairs = valid[:, np.newaxis, :] & valid[:, :, np.newaxis] & (cols[np.newaxis, :] > cols[:, np.newaxis])
+        s_out[chunk] = np.sum(np.sign(diff) * pairs, axis=(1, 2))
+        tt_out[chunk] = np.sum((diff == 0) & pairs, axis=(1, 2))
+        pos = end
+
+    if calc_var and len(rows):
+        n = counts[rows].astype(float)
+        var_out[rows] = n * (n - 1) * (2 * n + 5) / 18.0
+        J = n * (n - 1) / 2.0
+        if tau_method == 'a':
+            d_rows = J
+        else:
+            # Time ranks are ordinal, so there are no ties in time
+            d_rows = np.sqrt(J - tt_out[rows]) * np.sqrt(J - 0.0)
+        d_out[rows] = d_rows
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tau_out[rows] = np.where(np.abs(d_rows) > EPSILON, s_out[rows] / d_rows, 0)
+
+    return _SeasonalScores(season_sorted[starts], counts, s_out, var_out, d_out, tau_out, order, starts)
+
+
+def _z_score_batch(s, var_s):
+    """
+    Vectorised `_z_score` (continuity-corrected Z) for arrays of S and variance.
+    """
+    s = np.asarray(s, dtype=float)
+    var_s = np.asarray(var_s, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = (s - np.sign(s)) / np.sqrt(var_s)
+    return np.where(var_s < EPSILON, 0.0, z)
+
+
 def _z_score(s, var_s):
     """
     Calculates the Z-score for the Mann-Kendall test.
@@ -382,7 +763,7 @@ def _z_score(s, var_s):
         return np.nan
 
     if var_s < EPSILON:
-        warnings.warn("Variance near zero, Z-score may be unreliable", UserWarning)
+        _report("Variance near zero, Z-score may be unreliable", UserWarning)
         return 0
 
     if s > 0:
@@ -468,7 +849,7 @@ def _sens_estimator_unequal_spacing(x, t):
         # Relaxed check as we handle fast estimation elsewhere, but exact Sen's slope
         # using this function is still O(n^2) and will likely crash if called directly.
         # trend_test calls fast_sens_slope for large N, avoiding this.
-        warnings.warn(
+        _report(
             f"Sample size n={n} exceeds maximum safe size of {MAX_SAFE_N}. "
             f"This would cause an integer overflow during pairwise calculations. "
             f"Consider using the regional_test() function for aggregation or subsampling your data.",
@@ -478,7 +859,7 @@ def _sens_estimator_unequal_spacing(x, t):
 
     if n > 5000:
         mem_gb = (n**2 * 8 / 1e9)
-        warnings.warn(
+        _report(
             f"Large sample size (n={n}) requires ~{mem_gb:.1f} GB memory "
             f"for pairwise calculations. Maximum safe n is {MAX_SAFE_N}. "
             f"Using `regional_test()` for aggregating multiple smaller sites is recommended.",
@@ -580,7 +961,7 @@ def _sens_estimator_censored(x, t, cen_type, lt_mult=DEFAULT_LT_MULTIPLIER, gt_m
     # Add a hard limit to prevent integer overflow on large n*n arrays
     MAX_SAFE_N = 46340
     if n > MAX_SAFE_N:
-        warnings.warn(
+        _report(
             f"Sample size n={n} exceeds maximum safe size of {MAX_SAFE_N}. "
             f"This would cause an integer overflow during pairwise calculations. "
             f"Consider using the regional_test() function for aggregation or subsampling your data.",
@@ -590,7 +971,7 @@ def _sens_estimator_censored(x, t, cen_type, lt_mult=DEFAULT_LT_MULTIPLIER, gt_m
 
     if n > 5000:
         mem_gb = (n**2 * 8 / 1e9)
-        warnings.warn(
+        _report(
             f"Large sample size (n={n}) requires ~{mem_gb:.1f} GB memory "
             f"for pairwise calculations. Maximum safe n is {MAX_SAFE_N}. "
             f"Using `regional_test()` for aggregating multiple smaller sites is recommended.",
@@ -701,26 +1082,20 @@ def _sens_estimator_censored_adaptive(x, t, cen_type,
         )
 
 
-def _confidence_intervals(slopes, var_s, alpha, method='direct', total_pairs=None):
+def _confidence_interval_ranks(n_sample, var_s, alpha, total_pairs=None):
     """
-    Computes the confidence intervals for Sen's slope.
+    Ranks (1-based, possibly fractional) of the Sen's slope confidence limits.
 
     Args:
-        slopes: Array of slopes (sample or full population)
+        n_sample: Number of valid slopes.
         var_s: Variance of S statistic (corresponds to total_pairs)
         alpha: Significance level
-        method: 'direct' or 'lwp'
-        total_pairs: Total number of possible pairs. If None, assumes slopes
-                     contains all pairs. Used for scaling when slopes is a sample.
-    """
-    # Filter out NaN values, which can occur with the 'nan' method for
-    # censored slopes.
-    valid_slopes = slopes[~np.isnan(slopes)]
-    n_sample = len(valid_slopes)
-
-    if n_sample == 0 or var_s < EPSILON:
-        return np.nan, np.nan
+        total_pairs: Total number of possible pairs. If None, assumes the
+                     slopes contain all pairs.
 
+    Returns:
+        tuple: (rank1, rank2) in the sorted sample of slopes.
+    """
     if total_pairs is None:
         total_pairs = n_sample
 
@@ -737,8 +1112,30 @@ def _confidence_intervals(slopes, var_s, alpha, method='direct', total_pairs=Non
     q2 = M2 / total_pairs
 
     # Map to ranks in the sample
-    rank1 = q1 * n_sample
-    rank2 = q2 * n_sample
+    return q1 * n_sample, q2 * n_sample
+
+
+def _confidence_intervals(slopes, var_s, alpha, method='direct', total_pairs=None):
+    """
+    Computes the confidence intervals for Sen's slope.
+
+    Args:
+        slopes: Array of slopes (sample or full population)
+        var_s: Variance of S statistic (corresponds to total_pairs)
+        alpha: Significance level
+        method: 'direct' or 'lwp'
+        total_pairs: Total number of possible pairs. If None, assumes slopes
+                     contains all pairs. Used for scaling when slopes is a sample.
+    """
+    # Filter out NaN values, which can occur with the 'nan' method for
+    # censored slopes.
+    valid_slopes = slopes[~np.isnan(slopes)]
+    n_sample = len(valid_slopes)
+
+    if n_sample == 0 or var_s < EPSILON:
+        return np.nan, np.nan
+
+    rank1, rank2 = _confidence_interval_ranks(n_sample, var_s, alpha, total_pairs)
 
     sorted_slopes = np.sort(valid_slopes)
 
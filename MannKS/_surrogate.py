@@ -10,20 +10,19 @@ Supported Methods:
 2. Lomb-Scargle Spectral Synthesis: For unevenly spaced data (uses Astropy).
 """
 
+import importlib.util
 import numpy as np
-import warnings
 from typing import Optional, Union, Tuple, NamedTuple, List
-from scipy.stats import rankdata
 
-try:
-    from astropy.timeseries import LombScargle
-    HAS_ASTROPY = True
-except ImportError:
-    HAS_ASTROPY = False
+# Astropy is slow to import, so it is only located here and imported by the
+# Lomb-Scargle method on first use.
+HAS_ASTROPY = importlib.util.find_spec('astropy') is not None
 
-from ._stats import _mk_score_and_var_censored, _z_score, _p_value
+from ._stats import _mk_score_and_var_censored, _mk_score_batch, _z_score, _p_value
 from ._datetime import _to_numeric_time
 from ._check_data import check_data_integrity
+from . import _cache
+from ._diagnostics import _report
 
 
 class SurrogateResult(NamedTuple):
@@ -63,6 +62,20 @@ def _iaaft_surrogates(
     Returns:
         np.ndarray: Array of surrogate time series (shape: n_surrogates x n).
     """
+    cache_key = None
+    if _cache._active_cache_dir() is not None and _cache._is_cacheable_seed(random_state):
+        cache_key = _cache._cache_key(
+            'iaaft', np.asarray(x, dtype=float), n_surrogates, max_iter, tol, int(random_state)
+        )
+        # The stalled surrogates are cached with the bank so that a cache hit
+        # reports the same diagnostics as the run that generated it
+        stall_key = _cache._cache_key(cache_key, 'stalls')
+        cached = _cache._cache_load(cache_key)
+        cached_stalls = _cache._cache_load(stall_key) if cached is not None else None
+        if cached_stalls is not None:
+            _report_iaaft_stalls(cached_stalls)
+            return cached
+
     rng = np.random.default_rng(random_state)
     n = len(x)
 
@@ -75,6 +88,7 @@ def _iaaft_surrogates(
         var_x = 1.0 # Prevent division by zero for constant data
 
     surrogates = np.empty((n_surrogates, n))
+    stalls = []
 
     for k in range(n_surrogates):
         # Initialize with random shuffle of data
@@ -108,14 +122,8 @@ def _iaaft_surrogates(
             if change >= prev_change:
                  # Check relative change to avoid scale-dependent warnings
                  if rel_change > max(tol, 1e-3):
-                     # Throttle warning or provide more context
                      # We issue this warning only if it's "significant" stalling
-                     warnings.warn(
-                         f"IAAFT convergence stalled at iter {i} (rel_change={rel_change:.2e}). "
-                         "This often indicates data with unusual spectral properties or too few observations. "
-                         "The result may be suboptimal but is usually acceptable.",
-                         UserWarning
-                     )
+                     stalls.append((i, rel_change))
                  # Keep previous r (better), discard r_new
                  break
 
@@ -124,9 +132,85 @@ def _iaaft_surrogates(
 
         surrogates[k, :] = r
 
+    stalls = np.asarray(stalls, dtype=float).reshape(-1, 2)
+    _report_iaaft_stalls(stalls)
+    if cache_key is not None:
+        _cache._cache_store(cache_key, surrogates)
+        _cache._cache_store(stall_key, stalls)
     return surrogates
 
 
+def _report_iaaft_stalls(stalls: np.ndarray) -> None:
+    """Reports each (iteration, relative change) row of stalled IAAFT surrogates."""
+    for i, rel_change in stalls:
+        _report(
+            f"IAAFT convergence stalled at iter {int(i)} (rel_change={rel_change:.2e}). "
+            "This often indicates data with unusual spectral properties or too few observations. "
+            "The result may be suboptimal but is usually acceptable.",
+            UserWarning
+        )
+
+
+def _reduce_frequency_grid(
+    freq: np.ndarray,
+    power: np.ndarray,
+    max_frequencies: int
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Caps the size of a periodogram frequency grid by log-binning the spectrum.
+
+    The grid is split into `max_frequencies` logarithmically spaced bands. Each
+    non-empty band is represented by a single frequency (the power-weighted
+    centroid of the band) carrying the *summed* power of the band, so the
+    variance contributed by each band to the synthesised series is preserved.
+
+    Args:
+        freq (np.ndarray): Frequency grid (strictly positive).
+        power (np.ndarray): Periodogram power at each frequency.
+        max_frequencies (int): Maximum number of frequencies in the reduced grid.
+
+    Returns:
+        tuple: (freq_reduced, power_reduced, spectral_error)
+            - freq_reduced (np.ndarray): Representative frequency of each band.
+            - power_reduced (np.ndarray): Total power of each band.
+            - spectral_error (float): Relative L1 error between the original
+              spectrum and the reduced spectrum spread evenly across the
+              original frequencies of each band (0 = no spectral detail lost).
+    """
+    freq = np.asarray(freq, dtype=float)
+    power = np.maximum(np.asarray(power, dtype=float), 0)
+
+    if max_frequencies < 1:
+        raise ValueError("`max_frequencies` must be at least 1.")
+
+    if len(freq) <= max_frequencies:
+        return freq, power, 0.0
+
+    f_min = np.min(freq)
+    f_max = np.max(freq)
+    edges = np.geomspace(f_min, f_max, num=max_frequencies + 1)
+    band = np.clip(np.searchsorted(edges, freq, side='right') - 1, 0, max_frequencies - 1)
+
+    counts = np.bincount(band, minlength=max_frequencies)
+    band_power = np.bincount(band, weights=power, minlength=max_frequencies)
+    band_fp = np.bincount(band, weights=freq * power, minlength=max_frequencies)
+    band_f = np.bincount(band, weights=freq, minlength=max_frequencies)
+
+    occupied = counts > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        centroid = np.where(band_power > 0, band_fp / band_power, band_f / np.maximum(counts, 1))
+
+    # Spread each band's power evenly over its members and compare to the original
+    total_power = np.sum(power)
+    if total_power > 0:
+        spread = (band_power / np.maximum(counts, 1))[band]
+        spectral_error = float(np.sum(np.abs(power - spread)) / total_power)
+    else:
+        spectral_error = 0.0
+
+    return centroid[occupied], band_power[occupied], spectral_error
+
+
 def _lomb_scargle_surrogates(
     x: np.ndarray,
     t: np.ndarray,
@@ -140,14 +224,22 @@ def _lomb_scargle_surrogates(
     periodogram_method: Optional[str] = None,
     max_iter: int = 1,
     tol: float = 0.01,
+    max_frequencies: Optional[int] = None,
+    return_info: bool = False,
     **kwargs
-) -> np.ndarray:
+) -> Union[np.ndarray, Tuple[np.ndarray, dict]]:
     """
     Generates surrogates using Spectral Synthesis from Lomb-Scargle Periodogram.
 
     Suitable for UNEVENLY spaced data. Uses Astropy.
     Can be iterative (max_iter > 1) to correct for spectral whitening caused by rank adjustment.
 
+    Synthesis cost grows linearly with the size of the frequency grid, which
+    for irregular multi-decade records can be very large. Setting
+    `max_frequencies` caps the grid via `_reduce_frequency_grid`, making the
+    cost predictable at the price of some spectral detail (reported as
+    `spectral_error` when `return_info=True`).
+
     Args:
         x (np.ndarray): Input data values.
         t (np.ndarray): Input time values.
@@ -162,13 +254,19 @@ def _lomb_scargle_surrogates(
                                           If None, defaults to 'fast' for 'auto' freq_method.
         max_iter (int): Maximum iterations for spectral correction. Default 1 (non-iterative).
         tol (float): Convergence tolerance (unused in current implementation, reserved for future).
+        max_frequencies (Optional[int]): Maximum number of frequencies used for synthesis.
+            Larger grids are log-binned down to this size. Default None (no cap).
+        return_info (bool): If True, also return a dict describing the frequency grid
+            ('n_frequencies', 'n_frequencies_original', 'spectral_error').
         **kwargs: Additional arguments (ignored, but allowed for flexibility).
 
     Returns:
-        np.ndarray: Array of surrogate time series.
+        np.ndarray: Array of surrogate time series, or a tuple
+        (surrogates, info) if `return_info` is True.
     """
     if not HAS_ASTROPY:
         raise ImportError("`astropy` is required for Lomb-Scargle surrogates. Install it via `pip install astropy`.")
+    from astropy.timeseries import LombScargle
 
     rng = np.random.default_rng(random_state)
     n = len(x)
@@ -187,11 +285,14 @@ def _lomb_scargle_surrogates(
     # If data is constant, Lomb-Scargle fails or produces NaNs (division by zero power).
     # Surrogates of constant data should be constant.
     if np.std(x) < 1e-9:
-        return np.tile(x, (n_surrogates, 1))
+        surrogates = np.tile(x, (n_surrogates, 1))
+        if return_info:
+            return surrogates, {'n_frequencies': 0, 'n_frequencies_original': 0, 'spectral_error': 0.0}
+        return surrogates
 
     # Warn about performance for large computations
     if n * n_surrogates * max_iter > 2000000:
-         warnings.warn(
+         _report(
             f"Lomb-Scargle surrogate generation is computationally expensive for N={n} "
             f"n_surrogates={n_surrogates} and max_iter={max_iter}. Expect significant runtime. "
             "Consider reducing n_surrogates, max_iter, or aggregating data.",
@@ -201,8 +302,21 @@ def _lomb_scargle_surrogates(
     # 1. Compute Lomb-Scargle Periodogram of Original Data (Target)
     ls = LombScargle(t, x_centered, dy=dy, fit_mean=fit_mean, center_data=False) # centering handled above or by fit_mean
 
+    use_cache = _cache._active_cache_dir() is not None
+    periodogram_key = None
+    cached_periodogram = None
+    if use_cache:
+        periodogram_key = _cache._cache_key(
+            'ls_periodogram', np.asarray(t, dtype=float), np.asarray(x_centered, dtype=float),
+            None if dy is None else np.asarray(dy, dtype=float),
+            fit_mean, normalization, freq_method, periodogram_method
+        )
+        cached_periodogram = _cache._cache_load(periodogram_key)
+
     # Auto-frequency selection
-    if freq_method == 'auto':
+    if cached_periodogram is not None:
+        freq, power = cached_periodogram[0], cached_periodogram[1]
+    elif freq_method == 'auto':
         method_to_use = periodogram_method if periodogram_method else 'fast'
         freq, power = ls.autopower(normalization=normalization, method=method_to_use)
     elif freq_method == 'log':
@@ -220,10 +334,45 @@ def _lomb_scargle_surrogates(
         method_to_use = periodogram_method if periodogram_method else 'fast'
         freq, power = ls.autopower(normalization=normalization, method=method_to_use)
 
+    if use_cache and cached_periodogram is None:
+        _cache._cache_store(periodogram_key, np.vstack([freq, power]))
+
+    # Bound the synthesis grid if requested
+    n_freq_original = len(freq)
+    spectral_error = 0.0
+    freq_full = freq
+    if max_frequencies is not None and len(freq) > max_frequencies:
+        freq, power, spectral_error = _reduce_frequency_grid(freq, power, max_frequencies)
+
+    info = {
+        'n_frequencies': len(freq),
+        'n_frequencies_original': n_freq_original,
+        'spectral_error': spectral_error
+    }
+
+    bank_key = None
+    if use_cache and _cache._is_cacheable_seed(random_state):
+        bank_key = _cache._cache_key(
+            'lomb_scargle', periodogram_key, np.asarray(x, dtype=float), n_surrogates,
+            center_data, int(random_state), max_iter, max_frequencies
+        )
+        cached_bank = _cache._cache_load(bank_key)
+        if cached_bank is not None:
+            return (cached_bank, info) if return_info else cached_bank
+
     # Target amplitudes (sqrt of power)
     # This is a heuristic for synthesis.
     amplitudes_target = np.sqrt(np.maximum(power, 0))
 
+    # The spectral correction step compares the periodogram of each surrogate at
+    # the synthesis frequencies against the target. A reduced grid carries band
+    # totals, so the comparison target is the original periodogram evaluated at
+    # the band centroids instead.
+    amplitudes_correction = amplitudes_target
+    if max_iter > 1 and freq is not freq_full:
+        power_rep = ls.power(freq, normalization=normalization, method='cython')
+        amplitudes_correction = np.sqrt(np.maximum(power_rep, 0))
+
     surrogates = np.empty((n_surrogates, n))
 
     # Use zero-started time for synthesis to preserve numerical precision in cosine arguments
@@ -285,9 +434,14 @@ def _lomb_scargle_surrogates(
 
             # Correction factor: A_in_new = A_in_old * (A_target / A_out)^0.8
             # (Power 0.8 is a damping factor found to be stable)
-            ratio = (amplitudes_target + 1e-9) / (amplitudes_out + 1e-9)
+            ratio = (amplitudes_correction + 1e-9) / (amplitudes_out + 1e-9)
             A_k = A_k * np.power(ratio, 0.8)
 
+    if bank_key is not None:
+        _cache._cache_store(bank_key, surrogates)
+
+    if return_info:
+        return surrogates, info
     return surrogates
 
 
@@ -311,6 +465,7 @@ def surrogate_test(
     max_iter: int = 1,
     lt_mult: float = 0.5,
     gt_mult: float = 1.1,
+    max_frequencies: Optional[int] = None,
     **kwargs
 ) -> SurrogateResult:
     """
@@ -342,6 +497,10 @@ def surrogate_test(
         max_iter (int): (Lomb-Scargle only) Max iterations for spectral correction. Default 1.
         lt_mult (float): Multiplier for left-censored data (default 0.5).
         gt_mult (float): Multiplier for right-censored data (default 1.1).
+        max_frequencies (Optional[int]): (Lomb-Scargle only) Cap on the synthesis frequency
+            grid. Larger periodogram grids are log-binned down to this size, preserving
+            the total power in each band. The resulting spectral error is reported in
+            the result notes. Default None (no cap).
         **kwargs: Additional arguments passed to the underlying surrogate generator.
 
     Returns:
@@ -399,7 +558,7 @@ def surrogate_test(
         if np.any(gt_mask):
             x_eff[gt_mask] *= gt_mult
 
-        warnings.warn(
+        _report(
             f"Censored data detected in surrogate test. Surrogate series are generated "
             f"using imputed values (lt_mult={lt_mult}, gt_mult={gt_mult}). "
             "Censoring flags are propagated to the surrogates to ensure a consistent S-statistic distribution.",
@@ -424,7 +583,7 @@ def surrogate_test(
             if HAS_ASTROPY:
                 method_used = 'lomb_scargle'
             else:
-                warnings.warn(
+                _report(
                     "Uneven sampling detected but `astropy` not installed. "
                     "Falling back to 'iaaft' (may be inaccurate). "
                     "Install astropy for robust uneven handling.",
@@ -440,7 +599,7 @@ def surrogate_test(
         if not HAS_ASTROPY:
              raise ImportError("Method 'lomb_scargle' requires `astropy`.")
 
-        surrogates = _lomb_scargle_surrogates(
+        surrogates, grid_info = _lomb_scargle_surrogates(
             x_eff, t_arr, dy=dy,
             n_surrogates=n_surrogates,
             freq_method=freq_method,
@@ -449,11 +608,18 @@ def surrogate_test(
             center_data=center_data,
             random_state=random_state,
             max_iter=max_iter,
+            max_frequencies=max_frequencies,
+            return_info=True,
             **kwargs  # Pass any extra arguments to the implementation
         )
+        if grid_info['n_frequencies'] < grid_info['n_frequencies_original']:
+            notes.append(
+                f"Frequency grid reduced from {grid_info['n_frequencies_original']} to "
+                f"{grid_info['n_frequencies']} bands (spectral error {grid_info['spectral_error']:.1%})"
+            )
     elif method_used == 'iaaft':
         if not is_uniform and method != 'auto':
-            warnings.warn("Using IAAFT on unevenly spaced data. Results may be biased.", UserWarning)
+            _report("Using IAAFT on unevenly spaced data. Results may be biased.", UserWarning)
 
         # Propagate max_iter (explicit arg) and tol (from kwargs) to IAAFT.
         # Note: surrogate_test defaults max_iter=1 (suitable for Lomb-Scargle standard mode),
@@ -503,7 +669,7 @@ def surrogate_test(
         # If the rank structure of the imputed data differs from the raw data
         # (e.g. because lt_mult resolves ambiguities that were ties), warn the user.
         if not np.isclose(s_orig, s_imputed, atol=1e-5):
-             warnings.warn(
+             _report(
                  f"Imputation with lt_mult={lt_mult} changes the Mann-Kendall S statistic "
                  f"(Raw: {s_orig}, Imputed: {s_imputed}). "
                  "The p-value is calculated using the Raw S statistic against surrogates derived from "
@@ -512,47 +678,31 @@ def surrogate_test(
                  UserWarning
              )
 
-    # 2. Surrogate Scores
-    surrogate_scores = np.zeros(n_surrogates)
-
-    # Prepare for censoring propagation
+    # 2. Surrogate Scores (whole bank scored in one batched call)
     if np.any(censored):
-        # Sort original data/censoring by imputed values to create a map
+        # Map censoring status to the surrogate values by rank: the k-th smallest
+        # surrogate value inherits the censoring of the k-th smallest imputed value.
         sort_idx = np.argsort(x_eff, kind='stable')
         sorted_censored = censored[sort_idx]
         sorted_cen_type = cen_type[sort_idx]
-    else:
-        # Defaults for uncensored case
-        surr_censored = np.zeros(n, dtype=bool)
-        surr_cen_type = np.full(n, 'not', dtype=object)
-
-    for i in range(n_surrogates):
-        row = surrogates[i]
-
-        if np.any(censored):
-            # Map censoring status to the surrogate values
-            # rankdata(method='ordinal') returns ranks 1..N
-            # We use these ranks to index into the sorted censoring arrays
-            ranks = rankdata(row, method='ordinal') - 1
-            # Ensure ranks are within bounds (should be 0..N-1) and integer type
-            ranks = np.clip(ranks, 0, n - 1).astype(int)
-
-            s_cen = sorted_censored[ranks]
-            s_type = sorted_cen_type[ranks]
-        else:
-            s_cen = surr_censored
-            s_type = surr_cen_type
 
-        s_surr, _, _, _ = _mk_score_and_var_censored(
-            row, t_arr,
-            censored=s_cen,
-            cen_type=s_type,
-            mk_test_method=mk_test_method,
-            tie_break_method=tie_break_method,
-            tau_method=tau_method,
-            calc_var=False
-        )
-        surrogate_scores[i] = s_surr
+        # Row-wise ordinal ranks (0..n-1) via one argsort and its inverse permutation
+        order = np.argsort(surrogates, axis=1, kind='stable')
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(n)[np.newaxis, :], axis=1)
+
+        surr_censored = sorted_censored[ranks]
+        surr_cen_type = sorted_cen_type[ranks]
+    else:
+        surr_censored = None
+        surr_cen_type = None
+
+    surrogate_scores = _mk_score_batch(
+        surrogates, t_arr,
+        censored=surr_censored,
+        cen_type=surr_cen_type,
+        mk_test_method=mk_test_method
+    )
 
     # Calculate Significance
     # Two-sided test: fraction of surrogates with |S| >= |S_orig|
@@ -22,7 +22,8 @@ def get_analysis_note(data, values_col='value', censored_col='censored',
     values, and run lengths.
 
     Args:
-        data (pd.DataFrame): The input data.
+        data (pd.DataFrame or _SeriesData): The input data. Seasonal checks
+            require a DataFrame.
         values_col (str): The name of the column with data values.
         censored_col (str): The name of the boolean column indicating censored data.
         is_seasonal (bool): Whether to perform seasonal checks.
@@ -35,12 +36,14 @@ def get_analysis_note(data, values_col='value', censored_col='censored',
 
     # --- First round of filtering (pre-aggregation) ---
     if not post_aggregation:
-        if data[values_col].isnull().all():
+        values = np.asarray(data[values_col], dtype=float)
+        is_na = np.isnan(values)
+        if is_na.all():
             return "Data all NA values"
 
-        non_censored_values = data.loc[~data[censored_col] & ~data[values_col].isnull(), values_col]
+        non_censored_values = values[~np.asarray(data[censored_col], dtype=bool) & ~is_na]
 
-        if len(non_censored_values.unique()) < MIN_UNIQUE_VALUES:
+        if len(np.unique(non_censored_values)) < MIN_UNIQUE_VALUES:
             return f"< {MIN_UNIQUE_VALUES} unique values"
 
         if len(non_censored_values) < MIN_NON_CENSORED:
@@ -79,7 +82,8 @@ def get_analysis_note(data, values_col='value', censored_col='censored',
                 return "Long run of single value in a Season"
 
         else:  # Not seasonal
-            values = data[values_col].dropna().to_numpy()
+            values = np.asarray(data[values_col], dtype=float)
+            values = values[~np.isnan(values)]
             if len(values) > 1:
                 rle_res = _rle_lengths(values)
                 if len(rle_res) > 0 and rle_res.max() / len(values) > 0.5:
@@ -4,11 +4,10 @@ using the Kruskal-Wallis H-test.
 """
 from collections import namedtuple
 import numpy as np
-import pandas as pd
 from scipy.stats import kruskal
 import warnings
 from ._datetime import _get_season_func, _is_datetime_like, _get_agg_func
-from ._helpers import _prepare_data, _aggregate_by_group
+from ._helpers import _prepare_data, _aggregate_groups, _group_codes
 
 from typing import Union
 
@@ -98,24 +97,22 @@ def check_seasonality(
             if agg_period is None:
                 raise ValueError("`agg_period` must be specified for datetime aggregation.")
             agg_func = _get_agg_func(agg_period)
-            agg_col = agg_func(pd.to_datetime(data['t_original']))
+            agg_col = agg_func(data.t_original)
         else:
             if agg_period is None:
                  raise ValueError("`agg_period` must be specified for numeric aggregation.")
-            agg_col = np.floor(data['t'] / agg_period)
+            agg_col = np.floor(data.t / agg_period)
 
-        data = data.groupby(agg_col).apply(
-            lambda grp: _aggregate_by_group(grp, agg_method, is_datetime)
-        ).reset_index(drop=True)
+        data = _aggregate_groups(data, _group_codes(agg_col), agg_method, is_datetime)
 
     if len(data) < 2:
         return res(np.nan, np.nan, False, [], [])
 
     if is_datetime:
         season_func = _get_season_func(season_type, period)
-        seasons = season_func(pd.to_datetime(data['t_original']))
+        seasons = season_func(data.t_original)
     else:
-        t_numeric = np.asarray(data['t'], dtype=np.float64)
+        t_numeric = np.asarray(data.t, dtype=np.float64)
         t_normalized = t_numeric - t_numeric[0]
         seasons = (np.floor(t_normalized) % period).astype(int)
 
@@ -127,7 +124,7 @@ def check_seasonality(
     skipped_seasons = []
     tested_seasons = []
     for s in unique_seasons:
-        group = data['value'][seasons == s]
+        group = data.value[seasons == s]
         if len(group) < 3 or len(np.unique(group)) < 2:
             if len(group) < 3:
                 warnings.warn(f"Season '{s}' has less than 3 samples and will be skipped.", UserWarning)
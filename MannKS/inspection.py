@@ -7,7 +7,6 @@ and determine the most suitable time increment for analysis.
 import pandas as pd
 import numpy as np
 from collections import namedtuple
-from .plotting import plot_inspection_data
 
 from typing import Optional, Dict, Union
 
@@ -137,37 +136,21 @@ def inspect_trend_data(
     # Sort increments by frequency (descending) to find the best one first
     sorted_increments = sorted(time_increments.items(), key=lambda item: item[1], reverse=True)
 
+    years = df_filtered['year'].to_numpy(dtype=np.int64)
     for name, num_increments in sorted_increments:
         if name not in increment_map:
             raise ValueError(f"Custom increment '{name}' is not supported. Supported increments are: {list(increment_map.keys())}")
         col = increment_map[name]
 
-        n_years_with_data = df_filtered['year'].nunique()
-        prop_year = n_years_with_data / trend_period
-
-        n_incr_year = df_filtered.groupby(['year', col]).ngroups
-
-        if name == 'annually':
-            prop_incr_year = prop_year
-        else:
-            total_possible_increments = trend_period * num_increments
-            prop_incr_year = n_incr_year / total_possible_increments if total_possible_increments > 0 else 0
-
-        is_ok = (prop_year >= prop_year_tol and prop_incr_year >= prop_incr_tol)
-
-        summary = {
-            'increment': name,
-            'n_obs': len(df_filtered),
-            'n_year': n_years_with_data,
-            'prop_year': prop_year,
-            'n_incr_year': n_incr_year,
-            'prop_incr_year': prop_incr_year,
-            'data_ok': is_ok
-        }
+        availability = _increment_availability(
+            years, df_filtered[col].to_numpy(dtype=np.int64), trend_period, num_increments,
+            prop_year_tol=prop_year_tol, prop_incr_tol=prop_incr_tol, annual=(name == 'annually')
+        )
+        summary = {'increment': name, 'n_obs': len(df_filtered), **availability}
         availability_summary.append(summary)
 
         # The first valid increment found will be the best one because we sorted by frequency
-        if is_ok and best_time_incr == 'none':
+        if summary['data_ok'] and best_time_incr == 'none':
             best_time_incr = name
 
     # --- 4. Add 'time_increment' Column ---
@@ -189,6 +172,7 @@ def inspect_trend_data(
              # Use a left merge to preserve the filtered rows
              plot_df = pd.merge(plot_df, data[['t', 'censored', 'cen_type']], on='t', how='left')
 
+        from .plotting import plot_inspection_data
         plot_inspection_data(
             data=plot_df,
             plot_path=plot_path,
@@ -208,3 +192,54 @@ def inspect_trend_data(
         return InspectionResult(data=df_filtered, summary=summary_df)
 
     return df_filtered
+
+
+def _increment_availability(
+    years: np.ndarray,
+    increments: np.ndarray,
+    trend_period: float,
+    num_increments: int,
+    prop_year_tol: float = 0.9,
+    prop_incr_tol: float = 0.9,
+    annual: bool = False
+) -> Dict:
+    """
+    Data availability of one time increment over a trend period.
+
+    Counts the years and the (year, increment) pairs with at least one
+    observation, and compares their proportions of the trend period with the
+    tolerances. Also used to choose the period of automatic aggregation.
+
+    Args:
+        years (np.ndarray): Year of each observation.
+        increments (np.ndarray): Integer increment key of each observation
+                                 (e.g. the month).
+        trend_period (float): Length of the trend period in years.
+        num_increments (int): Number of increments in a year.
+        prop_year_tol (float): Minimum proportion of years with data.
+        prop_incr_tol (float): Minimum proportion of increments with data.
+        annual (bool): True for the annual increment, whose proportion of
+                       increments is the proportion of years.
+
+    Returns:
+        dict: 'n_year', 'prop_year', 'n_incr_year', 'prop_incr_year' and
+              'data_ok'.
+    """
+    n_year = len(np.unique(years))
+    prop_year = n_year / trend_period
+
+    n_incr_year = len(np.unique(np.stack([years, increments]), axis=1)[0])
+
+    if annual:
+        prop_incr_year = prop_year
+    else:
+        total_possible_increments = trend_period * num_increments
+        prop_incr_year = n_incr_year / total_possible_increments if total_possible_increments > 0 else 0
+
+    return {
+        'n_year': n_year,
+        'prop_year': prop_year,
+        'n_incr_year': n_incr_year,
+        'prop_incr_year': prop_incr_year,
+        'data_ok': prop_year >= prop_year_tol and prop_incr_year >= prop_incr_tol
+    }
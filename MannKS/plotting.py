@@ -1,9 +1,38 @@
 """
 This script provides plotting utilities for the MannKS package.
 """
+import os
+import sys
 import warnings
 import numpy as np
 import pandas as pd
+import matplotlib
+
+
+def _backend_chosen():
+    """True if a backend was set via matplotlibrc, MPLBACKEND or `matplotlib.use`."""
+    get_backend = getattr(matplotlib.rcParams, '_get_backend_or_none', None)
+    if get_backend is not None:
+        return get_backend() is not None
+    # matplotlib < 3.5 keeps a sentinel until the backend is resolved
+    sentinel = getattr(matplotlib.rcsetup, '_auto_backend_sentinel', None)
+    return dict.__getitem__(matplotlib.rcParams, 'backend') is not sentinel
+
+
+def _has_display():
+    """False on Linux sessions without an X11 or Wayland display."""
+    if sys.platform.startswith('linux'):
+        return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return True
+
+
+# Headless sessions (servers, CI) get the non-interactive Agg backend rather
+# than matplotlib probing the GUI toolkits. A backend chosen by the user or
+# the application, or a desktop session where `plt.show()` should open a
+# window, is left alone.
+if 'matplotlib.pyplot' not in sys.modules and not _backend_chosen() and not _has_display():
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import seaborn as sns
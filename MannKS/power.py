@@ -5,15 +5,23 @@ This module provides tools to estimate the statistical power of the surrogate tr
 against colored noise backgrounds via Monte Carlo simulation.
 """
 
+import os
+import tempfile
+import warnings
+from contextlib import contextmanager
+from typing import Union, Optional, List, NamedTuple, Callable
+
 import numpy as np
 import pandas as pd
-import warnings
-from typing import Union, Optional, List, NamedTuple, Dict
-from scipy.interpolate import interp1d
+from scipy.stats import norm
 
 from ._surrogate import surrogate_test, _iaaft_surrogates, _lomb_scargle_surrogates, HAS_ASTROPY
-from ._helpers import _preprocessing, _get_slope_scaling_factor, _prepare_data
+from ._stats import _mk_score_batch, _mk_score_and_var_batch, _z_score_batch
+from ._helpers import _get_slope_scaling_factor, _prepare_data
 from ._check_data import check_data_integrity
+from ._cache import _cache_key, _cache_disabled
+from ._parallel import _executor, _resolve_n_jobs
+from ._diagnostics import _Diagnostics, _replay
 
 class PowerResult(NamedTuple):
     """Container for power analysis results."""
@@ -26,6 +34,44 @@ class PowerResult(NamedTuple):
     simulation_results: pd.DataFrame
     noise_method: str
     slope_scaling: Optional[str]
+    null_mode: str = 'per_test'
+    mdt_interval: Optional[tuple] = None
+    sample_sizes: Optional[np.ndarray] = None
+    power_surface: Optional[np.ndarray] = None
+
+
+# Diagnostics from the inner surrogate tests that would flood the output
+# during Monte Carlo loops
+_QUIET_MESSAGES = (
+    "Censored data detected in surrogate test",
+    "Lomb-Scargle surrogate generation is computationally expensive",
+    "Uneven sampling detected but `astropy` not installed",
+    "Using IAAFT on unevenly spaced data",
+    "IAAFT convergence stalled",
+)
+
+
+@contextmanager
+def _quiet_inner_warnings():
+    """Suppresses repetitive diagnostics from the inner surrogate tests."""
+    # A local collector rather than warnings.catch_warnings, which swaps
+    # process-global state and is not safe in worker threads
+    with _Diagnostics(propagate=False) as diagnostics:
+        yield
+    _replay([record for record in diagnostics.records if not record[0].startswith(_QUIET_MESSAGES)])
+
+
+def _surrogate_p_values(scores: np.ndarray, null_scores: np.ndarray) -> np.ndarray:
+    """
+    Two-sided surrogate p-values of many scores against one null distribution.
+
+    Uses the same estimator as `surrogate_test`: (n_extreme + 1) / (n_null + 1),
+    where n_extreme counts null scores with |S_null| >= |S|.
+    """
+    null_abs = np.sort(np.abs(null_scores))
+    n_null = len(null_abs)
+    n_extreme = n_null - np.searchsorted(null_abs, np.abs(scores), side='left')
+    return (n_extreme + 1) / (n_null + 1)
 
 def power_test(
     x: Union[np.ndarray, pd.DataFrame],
@@ -39,6 +85,14 @@ def power_test(
     surrogate_kwargs: Optional[dict] = None,
     slope_scaling: Optional[str] = None,
     detrend: bool = False,
+    null_mode: str = 'per_test',
+    target_power: Optional[float] = None,
+    mdt_tol: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    method: str = 'surrogate',
+    sample_sizes: Optional[List[int]] = None,
     **kwargs
 ) -> PowerResult:
     """
@@ -69,6 +123,41 @@ def power_test(
             This prevents an existing strong trend in `x` from inflating the low-frequency
             power of the noise model, which would otherwise reduce the estimated power.
             Default is False (conservative).
+        null_mode (str): How the inner null distribution is obtained.
+            - 'per_test': A full `surrogate_test` (new surrogate bank) for every
+              slope and simulation (default, most exact).
+            - 'per_realization': One surrogate bank per noise realisation, shared
+              by all injected slopes. Cost drops by a factor of len(slopes).
+            - 'shared': One surrogate bank of the noise model for the whole run,
+              valid under the stationarity assumption the noise model already makes.
+        target_power (float, optional): If provided, switches to an adaptive search for
+            the Minimum Detectable Trend at this power instead of evaluating the whole
+            `slopes` grid. `slopes` then only defines the search bracket (its min and max).
+            The bracket is bisected; at each probe slope simulations are added in batches
+            (up to `n_simulations`) until the 95% Wilson interval of the power excludes
+            `target_power`. `mdt_interval` is a confidence interval for the MDT: from
+            the largest probe slope whose power is confidently below the target to the
+            smallest one confidently above it. The search stops once it is narrower than
+            `mdt_tol`, and warns if the probes near the MDT cannot be resolved with
+            `n_simulations` before the bisection bracket is that narrow.
+        mdt_tol (float, optional): Target width of the MDT confidence interval (in the
+            units of `slopes`) for the adaptive search. Defaults to 1/64 of the bracket width.
+        n_jobs (int, optional): Number of worker processes for the (slope, simulation)
+            cells of the default grid evaluation. -1 uses all CPUs. Default None (serial).
+            Results are identical to a serial run with the same `random_state`.
+        checkpoint_path (str, optional): Path of an `.npz` checkpoint for the default
+            grid evaluation. Completed cells are saved as they finish and a re-run with
+            the same arguments resumes from the checkpoint.
+        progress (Callable[[int, int], None], optional): Called with
+            (completed_cells, total_cells) as the grid evaluation advances.
+        method (str): Detection test applied to each simulated series.
+            - 'surrogate': The surrogate trend test (default).
+            - 'analytic_mc': The plain Mann-Kendall test (normal approximation, as in
+              `trend_test`). All simulated series are scored in batched S/variance
+              calls, which is orders of magnitude faster. `n_surrogates` is unused.
+        sample_sizes (List[int], optional): ('analytic_mc' only) Sample sizes for a power
+            surface. Each size m uses the first m observations of the design. The surface
+            is returned as `PowerResult.power_surface` (len(sample_sizes) x len(slopes)).
         **kwargs: Additional arguments passed to `surrogate_test`.
 
     Returns:
@@ -89,8 +178,8 @@ def power_test(
 
     data_filtered, _ = _prepare_data(x_input, t, hicensor=False)
 
-    x_arr = data_filtered['value'].to_numpy()
-    t_numeric = data_filtered['t'].to_numpy()
+    x_arr = data_filtered.value
+    t_numeric = data_filtered.t
 
     # Final check for data integrity (e.g. infinite values which _prepare_data might not catch)
     check_data_integrity(x_arr, t_numeric, context="power_test")
@@ -112,8 +201,11 @@ def power_test(
     # Check for impossible detection (footgun prevention)
     # The minimum possible p-value with N surrogates is 1 / (N + 1).
     # If this minimum is greater than alpha, no trend can ever be detected.
+    if method not in ('surrogate', 'analytic_mc'):
+        raise ValueError(f"Invalid `method`: '{method}'. Must be 'surrogate' or 'analytic_mc'.")
+
     min_possible_p = 1.0 / (n_surrogates + 1)
-    if min_possible_p > alpha:
+    if method == 'surrogate' and min_possible_p > alpha:
         rec_n = int(1 / alpha) if alpha > 0 else "infinity"
         raise ValueError(
             f"Impossible to detect trends with n_surrogates={n_surrogates} and alpha={alpha}. "
@@ -121,8 +213,8 @@ def power_test(
             f"Please increase n_surrogates (recommend > {rec_n}) or increase alpha."
         )
 
-    if 'original_index' in data_filtered.columns:
-        kept_indices = data_filtered['original_index'].values
+    if data_filtered.original_index is not None:
+        kept_indices = data_filtered.original_index
         n_orig = len(np.asarray(t).flatten())
 
         for k, v in surr_kwargs.items():
@@ -133,8 +225,44 @@ def power_test(
                 else:
                     surr_kwargs[k] = np.asarray(v)[kept_indices]
 
+    if null_mode not in ('per_test', 'per_realization', 'shared'):
+        raise ValueError(
+            f"Invalid `null_mode`: '{null_mode}'. Must be one of 'per_test', 'per_realization', 'shared'."
+        )
+
     slopes_arr = np.asarray(slopes)
 
+    if target_power is not None:
+        if not 0 < target_power < 1:
+            raise ValueError("`target_power` must be between 0 and 1.")
+        finite_slopes = slopes_arr[np.isfinite(slopes_arr)]
+        if len(finite_slopes) < 2 or np.min(finite_slopes) == np.max(finite_slopes):
+            raise ValueError(
+                "Adaptive MDT search requires `slopes` to define a bracket of at least "
+                "two distinct finite values."
+            )
+        if mdt_tol is not None and mdt_tol <= 0:
+            raise ValueError("`mdt_tol` must be positive.")
+
+    if method == 'analytic_mc' and (
+        target_power is not None or null_mode != 'per_test'
+        or _resolve_n_jobs(n_jobs) > 1 or checkpoint_path is not None
+    ):
+        raise ValueError(
+            "method='analytic_mc' does not support `target_power`, `null_mode`, "
+            "`n_jobs` or `checkpoint_path`."
+        )
+    if sample_sizes is not None and method != 'analytic_mc':
+        raise ValueError("`sample_sizes` is only supported with method='analytic_mc'.")
+
+    if (_resolve_n_jobs(n_jobs) > 1 or checkpoint_path is not None) and (
+        null_mode != 'per_test' or target_power is not None
+    ):
+        raise ValueError(
+            "`n_jobs` and `checkpoint_path` are only supported for the grid evaluation "
+            "with null_mode='per_test'."
+        )
+
     if len(slopes_arr) == 0:
         # Return empty result
         return PowerResult(
@@ -146,7 +274,8 @@ def power_test(
             alpha=alpha,
             simulation_results=pd.DataFrame(),
             noise_method=surrogate_method, # defaulting since we didn't determine it
-            slope_scaling=slope_scaling
+            slope_scaling=slope_scaling,
+            null_mode=null_mode
         )
 
     # Handle Slope Unit Conversion
@@ -234,8 +363,13 @@ def power_test(
     # Check for computational complexity
     # Estimate total operations
     est_max_iter = surr_kwargs.get('max_iter', 100 if method_used == 'iaaft' else 1)
-    # n_samples * n_surrogates * max_iter * n_simulations * n_slopes
-    total_ops = len(x_arr) * n_surrogates * est_max_iter * n_simulations * len(slopes_scaled)
+    # n_samples * n_surrogates * max_iter * (number of inner surrogate banks)
+    n_banks = {
+        'per_test': n_simulations * len(slopes_scaled),
+        'per_realization': n_simulations,
+        'shared': 1
+    }[null_mode] if method == 'surrogate' else 0
+    total_ops = len(x_arr) * n_surrogates * est_max_iter * n_banks
 
     # Threshold: 10 million operations for Lomb-Scargle (expensive) or 500M for IAAFT (faster)
     # LS is significantly slower per op due to trig/grid.
@@ -251,6 +385,19 @@ def power_test(
 
     # 2. Monte Carlo Loop
 
+    if method == 'analytic_mc':
+        return _power_analytic_mc(
+            noise_bank, t_numeric, slopes_arr, slopes_scaled, n_simulations,
+            n_surrogates, alpha, method_used, surr_kwargs, sample_sizes, slope_scaling
+        )
+
+    if target_power is not None:
+        return _adaptive_mdt_search(
+            noise_bank, x_for_noise, t_numeric, slopes_arr, scaling_divisor,
+            n_simulations, n_surrogates, alpha, method_used, random_state,
+            surr_kwargs, null_mode, target_power, mdt_tol, slope_scaling
+        )
+
     results = []
 
     # Center time for trend injection to avoid huge intercepts
@@ -258,92 +405,501 @@ def power_test(
 
     power_values = []
 
+    if null_mode != 'per_test':
+        power_values, results = _power_with_shared_null(
+            noise_bank, x_for_noise, t_numeric, t_centered,
+            slopes_arr, slopes_scaled, n_simulations, n_surrogates, alpha,
+            method_used, random_state, surr_kwargs, null_mode
+        )
+    else:
+        power_values, results = _power_grid_per_test(
+            noise_bank, x_for_noise, t_numeric, t_centered,
+            slopes_arr, slopes_scaled, n_simulations, n_surrogates, alpha,
+            method_used, random_state, surr_kwargs,
+            n_jobs, checkpoint_path, progress
+        )
+
+    power_arr = np.array(power_values)
+
+    # 3. Calculate Minimum Detectable Trend (MDT) at 80% Power
+    # Note: MDT is reported in original units (slopes_arr)
+    mdt = _interpolate_mdt(slopes_arr, power_arr)
+
+    df_results = pd.DataFrame(results)
+
+    return PowerResult(
+        slopes=slopes_arr,
+        power=power_arr,
+        min_detectable_trend=mdt,
+        n_simulations=n_simulations,
+        n_surrogates_inner=n_surrogates,
+        alpha=alpha,
+        simulation_results=df_results,
+        noise_method=method_used,
+        slope_scaling=slope_scaling,
+        null_mode=null_mode
+    )
+
+
+def _power_with_shared_null(
+    noise_bank, x_for_noise, t_numeric, t_centered,
+    slopes_arr, slopes_scaled, n_simulations, n_surrogates, alpha,
+    method_used, random_state, surr_kwargs, null_mode
+):
+    """
+    Monte Carlo power loop with an inner null distribution shared across slopes.
+
+    For each noise realisation, all injected slopes are scored in one batched
+    call and compared against a single null distribution of surrogate S
+    scores: one per realisation ('per_realization') or one for the whole run
+    ('shared'). Censoring flags in `surr_kwargs` are handled as in
+    `surrogate_test` (flags travel with the observations; the null bank
+    propagates them by rank).
+
+    Returns:
+        tuple: (power_values, results) as built by `power_test`.
+    """
+    seeds = None
+    if random_state is not None:
+        seed_rng = np.random.default_rng(random_state + 1)
+        seeds = seed_rng.integers(0, 2**32, size=n_simulations)
+
+    mk_test_method = surr_kwargs.get('mk_test_method', 'lwp')
+    censored = surr_kwargs.get('censored')
+    cen_type = surr_kwargs.get('cen_type')
+    if censored is not None:
+        censored = np.asarray(censored, dtype=bool)
+    if cen_type is not None:
+        cen_type = np.asarray(cen_type)
+
+    def null_scores(series, seed):
+        with _quiet_inner_warnings(), _cache_disabled():
+            res = surrogate_test(
+                series, t_numeric,
+                method=method_used,
+                n_surrogates=n_surrogates,
+                random_state=seed,
+                **surr_kwargs
+            )
+        return res.surrogate_scores
+
+    valid = np.isfinite(slopes_scaled)
+    n_detected = np.zeros(len(slopes_scaled), dtype=int)
+
+    shared_null = None
+    if null_mode == 'shared':
+        shared_null = null_scores(x_for_noise, None if seeds is None else int(seeds[0]))
+
+    if np.any(valid):
+        trends = slopes_scaled[valid][:, np.newaxis] * t_centered[np.newaxis, :]
+        for i in range(n_simulations):
+            noise = noise_bank[i]
+            if shared_null is not None:
+                null = shared_null
+            else:
+                null = null_scores(noise, None if seeds is None else int(seeds[i]))
+
+            # All injected slopes for this realisation in one batch
+            x_sims = noise[np.newaxis, :] + trends
+            s_sims = _mk_score_batch(
+                x_sims, t_numeric,
+                censored=censored,
+                cen_type=cen_type,
+                mk_test_method=mk_test_method
+            )
+            p_values = _surrogate_p_values(s_sims, null)
+            n_detected[valid] += p_values <= alpha
+
+    power_values = []
+    results = []
+    for idx, beta in enumerate(slopes_scaled):
+        power = n_detected[idx] / n_simulations if valid[idx] else np.nan
+        power_values.append(power)
+        results.append({
+            'slope': slopes_arr[idx],
+            'slope_scaled': beta,
+            'power': power,
+            'n_detected': int(n_detected[idx]),
+            'n_simulations': n_simulations
+        })
+
+    return power_values, results
+
+
+def _wilson_interval(k: int, n: int, z: float = 1.96) -> tuple:
+    """Wilson score interval for a binomial proportion k/n."""
+    if n == 0:
+        return 0.0, 1.0
+    p_hat = k / n
+    denom = 1 + z**2 / n
+    centre = (p_hat + z**2 / (2 * n)) / denom
+    half = z * np.sqrt(p_hat * (1 - p_hat) / n + z**2 / (4 * n**2)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _adaptive_mdt_search(
+    noise_bank, x_for_noise, t_numeric, slopes_arr, scaling_divisor,
+    n_simulations, n_surrogates, alpha, method_used, random_state,
+    surr_kwargs, null_mode, target_power, mdt_tol, slope_scaling
+):
+    """
+    Bisection search for the slope at which power reaches `target_power`.
+
+    Every probe slope reuses the same noise realisations (common random
+    numbers), so successive power estimates differ only through the injected
+    trend. Simulations are added in batches and a probe stops early once the
+    Wilson interval of its power lies entirely above or below the target;
+    otherwise the bisection follows the point estimate.
+
+    The MDT confidence interval runs from the largest probe whose power is
+    confidently below the target to the smallest one confidently above it.
+    The search stops once it is narrower than `mdt_tol`, or when the
+    bisection bracket is (the remaining probes cannot be resolved).
+
+    Returns:
+        PowerResult: Evaluated probe slopes (sorted), their power, the MDT
+        (midpoint of the final bracket) and `mdt_interval`.
+    """
+    t_centered = t_numeric - np.mean(t_numeric)
+    seed_rng = np.random.default_rng(random_state + 1) if random_state is not None else None
+
+    mk_test_method = surr_kwargs.get('mk_test_method', 'lwp')
+    censored = surr_kwargs.get('censored')
+    cen_type = surr_kwargs.get('cen_type')
+    if censored is not None:
+        censored = np.asarray(censored, dtype=bool)
+    if cen_type is not None:
+        cen_type = np.asarray(cen_type)
+
+    def next_seed():
+        return None if seed_rng is None else int(seed_rng.integers(0, 2**32))
+
+    def run_surrogate_test(series):
+        with _quiet_inner_warnings(), _cache_disabled():
+            return surrogate_test(
+                series, t_numeric,
+                method=method_used,
+                n_surrogates=n_surrogates,
+                random_state=next_seed(),
+                **surr_kwargs
+            )
+
+    null_cache = {}
+    if null_mode == 'shared':
+        null_cache['shared'] = run_surrogate_test(x_for_noise).surrogate_scores
+
+    def detect(beta, sim_indices):
+        if null_mode == 'per_test':
+            return np.array([
+                run_surrogate_test(noise_bank[i] + beta * t_centered).p_value <= alpha
+                for i in sim_indices
+            ])
+        x_sims = noise_bank[sim_indices] + beta * t_centered[np.newaxis, :]
+        s_sims = _mk_score_batch(
+            x_sims, t_numeric, censored=censored, cen_type=cen_type, mk_test_method=mk_test_method
+        )
+        detected = np.empty(len(sim_indices), dtype=bool)
+        for k, i in enumerate(sim_indices):
+            if null_mode == 'shared':
+                null = null_cache['shared']
+            else:
+                if i not in null_cache:
+                    null_cache[i] = run_surrogate_test(noise_bank[i]).surrogate_scores
+                null = null_cache[i]
+            detected[k] = _surrogate_p_values(s_sims[k:k + 1], null)[0] <= alpha
+        return detected
+
+    batch_size = max(10, n_simulations // 10)
+    evaluations = {}
+
+    def evaluate(slope):
+        """Estimates power at `slope`; returns True if it is above the target."""
+        beta = slope / scaling_divisor
+        n_used = 0
+        n_detected = 0
+        while n_used < n_simulations:
+            idx = np.arange(n_used, min(n_used + batch_size, n_simulations))
+            n_detected += int(np.sum(detect(beta, idx)))
+            n_used = idx[-1] + 1
+            lower, upper = _wilson_interval(n_detected, n_used)
+            if lower > target_power or upper < target_power:
+                break
+        evaluations[slope] = (n_detected, n_used)
+        return n_detected / n_used >= target_power
+
+    finite_slopes = slopes_arr[np.isfinite(slopes_arr)]
+    lo, hi = float(np.min(finite_slopes)), float(np.max(finite_slopes))
+    bracket = (lo, hi)
+    tol = mdt_tol if mdt_tol is not None else (hi - lo) / 64.0
+
+    def confidence_bounds():
+        """
+        The largest probe slope whose power is confidently below the target
+        and the smallest one confidently above it (Wilson intervals), falling
+        back to the bracket ends. Probes whose interval contains the target
+        lie between them.
+        """
+        below, above = [bracket[0]], [bracket[1]]
+        for slope, (n_detected, n_used) in evaluations.items():
+            lower, upper = _wilson_interval(n_detected, n_used)
+            if upper < target_power:
+                below.append(slope)
+            elif lower > target_power:
+                above.append(slope)
+        return max(below), min(above)
+
+    mdt = np.nan
+    mdt_interval = None
+    if evaluate(lo):
+        warnings.warn(
+            f"Target power {target_power} is already reached at the lower end of the "
+            f"slope bracket ({lo}). The Minimum Detectable Trend may be lower; widen the bracket.",
+            UserWarning
+        )
+        mdt = lo
+        mdt_interval = (-np.inf, lo)
+    elif not evaluate(hi):
+        warnings.warn(
+            f"Target power {target_power} was not reached within the slope bracket "
+            f"[{lo}, {hi}]. Minimum Detectable Trend is undefined; widen the bracket.",
+            UserWarning
+        )
+    else:
+        ci_lo, ci_hi = confidence_bounds()
+        # Probes close to the MDT may never resolve; the bisection bracket,
+        # which lies inside the confidence bounds, bounds the search
+        while ci_hi - ci_lo > tol and hi - lo > tol:
+            mid = 0.5 * (lo + hi)
+            if evaluate(mid):
+                hi = mid
+            else:
+                lo = mid
+            ci_lo, ci_hi = confidence_bounds()
+        mdt = 0.5 * (lo + hi)
+        mdt_interval = (ci_lo, ci_hi)
+        if ci_hi - ci_lo > tol:
+            warnings.warn(
+                f"The Minimum Detectable Trend interval [{ci_lo:.4g}, {ci_hi:.4g}] is wider "
+                f"than `mdt_tol` ({tol:.4g}): the power near the MDT cannot be separated "
+                "from the target with `n_simulations` simulations. Increase `n_simulations`.",
+                UserWarning
+            )
+
+    probe_slopes = np.array(sorted(evaluations))
+    power_arr = np.array([evaluations[sl][0] / evaluations[sl][1] for sl in probe_slopes])
+    df_results = pd.DataFrame({
+        'slope': probe_slopes,
+        'slope_scaled': probe_slopes / scaling_divisor,
+        'power': power_arr,
+        'n_detected': [evaluations[sl][0] for sl in probe_slopes],
+        'n_simulations': [evaluations[sl][1] for sl in probe_slopes],
+    })
+
+    return PowerResult(
+        slopes=probe_slopes,
+        power=power_arr,
+        min_detectable_trend=mdt,
+        n_simulations=n_simulations,
+        n_surrogates_inner=n_surrogates,
+        alpha=alpha,
+        simulation_results=df_results,
+        noise_method=method_used,
+        slope_scaling=slope_scaling,
+        null_mode=null_mode,
+        mdt_interval=mdt_interval
+    )
+
+
+def _run_power_cell(context, slope_idx, sim_idx, seed):
+    """Runs one (slope, simulation) cell and returns whether the trend was detected."""
+    x_sim = context['noise_bank'][sim_idx] + context['slopes_scaled'][slope_idx] * context['t_centered']
+
+    # We suppress specific warnings to avoid flooding stdout
+    with _quiet_inner_warnings(), _cache_disabled():
+        res = surrogate_test(
+            x_sim, context['t_numeric'],
+            method=context['method'],
+            n_surrogates=context['n_surrogates'],
+            # surrogate_test does not take alpha as argument
+            random_state=seed,
+            **context['surr_kwargs']
+        )
+    return res.p_value <= context['alpha']
+
+
+_WORKER_CONTEXT = {}
+
+
+def _init_power_worker(context):
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+
+def _power_cell_worker(cell):
+    return _run_power_cell(_WORKER_CONTEXT, *cell)
+
+
+def _fingerprint_value(value):
+    """
+    A `_cache_key` part for a surrogate option.
+
+    Array-like values are passed as arrays so their bytes are hashed (the
+    repr of a long array is truncated); object arrays are hashed as strings.
+    """
+    if isinstance(value, str) or not hasattr(value, '__len__'):
+        return value
+    arr = np.asarray(value)
+    if arr.dtype.hasobject:
+        arr = arr.astype(str)
+    return np.ascontiguousarray(arr)
+
+
+def _load_power_checkpoint(path, fingerprint, shape):
+    """Returns (detected, done) from a checkpoint, or fresh arrays if none exists."""
+    detected = np.zeros(shape, dtype=bool)
+    done = np.zeros(shape, dtype=bool)
+    if not os.path.exists(path):
+        return detected, done
+
+    with np.load(path, allow_pickle=False) as ckpt:
+        if str(ckpt['fingerprint']) != fingerprint:
+            raise ValueError(
+                f"Checkpoint '{path}' was created with different power_test arguments. "
+                "Delete it or use a different `checkpoint_path`."
+            )
+        detected[ckpt['slope_idx'], ckpt['sim_idx']] = ckpt['detected']
+        done[ckpt['slope_idx'], ckpt['sim_idx']] = True
+    return detected, done
+
+
+def _save_power_checkpoint(path, fingerprint, detected, done):
+    """Atomically writes the completed cells to an `.npz` checkpoint."""
+    slope_idx, sim_idx = np.nonzero(done)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.npz.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        np.savez(
+            f, fingerprint=np.array(fingerprint),
+            slope_idx=slope_idx, sim_idx=sim_idx, detected=detected[slope_idx, sim_idx]
+        )
+    os.replace(tmp_path, path)
+
+
+def _power_grid_per_test(
+    noise_bank, x_for_noise, t_numeric, t_centered,
+    slopes_arr, slopes_scaled, n_simulations, n_surrogates, alpha,
+    method_used, random_state, surr_kwargs,
+    n_jobs=None, checkpoint_path=None, progress=None
+):
+    """
+    Grid power evaluation with a full `surrogate_test` per (slope, simulation) cell.
+
+    Cells are independent and their seeds are drawn up front in serial order,
+    so the outcome does not depend on `n_jobs` or on resuming from a checkpoint.
+
+    Returns:
+        tuple: (power_values, results) as built by `power_test`.
+    """
+    n_slopes = len(slopes_scaled)
+    valid = np.isfinite(slopes_scaled)
+
     # Prepare seeds if random_state is set
     # We need n_slopes * n_simulations seeds
     seeds = None
     if random_state is not None:
         # Create a new RNG derived from main seed to generate sub-seeds
         seed_rng = np.random.default_rng(random_state + 1)
-        total_runs = len(slopes_scaled) * n_simulations
+        total_runs = n_slopes * n_simulations
         seeds = seed_rng.integers(0, 2**32, size=total_runs)
 
+    # Invalid slopes are skipped without consuming seeds
+    cells = []
     run_counter = 0
+    for idx in np.flatnonzero(valid):
+        for i in range(n_simulations):
+            seed = int(seeds[run_counter]) if seeds is not None else None
+            run_counter += 1
+            cells.append((int(idx), i, seed))
 
-    for idx, beta in enumerate(slopes_scaled):
-        n_detected = 0
-        original_slope = slopes_arr[idx] # Keep track of user-facing slope
+    shape = (n_slopes, n_simulations)
+    fingerprint = None
+    if checkpoint_path is not None:
+        fingerprint = _cache_key(
+            'power_test', np.asarray(x_for_noise, dtype=float), np.asarray(t_numeric, dtype=float),
+            np.asarray(slopes_scaled, dtype=float), n_simulations, n_surrogates, alpha,
+            method_used, random_state,
+            *[part for k, v in sorted(surr_kwargs.items()) for part in (k, _fingerprint_value(v))]
+        )
+        detected, done = _load_power_checkpoint(checkpoint_path, fingerprint, shape)
+    else:
+        detected = np.zeros(shape, dtype=bool)
+        done = np.zeros(shape, dtype=bool)
 
-        if not np.isfinite(beta):
-            # Skip invalid slopes
-            results.append({
-                'slope': original_slope,
-                'slope_scaled': beta,
-                'power': np.nan,
-                'n_detected': 0,
-                'n_simulations': n_simulations
-            })
-            power_values.append(np.nan)
-            continue
+    pending = [c for c in cells if not done[c[0], c[1]]]
+    n_total = len(cells)
+    if progress is not None:
+        progress(n_total - len(pending), n_total)
 
-        # We assume the noise_bank has shape (n_simulations, n_samples)
-        # For each realization...
-        for i in range(n_simulations):
-            noise = noise_bank[i]
+    context = {
+        'noise_bank': np.asarray(noise_bank),
+        'slopes_scaled': np.asarray(slopes_scaled, dtype=float),
+        't_centered': t_centered,
+        't_numeric': t_numeric,
+        'method': method_used,
+        'n_surrogates': n_surrogates,
+        'alpha': alpha,
+        'surr_kwargs': surr_kwargs,
+    }
 
-            # Inject Trend
-            x_sim = noise + beta * t_centered
+    n_workers = _resolve_n_jobs(n_jobs)
+    batch_size = max(10, 4 * n_workers)
+    with _executor(n_jobs, _init_power_worker, (context,)) as ex:
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            if ex is None:
+                outcomes = [_run_power_cell(context, *cell) for cell in batch]
+            else:
+                outcomes = list(ex.map(_power_cell_worker, batch))
 
-            # Run Test
-            # Determine seed for this run
-            current_seed = None
-            if seeds is not None:
-                current_seed = int(seeds[run_counter])
-            run_counter += 1
+            for (slope_idx, sim_idx, _), hit in zip(batch, outcomes):
+                detected[slope_idx, sim_idx] = hit
+                done[slope_idx, sim_idx] = True
 
-            # Note: We pass surrogate_kwargs to the test as well
-            # The test will generate `n_surrogates` internal surrogates
-
-            # We suppress specific warnings to avoid flooding stdout
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", message="Censored data detected in surrogate test")
-                warnings.filterwarnings("ignore", message="Lomb-Scargle surrogate generation is computationally expensive")
-                warnings.filterwarnings("ignore", message="Uneven sampling detected but `astropy` not installed")
-                warnings.filterwarnings("ignore", message="Using IAAFT on unevenly spaced data")
-                # Suppress "stalled" warnings to prevent flooding during MC loops
-                warnings.filterwarnings("ignore", message="IAAFT convergence stalled")
-
-                res = surrogate_test(
-                    x_sim, t_numeric,
-                    method=method_used,
-                    n_surrogates=n_surrogates,
-                    # surrogate_test does not take alpha as argument
-                    random_state=current_seed,
-                    **surr_kwargs
-                )
-
-            # Check detection
-            if res.p_value <= alpha:
-                n_detected += 1
-
-        power = n_detected / n_simulations
-        power_values.append(power)
+            if checkpoint_path is not None:
+                _save_power_checkpoint(checkpoint_path, fingerprint, detected, done)
+            if progress is not None:
+                progress(n_total - len(pending) + start + len(batch), n_total)
 
+    power_values = []
+    results = []
+    for idx, beta in enumerate(slopes_scaled):
+        if not valid[idx]:
+            power = np.nan
+            n_detected = 0
+        else:
+            n_detected = int(np.sum(detected[idx]))
+            power = n_detected / n_simulations
+        power_values.append(power)
         results.append({
-            'slope': original_slope,
+            'slope': slopes_arr[idx],
             'slope_scaled': beta,
             'power': power,
             'n_detected': n_detected,
             'n_simulations': n_simulations
         })
 
-    power_arr = np.array(power_values)
+    return power_values, results
 
-    # 3. Calculate Minimum Detectable Trend (MDT) at 80% Power
+
+def _interpolate_mdt(slopes_arr, power_arr, target_power=0.8):
+    """
+    Minimum Detectable Trend: first crossing of `target_power` on the power curve.
+
+    Returns NaN if the curve never crosses the target.
+    """
     # We use linear interpolation looking for the 0.8 crossing.
-    # Note: MDT is reported in original units (slopes_arr)
 
     mdt = np.nan
-    target_power = 0.8
 
     # Check if we crossed 0.8
     # We assume monotonic increase. If not, this is approximate.
@@ -373,16 +929,101 @@ def power_test(
         except Exception:
             pass
 
-    df_results = pd.DataFrame(results)
+    return mdt
+
+
+def _power_analytic_mc(
+    noise_bank, t_numeric, slopes_arr, slopes_scaled, n_simulations,
+    n_surrogates, alpha, method_used, surr_kwargs, sample_sizes, slope_scaling
+):
+    """
+    Monte Carlo power of the plain Mann-Kendall test with batched scoring.
+
+    Every (slope, simulation) series, and its first-m prefixes for each
+    requested sample size, is scored with `_mk_score_and_var_batch` and
+    tested with the normal approximation used by `_z_score`/`_p_value`.
+
+    Returns:
+        PowerResult: Power curve for the full design, plus the power surface
+        when `sample_sizes` is given.
+    """
+    n = len(t_numeric)
+    full_sizes = [n]
+    if sample_sizes is not None:
+        sizes_arr = np.asarray(sample_sizes, dtype=int)
+        if sizes_arr.ndim != 1 or len(sizes_arr) == 0 or np.any(sizes_arr < 3) or np.any(sizes_arr > n):
+            raise ValueError(f"`sample_sizes` must be integers between 3 and the number of observations ({n}).")
+        full_sizes = sorted(set(sizes_arr.tolist()) | {n})
+
+    mk_test_method = surr_kwargs.get('mk_test_method', 'lwp')
+    tie_break_method = surr_kwargs.get('tie_break_method', 'lwp')
+    censored = surr_kwargs.get('censored')
+    cen_type = surr_kwargs.get('cen_type')
+    if censored is not None:
+        censored = np.asarray(censored, dtype=bool)
+    if cen_type is not None:
+        cen_type = np.asarray(cen_type)
+
+    valid = np.isfinite(slopes_scaled)
+    betas = slopes_scaled[valid]
+    z_crit = norm.ppf(1 - alpha / 2)
+
+    # (n_valid_slopes * n_simulations) x n matrix of noise-plus-trend realisations
+    t_centered = t_numeric - np.mean(t_numeric)
+    x_sims = (
+        np.asarray(noise_bank)[np.newaxis, :, :]
+        + betas[:, np.newaxis, np.newaxis] * t_centered[np.newaxis, np.newaxis, :]
+    ).reshape(-1, n)
+
+    detected_by_size = {}
+    for m in full_sizes:
+        s, var_s = _mk_score_and_var_batch(
+            x_sims[:, :m], t_numeric[:m],
+            censored=None if censored is None else censored[:m],
+            cen_type=None if cen_type is None else cen_type[:m],
+            mk_test_method=mk_test_method,
+            tie_break_method=tie_break_method
+        )
+        hits = np.abs(_z_score_batch(s, var_s)) > z_crit
+        n_detected = np.zeros(len(slopes_scaled), dtype=int)
+        n_detected[valid] = hits.reshape(len(betas), n_simulations).sum(axis=1)
+        detected_by_size[m] = n_detected
+
+    def power_for(m):
+        return np.where(valid, detected_by_size[m] / n_simulations, np.nan)
+
+    power_arr = power_for(n)
+    rows = []
+    for m in (full_sizes if sample_sizes is not None else [n]):
+        power_m = power_for(m)
+        for idx, beta in enumerate(slopes_scaled):
+            row = {
+                'slope': slopes_arr[idx],
+                'slope_scaled': beta,
+                'power': power_m[idx],
+                'n_detected': int(detected_by_size[m][idx]),
+                'n_simulations': n_simulations
+            }
+            if sample_sizes is not None:
+                row['sample_size'] = m
+            rows.append(row)
+
+    surface = None
+    sizes_out = None
+    if sample_sizes is not None:
+        sizes_out = np.asarray(sample_sizes, dtype=int)
+        surface = np.vstack([power_for(m) for m in sizes_out])
 
     return PowerResult(
         slopes=slopes_arr,
         power=power_arr,
-        min_detectable_trend=mdt,
+        min_detectable_trend=_interpolate_mdt(slopes_arr, power_arr),
         n_simulations=n_simulations,
         n_surrogates_inner=n_surrogates,
         alpha=alpha,
-        simulation_results=df_results,
+        simulation_results=pd.DataFrame(rows),
         noise_method=method_used,
-        slope_scaling=slope_scaling
+        slope_scaling=slope_scaling,
+        sample_sizes=sizes_out,
+        power_surface=surface
     )
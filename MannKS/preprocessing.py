@@ -5,7 +5,11 @@ import numpy as np
 import pandas as pd
 import warnings
 
-from typing import Union, List
+from typing import Union, List, Optional
+
+# Codes of the censoring types, used for the conflicting-censoring check
+_CEN_TYPES = np.array(['not', 'lt', 'gt'], dtype=object)
+
 
 def prepare_censored_data(x: Union[List, np.ndarray, pd.Series]) -> pd.DataFrame:
     """
@@ -16,6 +20,10 @@ def prepare_censored_data(x: Union[List, np.ndarray, pd.Series]) -> pd.DataFrame
     pandas DataFrame with separate columns for the numeric value, a boolean
     censored flag, and the type of censoring.
 
+    The `<`/`>` prefixes are stripped with vectorised string operations and
+    the values are converted in bulk, so large inputs are parsed without a
+    per-item Python loop.
+
     Note:
         `np.nan` values in the input array will be converted to `np.nan` in
         the output 'value' column and will be treated as non-censored
@@ -31,58 +39,217 @@ def prepare_censored_data(x: Union[List, np.ndarray, pd.Series]) -> pd.DataFrame
             - 'cen_type': A string indicating the type of censoring
                           ('lt', 'gt', or 'not').
     """
-    values = []
-    censored_flags = []
-    cen_types = []
-
     if not hasattr(x, '__iter__') or isinstance(x, str):
         raise TypeError("Input data must be an iterable (e.g., list, numpy array).")
 
-    for item in x:
+    values, codes = _parse_censored(x)
+
+    # --- Mixed Censoring Validation ---
+    _warn_conflicting_censoring(values, codes)
+
+    return _censored_frame(values, codes)
+
+
+def read_censored_csv(
+    path,
+    value_col: str = 'value',
+    chunksize: Optional[int] = 100_000,
+    **read_csv_kwargs
+) -> pd.DataFrame:
+    """
+    Reads a CSV file with a censored value column (e.g., '<5', '12', '>20').
+
+    The file is read in chunks of `chunksize` rows and the value column of
+    each chunk is parsed as in `prepare_censored_data`, so only the parsed
+    representation of the whole file is held in memory.
+
+    Args:
+        path (str or path-like): Path of the CSV file (or any source
+            accepted by `pandas.read_csv`).
+        value_col (str): Name of the column holding the censored values.
+        chunksize (int, optional): Number of rows parsed at a time. If None,
+            the file is read in one piece.
+        **read_csv_kwargs: Further arguments passed to `pandas.read_csv`
+            (e.g., `usecols`, `parse_dates`, `sep`).
+
+    Returns:
+        pandas.DataFrame: The remaining columns of the file followed by the
+        'value', 'censored' and 'cen_type' columns of `prepare_censored_data`.
+    """
+    if chunksize is not None and (not isinstance(chunksize, (int, np.integer)) or chunksize < 1):
+        raise ValueError("`chunksize` must be a positive integer or None.")
+
+    # Read the value column as text so prefixes and numbers are parsed together
+    dtype = dict(read_csv_kwargs.pop('dtype', None) or {})
+    dtype[value_col] = object
+    reader = pd.read_csv(path, dtype=dtype, chunksize=chunksize, **read_csv_kwargs)
+    chunks = [reader] if chunksize is None else reader
+
+    frames, value_parts, code_parts = [], [], []
+    for chunk in chunks:
+        if value_col not in chunk.columns:
+            raise ValueError(f"Column '{value_col}' not found in the CSV file.")
+        other = chunk.drop(columns=value_col)
+        clashes = [col for col in ['value', 'censored', 'cen_type'] if col in other.columns]
+        if clashes:
+            raise ValueError(
+                f"The CSV file already contains column(s) {clashes}, which would be "
+                f"overwritten by the parsed censored data."
+            )
+        values, codes = _parse_censored(chunk[value_col].to_numpy(dtype=object))
+        frames.append(other)
+        value_parts.append(values)
+        code_parts.append(codes)
+
+    values = np.concatenate(value_parts) if value_parts else np.zeros(0)
+    codes = np.concatenate(code_parts) if code_parts else np.zeros(0, dtype=np.int8)
+    _warn_conflicting_censoring(values, codes)
+
+    result = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    parsed = _censored_frame(values, codes)
+    for col in parsed.columns:
+        result[col] = parsed[col].to_numpy()
+    return result
+
+
+def _censored_frame(values, codes):
+    """Builds the `prepare_censored_data` DataFrame from values and censor codes."""
+    return pd.DataFrame({
+        'value': values,
+        'censored': codes != 0,
+        'cen_type': _CEN_TYPES[codes]
+    })
+
+
+def _parse_censored(x):
+    """
+    Vectorised parser for censored data.
+
+    String items are stripped, checked for a `<`/`>` prefix and converted in
+    bulk with NumPy string operations; any conversion failure is re-parsed
+    item by item to raise the error of `prepare_censored_data`.
+
+    Args:
+        x (array-like): A 1D array or list containing the data.
+
+    Returns:
+        tuple: (values, codes)
+            - values (np.ndarray): Parsed float values.
+            - codes (np.ndarray): Censor type codes (0 'not', 1 'lt', 2 'gt').
+    """
+    if isinstance(x, (pd.Series, pd.Index)):
+        x = x.to_numpy(dtype=object)
+    elif not isinstance(x, (np.ndarray, list, tuple)):
+        x = list(x)
+    items = np.asarray(x) if isinstance(x, np.ndarray) else np.asarray(x, dtype=object)
+
+    if items.ndim != 1:
+        return _parse_censored_items(x)
+    n = len(items)
+    if items.dtype.kind in 'biuf':
+        return items.astype(float), np.zeros(n, dtype=np.int8)
+
+    if items.dtype.kind == 'U':
+        is_str = np.ones(n, dtype=bool)
+        strings = items
+    elif pd.api.types.infer_dtype(items, skipna=False) == 'string':
+        is_str = np.ones(n, dtype=bool)
+        strings = items.astype(str)
+    else:
+        items = items.astype(object)
+        # NumPy would turn None into NaN, which float(None) rejects
+        if any(items[i] is None for i in np.flatnonzero(pd.isna(items))):
+            return _parse_censored_items(x)
+        try:
+            # Non-string items come back as NaN from the string methods
+            is_str = pd.Series(items, dtype=object).str.len().notna().to_numpy()
+        except AttributeError:
+            # The string accessor rejects input without any strings
+            is_str = np.zeros(n, dtype=bool)
+        strings = items[is_str].astype(str)
+
+    values = np.empty(n, dtype=float)
+    codes = np.zeros(n, dtype=np.int8)
+    try:
+        if is_str.any():
+            stripped = np.char.strip(strings)
+            is_lt = np.char.startswith(stripped, '<')
+            is_gt = np.char.startswith(stripped, '>')
+            # Drop the prefix (the first occurrence of the symbol)
+            for mask, symbol in [(is_lt, '<'), (is_gt, '>')]:
+                if mask.any():
+                    stripped[mask] = np.char.replace(stripped[mask], symbol, '', 1)
+            # String-to-float conversion follows float()
+            values[is_str] = stripped.astype(float)
+            codes[np.flatnonzero(is_str)[is_lt]] = 1
+            codes[np.flatnonzero(is_str)[is_gt]] = 2
+        if not is_str.all():
+            values[~is_str] = items[~is_str].astype(float)
+    except (ValueError, TypeError):
+        # Re-parse item by item to report the first invalid entry
+        return _parse_censored_items(x)
+    return values, codes
+
+
+def _parse_censored_items(items):
+    """
+    Item-by-item parser for censored data, raising on the first invalid entry.
+
+    Args:
+        items (iterable): The data items.
+
+    Returns:
+        tuple: (values, codes), as returned by `_parse_censored`.
+    """
+    values = []
+    codes = []
+    for item in items:
         if isinstance(item, str):
             item_stripped = item.strip()
             if item_stripped.startswith('<'):
                 try:
                     values.append(float(item_stripped[1:]))
-                    censored_flags.append(True)
-                    cen_types.append('lt')
+                    codes.append(1)
                 except (ValueError, IndexError):
                     raise ValueError(f"Invalid left-censored value format: '{item}'. Expected a number after the '<' symbol.")
             elif item_stripped.startswith('>'):
                 try:
                     values.append(float(item_stripped[1:]))
-                    censored_flags.append(True)
-                    cen_types.append('gt')
+                    codes.append(2)
                 except (ValueError, IndexError):
                     raise ValueError(f"Invalid right-censored value format: '{item}'. Expected a number after the '>' symbol.")
             else:
                 try:
                     values.append(float(item_stripped))
-                    censored_flags.append(False)
-                    cen_types.append('not')
+                    codes.append(0)
                 except ValueError:
                     raise ValueError(f"Could not convert string '{item}' to a float.")
         else:
             try:
                 values.append(float(item))
-                censored_flags.append(False)
-                cen_types.append('not')
+                codes.append(0)
             except (ValueError, TypeError):
                  raise ValueError(f"Could not convert non-string value '{item}' to a float.")
 
-    # --- Mixed Censoring Validation ---
-    value_censor_map = {}
-    for val, cen_type in zip(values, cen_types):
-        if val in value_censor_map and value_censor_map[val] != cen_type:
-            warnings.warn(
-                f"Value {val} has conflicting censoring types. "
-                f"This may indicate data quality issues.", UserWarning
-            )
-        value_censor_map[val] = cen_type
+    return np.array(values, dtype=float), np.array(codes, dtype=np.int8)
 
 
-    return pd.DataFrame({
-        'value': np.array(values, dtype=float),
-        'censored': np.array(censored_flags, dtype=bool),
-        'cen_type': np.array(cen_types, dtype=object)
-    })
+def _warn_conflicting_censoring(values, codes):
+    """
+    Warns about values that appear with more than one censoring type.
+
+    The check is a grouped uniqueness test: (value, code) pairs are sorted
+    and a value is flagged when it is paired with two different codes.
+    """
+    valid = ~np.isnan(values)
+    values, codes = values[valid], codes[valid]
+    if len(values) < 2:
+        return
+    order = np.lexsort((codes, values))
+    values, codes = values[order], codes[order]
+    conflict = (values[1:] == values[:-1]) & (codes[1:] != codes[:-1])
+    for val in np.unique(values[1:][conflict]):
+        warnings.warn(
+            f"Value {float(val)} has conflicting censoring types. "
+            f"This may indicate data quality issues.", UserWarning
+        )
@@ -4,9 +4,21 @@ the LWP-TRENDS R script.
 """
 import pandas as pd
 import numpy as np
-import warnings
+from concurrent.futures import Executor
 from scipy.stats import norm
 from collections import namedtuple
+from typing import Optional
+
+from .trend_test_many import trend_test_many
+from ._diagnostics import _Diagnostics, _report
+
+RegionalPipelineResult = namedtuple('RegionalPipelineResult', ['site_results', 'regional'])
+
+# Above this many sites, corr_engine='auto' avoids the dense correlation matrix
+_DENSE_CORR_MAX_SITES = 2000
+# Overlap variances below this fraction of the raw sum of squares are
+# ambiguous in float32 and are recomputed exactly
+_CORR_VAR_RTOL = 1e-3
 
 
 def regional_test(
@@ -16,7 +28,9 @@ def regional_test(
     value_col: str = 'value',
     time_col: str = 'time',
     s_col: str = 's',
-    c_col: str = 'C'
+    c_col: str = 'C',
+    corr_engine: str = 'auto',
+    corr_block_size: int = 1024
 ) -> namedtuple:
     """
     Performs a regional trend aggregation analysis on the results of
@@ -35,6 +49,16 @@ def regional_test(
         time_col (str): The name of the time column in `time_series_data`.
         s_col (str): The name of the Mann-Kendall score column in `trend_results`.
         c_col (str): The name of the confidence column in `trend_results`.
+        corr_engine (str): How the inter-site correlation term is computed.
+            - 'auto' (default): 'dense' for up to 2,000 sites, 'blocked' above.
+            - 'dense': Pivots the data and builds the full correlation matrix
+              with `DataFrame.corr`.
+            - 'blocked': Computes pairwise-complete Pearson correlations tile by
+              tile in float32 and accumulates the weighted lower-triangle sum
+              directly, so memory grows with `corr_block_size` rather than with
+              the square of the number of sites. Agrees with 'dense' to float32
+              precision.
+        corr_block_size (int): Number of sites per tile for the 'blocked' engine.
 
     Returns:
         namedtuple: A namedtuple `RegionalTrendResult` with the following fields:
@@ -93,31 +117,28 @@ def regional_test(
         raise ValueError(f"time_series_data DataFrame must contain the "
                          f"following columns: {required_ts_cols}")
 
-    # Capture warnings
-    captured_warnings = []
+    valid_corr_engines = ['auto', 'dense', 'blocked']
+    if corr_engine not in valid_corr_engines:
+        raise ValueError(f"Invalid `corr_engine`. Must be one of {valid_corr_engines}.")
+    if not isinstance(corr_block_size, (int, np.integer)) or corr_block_size < 1:
+        raise ValueError("`corr_block_size` must be a positive integer.")
 
-    with warnings.catch_warnings(record=True) as w_log:
-        warnings.simplefilter("always")
+    # Diagnostics reported during this call are collected for this call only
+    with _Diagnostics() as diagnostics:
 
         # --- 2. Determine Modal Direction and Aggregate TAU ---
         results = trend_results.dropna(subset=[s_col, c_col]).copy()
         M = len(results)
 
         if M == 0:
-            # Collect warnings
-            for w in w_log:
-                captured_warnings.append(str(w.message))
-            return RegionalTrendResult(0, np.nan, np.nan, np.nan, 'Insufficient Data', np.nan, captured_warnings)
+            return RegionalTrendResult(0, np.nan, np.nan, np.nan, 'Insufficient Data', np.nan, diagnostics.messages)
 
         # Determine the modal direction
         s_signs = np.sign(results[s_col])
         modal_direction = np.sign(np.sum(s_signs) + np.sum(s_signs == 0) / 2)
         if modal_direction == 0:
-            # Collect warnings
-            for w in w_log:
-                captured_warnings.append(str(w.message))
             return RegionalTrendResult(M, 0.5, np.nan, np.nan,
-                                    'No Clear Direction', np.nan, captured_warnings)
+                                    'No Clear Direction', np.nan, diagnostics.messages)
 
         DT = 'Increasing' if modal_direction == 1 else 'Decreasing'
 
@@ -143,37 +164,51 @@ def regional_test(
             missing_sites = sites_in_trends - sites_in_ts
             raise ValueError(f"Sites in trend_results not found in time_series_data: {missing_sites}")
 
-        # Pivot the time series data to a wide format
-        ts_wide = time_series_data.pivot_table(index=time_col,
-                                            columns=site_col,
-                                            values=value_col)
-
-        # Align columns with trend_results
-        sites_in_common = results[site_col].unique()
-        ts_wide = ts_wide[sites_in_common]
-
-        if ts_wide.empty:
-            warnings.warn("Time series pivot resulted in empty DataFrame. Check that timestamps align across sites.", UserWarning)
-            # Collect warnings
-            for w in w_log:
-                captured_warnings.append(str(w.message))
-            return RegionalTrendResult(M, TAU, VarTAU, np.nan, DT, np.nan, captured_warnings)
-
-        # Calculate the pairwise correlation matrix
-        cor_matrix = ts_wide.corr(method='pearson')
-
-        # Calculate the covariance term
         p_modal_series = results.set_index(site_col)['p_modal']
         site_variances = p_modal_series * (1 - p_modal_series)
-        cov_matrix = np.outer(np.sqrt(site_variances), np.sqrt(site_variances))
+        sites_in_common = results[site_col].unique()
+        use_blocked = corr_engine == 'blocked' or (
+            corr_engine == 'auto' and len(sites_in_common) > _DENSE_CORR_MAX_SITES
+        )
+
+        if use_blocked:
+            # Tile-by-tile float32 correlations; no M x M matrix is built
+            ts_wide = _site_value_matrix(time_series_data, site_col, time_col, value_col, sites_in_common)
+            ts_empty = ts_wide.shape[0] == 0
+        else:
+            # Pivot the time series data to a wide format
+            ts_wide = time_series_data.pivot_table(index=time_col,
+                                                columns=site_col,
+                                                values=value_col)
+
+            # Align columns with trend_results
+            ts_wide = ts_wide[sites_in_common]
+            ts_empty = ts_wide.empty
+
+        if ts_empty:
+            _report("Time series pivot resulted in empty DataFrame. Check that timestamps align across sites.")
+            return RegionalTrendResult(M, TAU, VarTAU, np.nan, DT, np.nan, diagnostics.messages)
+
+        if use_blocked:
+            columns = pd.Index(sites_in_common).get_indexer(p_modal_series.index)
+            sum_cov_term = _blocked_weighted_corr_sum(
+                ts_wide[:, columns], np.sqrt(site_variances.to_numpy(dtype=float)),
+                block_size=corr_block_size
+            )
+        else:
+            # Calculate the pairwise correlation matrix
+            cor_matrix = ts_wide.corr(method='pearson')
+
+            # Calculate the covariance term
+            cov_matrix = np.outer(np.sqrt(site_variances), np.sqrt(site_variances))
 
-        # Align the correlation matrix with the covariance matrix
-        cor_matrix = cor_matrix.reindex(index=p_modal_series.index, columns=p_modal_series.index)
+            # Align the correlation matrix with the covariance matrix
+            cor_matrix = cor_matrix.reindex(index=p_modal_series.index, columns=p_modal_series.index)
 
-        cov_term_matrix = cov_matrix * cor_matrix
+            cov_term_matrix = cov_matrix * cor_matrix
 
-        # Sum the lower triangle of the covariance term matrix
-        sum_cov_term = np.sum(np.tril(cov_term_matrix, k=-1))
+            # Sum the lower triangle of the covariance term matrix
+            sum_cov_term = np.sum(np.tril(cov_term_matrix, k=-1))
 
         # Calculate the corrected variance
         CorrectedVarTAU = (1 / M**2) * (sum_var_tau + 2 * sum_cov_term)
@@ -195,13 +230,175 @@ def regional_test(
                 # TAU = 0.5 means no direction
                 CT = 0.5
 
-        # Collect warnings
-        for w in w_log:
-            captured_warnings.append(str(w.message))
+    return RegionalTrendResult(M=M, TAU=TAU, VarTAU=VarTAU,
+                               CorrectedVarTAU=CorrectedVarTAU, DT=DT, CT=CT, warnings=diagnostics.messages)
 
-    # Re-issue warnings
-    for w_str in captured_warnings:
-        warnings.warn(w_str, UserWarning)
 
-    return RegionalTrendResult(M=M, TAU=TAU, VarTAU=VarTAU,
-                               CorrectedVarTAU=CorrectedVarTAU, DT=DT, CT=CT, warnings=captured_warnings)
+def _site_value_matrix(time_series_data, site_col, time_col, value_col, sites):
+    """
+    (time x site) float32 matrix of mean values per timestamp, as `pivot_table` gives.
+
+    Timestamps without any value for `sites` are dropped; missing entries are NaN.
+    """
+    site_codes = pd.Index(sites).get_indexer(time_series_data[site_col])
+    values = time_series_data[value_col].to_numpy(dtype=float)
+    keep = (site_codes >= 0) & ~np.isnan(values)
+    time_codes, times = pd.factorize(time_series_data[time_col][keep])
+    site_codes, values = site_codes[keep], values[keep]
+    valid = time_codes >= 0
+
+    n_sites = len(sites)
+    flat = time_codes[valid].astype(np.int64) * n_sites + site_codes[valid]
+    size = len(times) * n_sites
+    sums = np.bincount(flat, weights=values[valid], minlength=size)
+    counts = np.bincount(flat, minlength=size)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        wide = np.where(counts > 0, sums / counts, np.nan)
+    return wide.reshape(len(times), n_sites).astype(np.float32)
+
+
+def _pairwise_corr_exact(x, y):
+    """
+    Pearson correlation over the observations where both x and y are present.
+    """
+    both = ~np.isnan(x) & ~np.isnan(y)
+    if not both.any():
+        return np.nan
+    dx = x[both].astype(float) - x[both].astype(float).mean()
+    dy = y[both].astype(float) - y[both].astype(float).mean()
+    divisor = np.sqrt(np.sum(dx * dx) * np.sum(dy * dy))
+    return np.sum(dx * dy) / divisor if divisor != 0 else np.nan
+
+
+def _blocked_weighted_corr_sum(wide, weights, block_size=1024):
+    """
+    Sum over site pairs i > j of weights[i] * weights[j] * r_ij.
+
+    r_ij is the pairwise-complete Pearson correlation of columns i and j of
+    `wide`, as in `DataFrame.corr`. Correlations are computed tile by tile
+    from float32 matrix products of the co-observation counts, sums and sums
+    of squares, so only `block_size` x `block_size` tiles are ever held in
+    memory. Pairs whose overlap variance is too small to resolve in float32
+    are recomputed exactly. Like summing the dense matrix, the result is NaN
+    if any correlation is undefined.
+
+    Args:
+        wide (np.ndarray): (time x site) values with NaN for missing entries.
+        weights (np.ndarray): Weight of each site (column).
+        block_size (int): Number of sites per tile.
+
+    Returns:
+        float: The weighted sum of the lower-triangle correlations.
+    """
+    mask = ~np.isnan(wide)
+    present = mask.astype(np.float32)
+    # Centering each column keeps the one-pass moments accurate in float32
+    # Column means as np.nanmean, without its warning for all-NaN columns
+    counts = mask.sum(axis=0)
+    col_mean = np.where(counts > 0, np.nansum(wide, axis=0) / np.maximum(counts, 1), np.nan)
+    centered = np.where(mask, wide - col_mean, 0).astype(np.float32)
+    squared = centered * centered
+    weights = np.asarray(weights, dtype=float)
+    n_sites = wide.shape[1]
+
+    total = 0.0
+    for a0 in range(0, n_sites, block_size):
+        a = slice(a0, min(a0 + block_size, n_sites))
+        for b0 in range(0, a0 + 1, block_size):
+            b = slice(b0, min(b0 + block_size, n_sites))
+            n = present[:, a].T @ present[:, b]
+            sx = centered[:, a].T @ present[:, b]
+            sy = present[:, a].T @ centered[:, b]
+            sxx = squared[:, a].T @ present[:, b]
+            syy = present[:, a].T @ squared[:, b]
+            sxy = centered[:, a].T @ centered[:, b]
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                var_x = sxx - sx * sx / n
+                var_y = syy - sy * sy / n
+                r = (sxy - sx * sy / n) / np.sqrt(var_x * var_y)
+
+            # Rows index sites of block a, columns sites of block b
+            rows, cols = np.meshgrid(np.arange(a.start, a.stop), np.arange(b.start, b.stop), indexing='ij')
+            lower = rows > cols
+            ambiguous = lower & (n > 0) & (
+                (var_x <= _CORR_VAR_RTOL * sxx) | (var_y <= _CORR_VAR_RTOL * syy)
+            )
+            for i, j in zip(*np.nonzero(ambiguous)):
+                r[i, j] = _pairwise_corr_exact(wide[:, rows[i, j]], wide[:, cols[i, j]])
+
+            r_lower = r[lower]
+            if np.isnan(r_lower).any() or (n[lower] == 0).any():
+                return np.nan
+            total += float(np.sum(weights[rows[lower]] * weights[cols[lower]] * np.clip(r_lower, -1, 1)))
+    return total
+
+
+def regional_trend_pipeline(
+    long_df: pd.DataFrame,
+    site_col: str = 'site',
+    time_col: str = 'time',
+    value_col: str = 'value',
+    seasonal: bool = False,
+    engine: str = 'full',
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    batch_size: Optional[int] = None,
+    **kwargs
+) -> RegionalPipelineResult:
+    """
+    Runs a trend test for every site of a long-format table and aggregates
+    the results with `regional_test`.
+
+    The per-site tests are run by `trend_test_many`: the table is partitioned
+    by site once, sites are tested serially, in a worker pool or through the
+    grouped kernel, and the results are collected into one DataFrame. A site
+    whose test raises is recorded with its error message instead of aborting
+    the run, and is left out of the regional aggregation.
+
+    Args:
+        long_df (pd.DataFrame): One row per observation with columns for the
+            site, the time and the value. If the table also has the 'censored'
+            and 'cen_type' columns of `prepare_censored_data`, the censoring is
+            passed to the per-site tests.
+        site_col (str): The name of the site identifier column.
+        time_col (str): The name of the time column.
+        value_col (str): The name of the value column.
+        seasonal (bool): Whether to use `seasonal_trend_test` (True) or
+            `trend_test` (False) for each site.
+        engine (str): 'full' or 'kernel'; see `trend_test_many`.
+        n_jobs (Optional[int]): Number of worker processes. None or 1 runs
+            serially; -1 uses all CPUs. Results do not depend on `n_jobs`.
+        executor (Optional[concurrent.futures.Executor]): An existing executor
+            to run the batches on. Takes precedence over `n_jobs` and is not
+            shut down.
+        batch_size (Optional[int]): Number of sites per task; see `trend_test_many`.
+        **kwargs: Additional arguments passed to `trend_test` or
+            `seasonal_trend_test` (e.g. `alpha`, `period`, `slope_scaling`).
+
+    Returns:
+        RegionalPipelineResult: A namedtuple with fields:
+            - site_results (pd.DataFrame): The `trend_test_many` table, one row
+              per site (sorted by site) with the diagnostics of each site in
+              a 'warnings' column and an 'error' column that is None for
+              sites tested successfully.
+            - regional: The `RegionalTrendResult` of `regional_test`.
+    """
+    required_cols = [site_col, time_col, value_col]
+    if not all(col in long_df.columns for col in required_cols):
+        raise ValueError(f"long_df DataFrame must contain the following columns: {required_cols}")
+
+    site_results = trend_test_many(
+        long_df, by=site_col, value_col=value_col, time_col=time_col, seasonal=seasonal,
+        engine=engine, n_jobs=n_jobs, executor=executor, batch_size=batch_size, **kwargs
+    )
+
+    regional = regional_test(
+        trend_results=site_results[site_results['error'].isna()],
+        time_series_data=long_df,
+        site_col=site_col,
+        value_col=value_col,
+        time_col=time_col
+    )
+
+    return RegionalPipelineResult(site_results=site_results, regional=regional)
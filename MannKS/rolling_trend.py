@@ -2,9 +2,19 @@ import numpy as np
 import pandas as pd
 from typing import Union, Optional
 import warnings
+from concurrent.futures import Executor
 from .trend_test import trend_test
 from .seasonal_trend_test import seasonal_trend_test
 from ._datetime import _is_datetime_like
+from ._helpers import _preprocessing, _get_slope_scaling_factor
+from ._stats import (_z_score, _p_value, _mk_probability, _confidence_intervals,
+                     _sens_estimator_adaptive)
+from ._large_dataset import detect_size_tier
+from ._rolling_engine import _rolling_mk_scores, _RollingSlopeBlocks, _window_slope_stats
+from ._parallel import _executor, _resolve_n_jobs, _shared_arrays, _take_shared, _task_seed
+from ._diagnostics import _Diagnostics, _report, _replay
+from .classification import classify_trend
+from collections import namedtuple
 
 # Robust import for to_offset
 try:
@@ -15,6 +25,36 @@ except ImportError:
     except ImportError:
         to_offset = None # Will fail at runtime if needed
 
+_WindowTrend = namedtuple('_WindowTrend', ['trend', 'C'])
+
+# Windows spanning more segments than this compute their slopes directly, as the
+# number of cached blocks per window grows quadratically with the segment count.
+_MAX_SLOPE_SEGMENTS = 32
+
+_ROLLING_COLUMNS = [
+    'window_start', 'window_end', 'window_center', 'n_obs',
+    'slope', 'lower_ci', 'upper_ci', 'p_value', 'h',
+    'classification', 'C', 'Cd', 'tau', 's',
+    'intercept', 'slope_per_second', 'lower_ci_per_second', 'upper_ci_per_second',
+    'scaled_slope', 'scaled_lower_ci', 'scaled_upper_ci', 'warnings'
+]
+
+# trend_test options that the incremental engine reproduces (or that have no
+# effect on uncensored data), with the values it supports.
+_INCREMENTAL_SUPPORTED_KWARGS = {
+    'tau_method': ('a', 'b'),
+    'mk_test_method': ('lwp', 'robust'),
+    'tie_break_method': ('lwp', 'robust'),
+    'ci_method': ('lwp', 'direct'),
+    'sens_slope_method': ('lwp', 'unbiased', 'nan', 'ats'),
+    'agg_method': ('none',),
+    'autocorr_method': ('none',),
+    'surrogate_method': ('none',),
+    'hicensor': (False,),
+}
+_INCREMENTAL_PASSTHROUGH_KWARGS = {'category_map', 'lt_mult', 'gt_mult', 'min_size'}
+
+
 def rolling_trend_test(
     x: Union[np.ndarray, pd.DataFrame],
     t: np.ndarray,
@@ -31,6 +71,9 @@ def rolling_trend_test(
     large_dataset_mode: str = 'auto',
     max_pairs: Optional[int] = None,
     random_state: Optional[int] = None,
+    engine: str = 'full',
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
     **kwargs
 ) -> pd.DataFrame:
     """
@@ -67,6 +110,22 @@ def rolling_trend_test(
             - 'aggregate': Force aggregation workflow.
         max_pairs (Optional[int]): Maximum number of pairs to sample in fast mode.
         random_state (Optional[int]): Random seed for reproducible results in fast mode.
+            Each window receives its own seed derived from `random_state` and the
+            window's position, so results do not depend on `n_jobs`.
+        engine (str): How the Mann-Kendall statistics of each window are obtained.
+            - 'full' (default): Runs `trend_test` (or `seasonal_trend_test`) on every window.
+            - 'incremental': Updates S and the tie counts as observations enter and
+              leave the window (O(log n) per observation), then computes the Sen's slope
+              of each window. Gives the same results as 'full' for uncensored,
+              non-seasonal data without missing values and is much faster for
+              overlapping windows. Options that change the test (aggregation,
+              autocorrelation correction, surrogates, ...) are not supported.
+        n_jobs (Optional[int]): Number of worker processes for engine='full'. None or 1
+            runs serially; -1 uses all CPUs. x and t are placed in shared memory so
+            workers do not receive a copy of the full series with every window.
+        executor (Optional[concurrent.futures.Executor]): An existing executor to run
+            the windows on instead of creating a process pool. Takes precedence over
+            `n_jobs` and is not shut down.
         **kwargs: Additional arguments passed to `trend_test` or `seasonal_trend_test`.
 
     Returns:
@@ -166,112 +225,442 @@ def rolling_trend_test(
     # Generate windows
     windows = _generate_windows(t_series, window_val, step_val, is_datetime)
 
-    # Calculate trends for each window
-    results = []
+    parallel = executor is not None or _resolve_n_jobs(n_jobs) > 1
 
-    for win_start, win_end in windows:
-        # Select data in window [start, end)
-        if is_datetime:
-            mask = (t_series >= win_start) & (t_series < win_end)
-        else:
-            mask = (t_series >= win_start) & (t_series < win_end)
+    if engine == 'incremental':
+        if parallel:
+            raise ValueError("`n_jobs` and `executor` are only supported with engine='full'.")
+        return _rolling_incremental(
+            x, t_arr, t_series, windows, is_datetime, min_size, alpha, seasonal,
+            slope_scaling, x_unit, continuous_confidence, large_dataset_mode,
+            max_pairs, random_state, kwargs
+        )
+    elif engine != 'full':
+        raise ValueError(f"Invalid `engine`: '{engine}'. Must be 'full' or 'incremental'.")
+
+    common_kwargs = {
+        'alpha': alpha,
+        'slope_scaling': slope_scaling,
+        'x_unit': x_unit,
+        'continuous_confidence': continuous_confidence,
+        'large_dataset_mode': large_dataset_mode,
+        'max_pairs': max_pairs,
+        **kwargs
+    }
+    if seasonal:
+        # seasonal_trend_test uses min_size_per_season, not min_size
+        common_kwargs.pop('min_size', None)
+    else:
+        # trend_test accepts min_size. We set it to None because we already filtered
+        # at the window level.
+        common_kwargs['min_size'] = None
+    options = {
+        'is_datetime': is_datetime,
+        'seasonal': seasonal,
+        'period': period,
+        'season_type': season_type,
+        'test_kwargs': common_kwargs,
+    }
 
-        if mask.sum() < min_size:
+    # Select data in each window [start, end) and derive its seed
+    t_sorted, order, is_sorted = _sorted_time_index(t_series, is_datetime)
+    tasks = []
+    for k, (win_start, win_end) in enumerate(windows):
+        idx = _window_indices(t_sorted, order, is_sorted, win_start, win_end)
+        n_window = len(idx) if not isinstance(idx, slice) else idx.stop - idx.start
+        if n_window < min_size:
+            continue
+        seed = _task_seed(random_state, k)
+        if parallel:
+            tasks.append((win_start, win_end, idx, seed))
             continue
 
         # Extract window data
         if isinstance(x, pd.DataFrame):
-            x_window = x[mask].reset_index(drop=True)
+            x_window = x.iloc[idx].reset_index(drop=True)
         else:
-            x_window = x_arr[mask]
-        t_window = t_arr[mask]
+            x_window = x_arr[idx]
+        t_window = t_arr[idx]
 
-        # Run trend test
         try:
-            common_kwargs = {
-                'alpha': alpha,
-                'slope_scaling': slope_scaling,
-                'x_unit': x_unit,
-                'continuous_confidence': continuous_confidence,
-                'large_dataset_mode': large_dataset_mode,
-                'max_pairs': max_pairs,
-                'random_state': random_state,
-                **kwargs
-            }
-
-            if seasonal:
-                # seasonal_trend_test uses min_size_per_season, not min_size
-                if 'min_size' in common_kwargs:
-                    del common_kwargs['min_size']
-
-                result = seasonal_trend_test(
-                    x=x_window,
-                    t=t_window,
-                    period=period,
-                    season_type=season_type,
-                    **common_kwargs
-                )
-            else:
-                # trend_test accepts min_size. We set it to None because we already filtered
-                # at the window level.
-                common_kwargs['min_size'] = None
-                result = trend_test(
-                    x=x_window,
-                    t=t_window,
-                    **common_kwargs
-                )
+            tasks.append(_rolling_window_row(x_window, t_window, win_start, win_end, seed, options))
+        except Exception as e:
+            warnings.warn(f"Failed to calculate trend for window {win_start} to {win_end}: {e}")
 
-            # Calculate window center
-            if is_datetime:
-                # Midpoint calculation
-                win_center = win_start + (win_end - win_start) / 2
-            else:
-                win_center = (win_start + win_end) / 2
-
-            results.append({
-                'window_start': win_start,
-                'window_end': win_end,
-                'window_center': win_center,
-                'n_obs': int(mask.sum()),
-                'slope': result.slope,
-                'lower_ci': result.lower_ci,
-                'upper_ci': result.upper_ci,
-                'p_value': result.p,
-                'h': result.h,
-                'classification': result.classification,
-                'C': result.C,
-                'Cd': result.Cd,
-                'tau': result.Tau,
-                's': result.s,
-                'intercept': result.intercept,
-                'slope_per_second': result.slope_per_second,
-                'lower_ci_per_second': result.lower_ci_per_second,
-                'upper_ci_per_second': result.upper_ci_per_second,
-                'scaled_slope': result.scaled_slope,
-                'scaled_lower_ci': result.scaled_lower_ci,
-                'scaled_upper_ci': result.scaled_upper_ci,
-                'warnings': result.warnings
-            })
+    if parallel and tasks:
+        results = _run_windows_parallel(x, x_arr, t_arr, tasks, options, n_jobs, executor)
+    else:
+        results = tasks
+
+    if not results:
+        return pd.DataFrame(columns=_ROLLING_COLUMNS)
+
+    return pd.DataFrame(results)
+
+
+def _rolling_window_row(x_window, t_window, win_start, win_end, seed, options):
+    """
+    Runs the trend test on one window and returns its row of the results table.
+    """
+    if options['seasonal']:
+        result = seasonal_trend_test(
+            x=x_window,
+            t=t_window,
+            period=options['period'],
+            season_type=options['season_type'],
+            random_state=seed,
+            **options['test_kwargs']
+        )
+    else:
+        result = trend_test(
+            x=x_window,
+            t=t_window,
+            random_state=seed,
+            **options['test_kwargs']
+        )
+
+    # Calculate window center
+    if options['is_datetime']:
+        # Midpoint calculation
+        win_center = win_start + (win_end - win_start) / 2
+    else:
+        win_center = (win_start + win_end) / 2
+
+    return {
+        'window_start': win_start,
+        'window_end': win_end,
+        'window_center': win_center,
+        'n_obs': int(len(t_window)),
+        'slope': result.slope,
+        'lower_ci': result.lower_ci,
+        'upper_ci': result.upper_ci,
+        'p_value': result.p,
+        'h': result.h,
+        'classification': result.classification,
+        'C': result.C,
+        'Cd': result.Cd,
+        'tau': result.Tau,
+        's': result.s,
+        'intercept': result.intercept,
+        'slope_per_second': result.slope_per_second,
+        'lower_ci_per_second': result.lower_ci_per_second,
+        'upper_ci_per_second': result.upper_ci_per_second,
+        'scaled_slope': result.scaled_slope,
+        'scaled_lower_ci': result.scaled_lower_ci,
+        'scaled_upper_ci': result.scaled_upper_ci,
+        'warnings': result.warnings
+    }
+
+
+def _frame_to_arrays(df):
+    """
+    Splits a DataFrame into shareable column arrays.
+
+    Object columns (e.g. `cen_type`) are factorised so only integer codes need
+    to be shared; the labels travel in the returned metadata.
+    """
+    arrays = {}
+    meta = []
+    for i, col in enumerate(df.columns):
+        key = f'col{i}'
+        series = df[col]
+        if series.dtype == object or isinstance(series.dtype, pd.CategoricalDtype):
+            codes, uniques = pd.factorize(series)
+            arrays[key] = codes
+            labels = np.append(np.asarray(uniques, dtype=object), np.nan)
+            meta.append((col, key, labels))
+        else:
+            arrays[key] = series.to_numpy()
+            meta.append((col, key, None))
+    return arrays, meta
+
+
+def _run_windows_parallel(x, x_arr, t_arr, tasks, options, n_jobs, executor):
+    """
+    Fans windows out to a process pool, returning rows in window order.
+
+    x and t are placed in shared memory once; each task only carries its
+    window bounds, row selection and seed.
+    """
+    if isinstance(x, pd.DataFrame):
+        arrays, frame_meta = _frame_to_arrays(x)
+    else:
+        arrays, frame_meta = {'x': x_arr}, None
+    arrays['t'] = t_arr
+
+    with _shared_arrays(arrays) as descriptors:
+        payloads = [
+            (descriptors, frame_meta, win_start, win_end, idx, seed, options)
+            for win_start, win_end, idx, seed in tasks
+        ]
+        if executor is not None:
+            outputs = list(executor.map(_rolling_window_task, payloads))
+        else:
+            n_workers = _resolve_n_jobs(n_jobs)
+            chunksize = max(1, len(payloads) // (4 * n_workers))
+            with _executor(n_jobs) as ex:
+                outputs = list(ex.map(_rolling_window_task, payloads, chunksize=chunksize))
+
+    results = []
+    for (win_start, win_end, _, _), (row, error, records) in zip(tasks, outputs):
+        _replay(records)
+        if error is not None:
+            warnings.warn(f"Failed to calculate trend for window {win_start} to {win_end}: {error}")
+            continue
+        results.append(row)
+    return results
 
+
+def _rolling_window_task(payload):
+    """
+    Worker entry point: rebuilds one window from shared memory and tests it.
+
+    Returns (row, error, diagnostics) so failures and diagnostics can be
+    reported by the parent in window order.
+    """
+    descriptors, frame_meta, win_start, win_end, idx, seed, options = payload
+    data = _take_shared(descriptors, idx)
+
+    if frame_meta is None:
+        x_window = data['x']
+    else:
+        columns = {}
+        for col, key, labels in frame_meta:
+            columns[col] = data[key] if labels is None else labels[data[key]]
+        x_window = pd.DataFrame(columns)
+    t_window = data['t']
+
+    with _Diagnostics(propagate=False) as diagnostics:
+        try:
+            row = _rolling_window_row(x_window, t_window, win_start, win_end, seed, options)
+            error = None
         except Exception as e:
-            warnings.warn(f"Failed to calculate trend for window {win_start} to {win_end}: {e}")
+            row, error = None, str(e)
+    return row, error, diagnostics.records
+
+
+def _rolling_incremental(
+    x, t_arr, t_series, windows, is_datetime, min_size, alpha, seasonal,
+    slope_scaling, x_unit, continuous_confidence, large_dataset_mode,
+    max_pairs, random_state, kwargs
+):
+    """
+    Rolling trend analysis using the incremental Mann-Kendall engine.
+
+    Produces the same columns as the per-window `trend_test` path. S, its
+    variance and Tau come from `_rolling_mk_scores`; slopes, confidence
+    intervals and classifications use the same helpers as `trend_test`.
+    """
+    if seasonal:
+        raise ValueError("engine='incremental' does not support seasonal=True.")
+
+    for key, value in kwargs.items():
+        if key in _INCREMENTAL_PASSTHROUGH_KWARGS:
             continue
+        if key not in _INCREMENTAL_SUPPORTED_KWARGS or value not in _INCREMENTAL_SUPPORTED_KWARGS[key]:
+            raise ValueError(
+                f"engine='incremental' does not support `{key}={value!r}`. Use engine='full'."
+            )
 
-    if not results:
-        return pd.DataFrame(columns=[
-            'window_start', 'window_end', 'window_center', 'n_obs',
-            'slope', 'lower_ci', 'upper_ci', 'p_value', 'h',
-            'classification', 'C', 'Cd', 'tau', 's',
-            'intercept', 'slope_per_second', 'lower_ci_per_second', 'upper_ci_per_second',
-            'scaled_slope', 'scaled_lower_ci', 'scaled_upper_ci', 'warnings'
-        ])
+    tau_method = kwargs.get('tau_method', 'b')
+    ci_method = kwargs.get('ci_method', 'lwp')
+    sens_slope_method = kwargs.get('sens_slope_method', 'lwp')
+    category_map = kwargs.get('category_map')
+
+    if isinstance(x, pd.DataFrame):
+        if 'censored' in x.columns and x['censored'].any():
+            raise ValueError("engine='incremental' does not support censored data. Use engine='full'.")
+        x_values = x['value'] if 'value' in x.columns else x.iloc[:, 0]
+        x_values = np.asarray(x_values, dtype=float)
+    else:
+        x_values, n_cols = _preprocessing(np.asarray(x))
+        if n_cols > 1:
+            raise ValueError("Input `x` must be 1-dimensional.")
+        x_values = np.asarray(x_values, dtype=float)
+
+    t_numeric, _ = _preprocessing(t_arr)
+    t_numeric = np.asarray(t_numeric, dtype=float)
+
+    if np.any(np.isnan(x_values)) or np.any(np.isnan(t_numeric)):
+        raise ValueError(
+            "engine='incremental' requires data without missing values. "
+            "Drop them first or use engine='full'."
+        )
+
+    # Time-ordered arrays; window bounds become index ranges
+    t_bounds, order, _ = _sorted_time_index(t_series, is_datetime)
+    x_sorted = x_values[order]
+    t_sorted = t_numeric[order]
+
+    window_list = []
+    starts = []
+    ends = []
+    for k, (win_start, win_end) in enumerate(windows):
+        i0 = int(t_bounds.searchsorted(win_start, side='left'))
+        i1 = int(t_bounds.searchsorted(win_end, side='left'))
+        if i1 - i0 < min_size:
+            continue
+        window_list.append((win_start, win_end, _task_seed(random_state, k)))
+        starts.append(i0)
+        ends.append(i1)
+
+    if not window_list:
+        return pd.DataFrame(columns=_ROLLING_COLUMNS)
+
+    s_all, var_all, tau_all = _rolling_mk_scores(x_sorted, starts, ends, tau_method=tau_method)
+
+    # Exact slope sets are built from cached blocks between window boundaries
+    seg_bounds = np.unique(np.concatenate([starts, ends]))
+    slope_blocks = _RollingSlopeBlocks(x_sorted, t_sorted, seg_bounds)
+
+    scale_factor = None
+    if slope_scaling and is_datetime:
+        scale_factor = _get_slope_scaling_factor(slope_scaling)
+
+    results = []
+    for k, (win_start, win_end, seed) in enumerate(window_list):
+        i0, i1 = starts[k], ends[k]
+        x_w = x_sorted[i0:i1]
+        t_w = t_sorted[i0:i1]
+        n_w = i1 - i0
+        s, var_s, tau = s_all[k], var_all[k], tau_all[k]
+
+        with _Diagnostics() as diagnostics:
+            tier_info = detect_size_tier(n_w, user_mode=large_dataset_mode)
+            for msg in tier_info['warnings']:
+                _report(msg)
+
+            z = _z_score(s, var_s)
+            p, h, trend = _p_value(z, alpha, continuous_confidence=continuous_confidence)
+            C, Cd = _mk_probability(p, s)
+
+            # Uncensored data: the CI variance equals the test variance
+            total_pairs = None if sens_slope_method == 'ats' else n_w * (n_w - 1) // 2
+            window_max_pairs = max_pairs if max_pairs else tier_info['max_pairs']
+            seg_a = int(np.searchsorted(seg_bounds, i0))
+            seg_b = int(np.searchsorted(seg_bounds, i1))
+
+            if (window_max_pairs is None and n_w * (n_w - 1) // 2 <= 100000
+                    and seg_b - seg_a <= _MAX_SLOPE_SEGMENTS):
+                # Same exact slope set as `_sens_estimator_adaptive`, from cached blocks
+                slope, lower_ci, upper_ci = _window_slope_stats(
+                    slope_blocks.window_blocks(seg_a, seg_b), var_s, alpha,
+                    ci_method=ci_method, total_pairs=total_pairs
+                )
+            else:
+                slopes = _sens_estimator_adaptive(
+                    x_w, t_w, max_pairs=window_max_pairs, random_state=seed
+                )
+                slope = np.nanmedian(slopes) if len(slopes) > 0 else np.nan
+                lower_ci, upper_ci = _confidence_intervals(
+                    slopes, var_s, alpha, method=ci_method, total_pairs=total_pairs
+                )
+
+            intercept = np.nan
+            if not np.isnan(slope):
+                intercept = np.nanmedian(x_w) - np.nanmedian(t_w) * slope
+
+            scaled_slope, scaled_lower_ci, scaled_upper_ci = slope, lower_ci, upper_ci
+            if slope_scaling and pd.notna(slope):
+                if is_datetime:
+                    scaled_slope = slope * scale_factor
+                    scaled_lower_ci = lower_ci * scale_factor
+                    scaled_upper_ci = upper_ci * scale_factor
+                else:
+                    _report(
+                        "Cannot apply `slope_scaling` to a numeric (non-datetime) "
+                        "time vector `t`. The slope's unit is inherited from `t`."
+                    )
+
+        window_warnings = diagnostics.messages
+
+        if continuous_confidence:
+            classification = classify_trend(
+                _WindowTrend(trend=trend, C=C), category_map=category_map
+            )
+        else:
+            classification = trend.title() if trend != 'no trend' else 'No Trend'
+
+        if is_datetime:
+            win_center = win_start + (win_end - win_start) / 2
+        else:
+            win_center = (win_start + win_end) / 2
+
+        results.append({
+            'window_start': win_start,
+            'window_end': win_end,
+            'window_center': win_center,
+            'n_obs': int(n_w),
+            'slope': scaled_slope,
+            'lower_ci': scaled_lower_ci,
+            'upper_ci': scaled_upper_ci,
+            'p_value': p,
+            'h': h,
+            'classification': classification,
+            'C': C,
+            'Cd': Cd,
+            'tau': tau,
+            's': s,
+            'intercept': intercept,
+            'slope_per_second': slope,
+            'lower_ci_per_second': lower_ci,
+            'upper_ci_per_second': upper_ci,
+            'scaled_slope': scaled_slope,
+            'scaled_lower_ci': scaled_lower_ci,
+            'scaled_upper_ci': scaled_upper_ci,
+            'warnings': window_warnings
+        })
 
     return pd.DataFrame(results)
 
 
+def _sorted_time_index(t_series, is_datetime):
+    """
+    Sorts the (non-missing) time values once so windows can be located by bisection.
+
+    Args:
+        t_series (Union[pd.Series, pd.DatetimeIndex]): Time values.
+        is_datetime (bool): Whether the time series is datetime-like.
+
+    Returns:
+        tuple: (t_sorted, order, is_sorted) where `t_sorted` supports
+        `searchsorted`, `order` maps sorted positions back to original
+        positions, and `is_sorted` is True when `order` is the identity.
+    """
+    if is_datetime:
+        t_index = pd.DatetimeIndex(t_series)
+        valid = ~np.asarray(t_index.isna())
+    else:
+        t_index = np.asarray(t_series, dtype=float)
+        valid = ~np.isnan(t_index)
+
+    positions = np.flatnonzero(valid)
+    valid_values = t_index[positions]
+    order_valid = np.argsort(np.asarray(valid_values), kind='stable')
+    order = positions[order_valid]
+    t_sorted = valid_values[order_valid]
+    is_sorted = len(order) == len(t_index) and bool(np.all(order == np.arange(len(order))))
+    return t_sorted, order, is_sorted
+
+
+def _window_indices(t_sorted, order, is_sorted, win_start, win_end):
+    """
+    Positions of the observations with win_start <= t < win_end.
+
+    Returns a contiguous slice when the time vector is already sorted, otherwise
+    an ascending array of positions (the same selection and order as a boolean
+    mask over the original data).
+    """
+    i0 = int(t_sorted.searchsorted(win_start, side='left'))
+    i1 = int(t_sorted.searchsorted(win_end, side='left'))
+    if is_sorted:
+        return slice(i0, i1)
+    return np.sort(order[i0:i1])
+
+
 def _generate_windows(t_series, window_size, step_size, is_datetime):
     """
-    Generate sliding window boundaries.
+    Generate sliding window boundaries lazily.
 
     Args:
         t_series (pd.Series): Time series.
@@ -279,50 +668,36 @@ def _generate_windows(t_series, window_size, step_size, is_datetime):
         step_size (Union[float, pd.Timedelta, pd.DateOffset]): Step size.
         is_datetime (bool): Whether the time series is datetime-like.
 
-    Returns:
-        list: List of tuples (window_start, window_end).
+    Yields:
+        tuple: (window_start, window_end) for each window.
     """
-    windows = []
-
     if len(t_series) == 0:
-        return windows
+        return
 
     t_min = t_series.min()
     t_max = t_series.max()
 
     if not is_datetime:
-         # Reduce floating point accumulation error for numeric data
-         # Calculate number of steps
-         try:
-            n_steps = int((t_max - t_min) / step_size) + 2 # Add buffer
-         except (ValueError, TypeError, ZeroDivisionError):
-             # Catch potential overflow or invalid step sizes
-            n_steps = 10000
-
-         for i in range(n_steps):
+        if not step_size > 0:
+            raise ValueError("`step` must be positive.")
+        # Multiply rather than accumulate to avoid floating point drift
+        i = 0
+        while True:
             current = t_min + i * step_size
             if current > t_max:
                 break
-            win_end = current + window_size
-            windows.append((current, win_end))
-
-            if len(windows) > 10000:
-                warnings.warn("Too many windows generated. Check window/step sizes.", UserWarning)
-                return []
+            yield (current, current + window_size)
+            i += 1
     else:
         # Datetime uses Timedelta/Offset which is robust to accumulation usually
         # because it operates on calendar logic or fixed integers (nanoseconds)
         current = t_min
         while current <= t_max:
-            win_end = current + window_size
-            windows.append((current, win_end))
-            current += step_size
-
-            if len(windows) > 10000:
-                warnings.warn("Too many windows generated. Check window/step sizes.", UserWarning)
-                return []
-
-    return windows
+            yield (current, current + window_size)
+            next_start = current + step_size
+            if next_start <= current:
+                raise ValueError("`step` must be positive.")
+            current = next_start
 
 
 def compare_periods(
@@ -330,6 +705,8 @@ def compare_periods(
     seasonal: bool = False,
     period: int = 12,
     season_type: str = 'month',
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
     **kwargs
 ):
     """
@@ -343,6 +720,10 @@ def compare_periods(
         seasonal (bool): If True, uses `seasonal_trend_test` instead of `trend_test`.
         period (int): The seasonal period (e.g., 12 for monthly data). Used if seasonal=True.
         season_type (str): The type of seasonality (e.g., 'month'). Used if seasonal=True.
+        n_jobs (Optional[int]): If greater than 1 (or -1 for all CPUs), the two periods
+            are tested in separate processes.
+        executor (Optional[concurrent.futures.Executor]): An existing executor to run the
+            two tests on. Takes precedence over `n_jobs` and is not shut down.
         **kwargs: Additional arguments for `trend_test` or `seasonal_trend_test`.
 
     Returns:
@@ -380,16 +761,27 @@ def compare_periods(
     if seasonal:
         if 'min_size' in common_kwargs:
              del common_kwargs['min_size']
+        common_kwargs.update(period=period, season_type=season_type)
 
-        result_before = seasonal_trend_test(
-            x=x_before, t=t_before, period=period, season_type=season_type, **common_kwargs
-        )
-        result_after = seasonal_trend_test(
-            x=x_after, t=t_after, period=period, season_type=season_type, **common_kwargs
-        )
+    if executor is not None or _resolve_n_jobs(n_jobs) > 1:
+        payloads = [(x_before, t_before, seasonal, common_kwargs),
+                    (x_after, t_after, seasonal, common_kwargs)]
+        if executor is not None:
+            outputs = list(executor.map(_compare_period_task, payloads))
+        else:
+            with _executor(min(_resolve_n_jobs(n_jobs), 2)) as ex:
+                outputs = list(ex.map(_compare_period_task, payloads))
+
+        period_results = []
+        for name, fields, values, records in outputs:
+            _replay(records)
+            # Result types are created per call, so rebuild them in this process
+            period_results.append(namedtuple(name, fields)(*values))
+        result_before, result_after = period_results
     else:
-        result_before = trend_test(x=x_before, t=t_before, **common_kwargs)
-        result_after = trend_test(x=x_after, t=t_after, **common_kwargs)
+        test = seasonal_trend_test if seasonal else trend_test
+        result_before = test(x=x_before, t=t_before, **common_kwargs)
+        result_after = test(x=x_after, t=t_after, **common_kwargs)
 
     slope_diff = result_after.slope - result_before.slope
 
@@ -411,3 +803,17 @@ def compare_periods(
         'significant_change': significant_change,
         'breakpoint': breakpoint
     }
+
+
+def _compare_period_task(payload):
+    """
+    Worker entry point for `compare_periods`: tests one period.
+
+    Returns the result as (type name, fields, values, diagnostics) because
+    the result namedtuple types cannot be pickled by reference.
+    """
+    x_period, t_period, seasonal, test_kwargs = payload
+    test = seasonal_trend_test if seasonal else trend_test
+    with _Diagnostics(propagate=False) as diagnostics:
+        result = test(x=x_period, t=t_period, **test_kwargs)
+    return type(result).__name__, result._fields, tuple(result), diagnostics.records
@@ -6,26 +6,87 @@ from collections import namedtuple
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
-import warnings
 import hashlib
 from scipy.stats import norm
 from ._stats import (_z_score, _p_value,
-                   _sens_estimator_unequal_spacing, _confidence_intervals,
-                   _mk_probability, _mk_score_and_var_censored,
-                   _sens_estimator_censored, _sen_probability,
+                   _sens_estimator_unequal_spacing,
+                   _mk_probability, _seasonal_mk_scores,
+                   _sens_estimator_censored,
                    _sens_estimator_adaptive, _sens_estimator_censored_adaptive)
+from ._order_stats import _SortedBlocks, _slope_summary
 from ._ats import ats_slope, seasonal_ats_slope
-from ._datetime import (_get_season_func, _get_cycle_identifier, _get_time_ranks, _infer_period)
-from ._helpers import (_prepare_data, _aggregate_by_group, _value_for_time_increment)
+from ._datetime import (_get_season_func, _season_and_cycle, _infer_period)
+from ._helpers import _prepare_data, _group_codes, _aggregate_groups, _time_increment_rows
 from ._large_dataset import detect_size_tier
-from .plotting import plot_trend, plot_residuals
 from .analysis_notes import get_analysis_note, get_sens_slope_analysis_note
 from .classification import classify_trend
 from ._surrogate import surrogate_test, SurrogateResult
+from ._diagnostics import _Diagnostics, _report
+from ._parallel import _map_ordered, _resolve_n_jobs
 
 
+from concurrent.futures import Executor
 from typing import Union, Optional
 
+
+def _season_slopes_task(payload):
+    """
+    Worker entry point: the pairwise Sen's slopes of one season.
+    """
+    season_x, season_t, season_censored, season_cen_type, options = payload
+    if np.any(season_censored):
+        return _sens_estimator_censored_adaptive(
+            season_x, season_t, season_cen_type,
+            lt_mult=options['lt_mult'], gt_mult=options['gt_mult'], method=options['method'],
+            max_pairs=options['max_pairs'], random_state=options['random_state']
+        )
+    return _sens_estimator_adaptive(
+        season_x, season_t, max_pairs=options['max_pairs'], random_state=options['random_state']
+    )
+
+
+def _season_surrogate_task(kwargs):
+    """
+    Worker entry point: the surrogate test of one season.
+    """
+    return surrogate_test(**kwargs)
+
+
+def _combine_season_scores(scores):
+    """
+    Combines per-season scores from `_seasonal_mk_scores` into the seasonal totals.
+
+    Seasons are accumulated in order so the sums match a season-by-season loop.
+
+    Returns:
+        tuple: (S, var_S, sum of Tau * D, sum of D, total number of pairs),
+        where the Tau-weighted sums only include seasons with D > 0.
+    """
+    s, var_s, tau_weighted_sum, denom_sum, total_pairs = 0, 0, 0, 0, 0
+    for n, s_season, var_s_season, d_season, tau_season in zip(
+            scores.n, scores.s, scores.var_s, scores.d, scores.tau):
+        if n > 1:
+            s += s_season
+            var_s += var_s_season
+            if d_season > 0:
+                tau_weighted_sum += tau_season * d_season
+                denom_sum += d_season
+            total_pairs += int(n) * (int(n) - 1) // 2
+    return s, var_s, tau_weighted_sum, denom_sum, total_pairs
+
+
+def _season_rows(scores):
+    """
+    Maps each season to the positions of its rows, using the (season, t) order
+    computed by `_seasonal_mk_scores`.
+
+    The data are already in time order, so each season's rows are in the same
+    order as a `data['season'] == season` mask would give them.
+    """
+    bounds = np.r_[scores.starts, len(scores.order)]
+    return {season: scores.order[bounds[k]:bounds[k + 1]] for k, season in enumerate(scores.season)}
+
+
 def seasonal_trend_test(
     x: Union[np.ndarray, pd.DataFrame],
     t: np.ndarray,
@@ -59,7 +120,9 @@ def seasonal_trend_test(
     random_state: Optional[int] = None,
     surrogate_method: str = 'none',
     n_surrogates: int = 1000,
-    surrogate_kwargs: Optional[dict] = None
+    surrogate_kwargs: Optional[dict] = None,
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None
 ) -> namedtuple:
     """
     Seasonal Mann-Kendall trend test with Sen's slope for time series data.
@@ -71,8 +134,10 @@ def seasonal_trend_test(
 
     Key difference from trend_test:
         Seasonal tests require balanced representation across all seasons.
-        Fast mode uses stratified sampling to ensure each season contributes
-        proportionally to the final result.
+        By default every observation is used: S and its variance are computed
+        exactly per season (O(n log n) for large uncensored seasons), and fast
+        mode only samples pairs for Sen's slope. Stratified subsampling of
+        observations is available via `max_per_season`.
 
     Parameters
     ----------
@@ -88,9 +153,12 @@ def seasonal_trend_test(
         Higher values increase accuracy but also computation time.
 
     max_per_season : int, optional
-        In fast mode, maximum observations to use per season. Default is 1000.
+        Opt-in stratified subsampling for large datasets (fast mode, n > 10,000):
+        each season is reduced to at most this many randomly chosen observations.
         Total dataset size after stratification approx max_per_season * n_seasons.
         Example: 12 months * 1000 obs/month = 12,000 total observations used.
+        Default None uses all observations, so the test statistic does not
+        depend on `random_state`.
 
     random_state : int, optional
         Random seed for reproducible results in fast mode. Set this for
@@ -107,6 +175,13 @@ def seasonal_trend_test(
     surrogate_kwargs : dict, optional
         Additional arguments passed to the surrogate test (e.g. {'dy': errors}).
 
+    n_jobs : int, optional
+        Runs the independent per-season stages (S and variance of censored or
+        large seasons, Sen's slopes and surrogate tests) in a process pool.
+        None or 1 runs serially; -1 uses all CPUs. Seeds are fixed per season
+        and results are combined in season order, so the output does not
+        depend on `n_jobs`.
+
     Args:
         x (Union[np.ndarray, pd.DataFrame]): A vector of data, which can be numeric or a pandas
             DataFrame from `prepare_censored_data`.
@@ -164,6 +239,11 @@ def seasonal_trend_test(
         max_pairs (int, optional): See Parameters section above.
         max_per_season (int, optional): See Parameters section above.
         random_state (int, optional): See Parameters section above.
+        n_jobs (int, optional): See Parameters section above.
+        executor (concurrent.futures.Executor, optional): An existing executor
+            (thread or process pool) to run the per-season stages on. Takes
+            precedence over `n_jobs` and is not shut down; pass one to reuse a
+            pool across stages and calls.
 
     Returns:
         namedtuple: A named tuple containing the results of the Seasonal Mann-Kendall test.
@@ -228,11 +308,13 @@ def seasonal_trend_test(
         # in this version. Block bootstrap is the recommended approach.
         raise ValueError(f"Invalid `autocorr_method` for seasonal test. Must be one of {valid_autocorr_methods}.")
 
+    # Validates `n_jobs` before any work is done
+    _resolve_n_jobs(n_jobs)
+
     analysis_notes = []
-    captured_warnings = []
 
-    with warnings.catch_warnings(record=True) as w_log:
-        warnings.simplefilter("always")
+    # Diagnostics reported by the kernels are collected for this call only
+    with _Diagnostics() as diagnostics:
 
         # Detect size tier before filtering
         n_raw = len(np.asarray(x) if not isinstance(x, pd.DataFrame) else x)
@@ -244,17 +326,14 @@ def seasonal_trend_test(
 
         # Add warnings from tier detection
         for w in tier_info['warnings']:
-            warnings.warn(w, UserWarning)
+            _report(w)
 
         data_filtered, is_datetime = _prepare_data(x, t, hicensor)
 
         # Ensure data is sorted by time. This is critical for:
         # 1. Correct application of censor rules in Sen's slope (which assume j > i implies t[j] > t[i]).
         # 2. Consistent results regardless of input order.
-        if is_datetime:
-            data_filtered = data_filtered.sort_values(by='t_original')
-        else:
-            data_filtered = data_filtered.sort_values(by='t')
+        data_filtered = data_filtered.sort_by_time(is_datetime)
 
         note = get_analysis_note(data_filtered, values_col='value', censored_col='censored')
         analysis_notes.append(note)
@@ -270,32 +349,29 @@ def seasonal_trend_test(
                 raise ValueError("The `period` parameter must be specified for numeric (non-datetime) time inputs.")
 
         if is_datetime:
-            season_func = _get_season_func(season_type, period)
+            # Validates season_type and period
+            _get_season_func(season_type, period)
 
         if len(data_filtered) < 2:
-            # Manually collect warnings before returning
-            for w in w_log:
-                 captured_warnings.append(str(w.message))
             return res('no trend', False, np.nan, 0, 0, 0, 0, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan,
                     'insufficient data', analysis_notes,
                     np.nan, np.nan, np.nan, 0, 0, 0, np.nan, np.nan, np.nan, np.nan, '',
-                    np.nan, np.nan, np.nan, np.nan, None, captured_warnings,
+                    np.nan, np.nan, np.nan, np.nan, None, diagnostics.messages,
                     'insufficient', None, None, None)
 
         # --- Aggregation Logic ---
         if agg_method != 'none':
             if is_datetime:
-                t_pd = pd.to_datetime(data_filtered['t_original'])
-                cycles = _get_cycle_identifier(t_pd, season_type)
-                seasons_agg = season_func(t_pd) if season_type != 'year' else np.ones(len(t_pd))
+                seasons_agg, cycles = _season_and_cycle(data_filtered.t_original, season_type)
+                if season_type == 'year':
+                    seasons_agg = np.ones(len(cycles))
             else:
                 # period is guaranteed to be not None here due to check above
-                t_numeric_agg = data_filtered['t'].to_numpy()
-                t_normalized = t_numeric_agg - t_numeric_agg[0]
+                t_normalized = data_filtered.t - data_filtered.t[0]
                 cycles = np.floor(t_normalized / period)
                 seasons_agg = np.floor(t_normalized % period)
-            data_filtered['cycle'] = cycles
-            data_filtered['season'] = seasons_agg
+            # Aggregate within each (cycle, season) group
+            group_codes = _group_codes(cycles, seasons_agg)
 
         if agg_method == 'lwp':
             # The 'lwp' method uses a specific aggregation that chooses one value per time increment.
@@ -309,42 +385,28 @@ def seasonal_trend_test(
             period_alias = SEASON_TO_OFFSET.get(season_type, 'M')
 
             # Handle numeric data conversion if needed
-            # We ensure t_original is datetime-like for the helper function
+            # We ensure t_original is datetime-like for the period logic
             if not is_datetime:
-                 data_filtered['t_original'] = pd.to_datetime(data_filtered['t_original'], unit='s', origin='unix')
+                data_filtered.t_original = pd.to_datetime(data_filtered.t_original, unit='s', origin='unix').to_numpy()
 
-            # Construct group key from the cycle/season columns calculated above
-            # This matches the (cycle, season) grouping used for other methods
-            group_key = pd.Series(list(zip(data_filtered['cycle'], data_filtered['season'])), index=data_filtered.index)
-
-            data_filtered = _value_for_time_increment(data_filtered, group_key, period_alias)
+            data_filtered = data_filtered.take(
+                _time_increment_rows(data_filtered.t_original, group_codes, period_alias))
 
         elif agg_method != 'none':
-            if data_filtered['censored'].any() and agg_method not in ['robust_median', 'lwp']:
+            if data_filtered.censored.any() and agg_method not in ['robust_median', 'lwp']:
                  analysis_notes.append(
                     f"WARNING: '{agg_method}' aggregation with censored data may produce "
                     f"biased results. Consider using agg_method='robust_median'."
                 )
 
-            # We reuse the cycle/season calculation from the initial block
-            # Only recalculate if explicitly needed, but here we can just use the existing columns.
-            # However, to be safe and match previous logic strictly,
-            # we will use the columns we just set.
-
-            data_filtered['season_agg'] = data_filtered['season']
-
-            agg_data_list = [
-                _aggregate_by_group(group, agg_method, is_datetime)
-                for _, group in data_filtered.groupby(['cycle', 'season_agg'])
-            ]
-            data_filtered = pd.concat(agg_data_list, ignore_index=True)
+            data_filtered = _aggregate_groups(data_filtered, group_codes, agg_method, is_datetime)
 
+        # Season and cycle bookkeeping is done on a DataFrame
+        data_filtered = data_filtered.to_frame()
 
         # --- Trend Analysis ---
         if is_datetime and season_type != 'year':
-            t_pd = pd.to_datetime(data_filtered['t_original'])
-            seasons = season_func(t_pd)
-            cycles = _get_cycle_identifier(t_pd, season_type)
+            seasons, cycles = _season_and_cycle(data_filtered['t_original'], season_type)
             season_range = np.unique(seasons)
         elif not is_datetime:
             # period is guaranteed to be not None here
@@ -354,7 +416,7 @@ def seasonal_trend_test(
             season_range = range(int(period))
         else: # is_datetime and season_type == 'year'
             seasons = np.ones(len(data_filtered))
-            cycles = _get_cycle_identifier(pd.to_datetime(data_filtered['t_original']), season_type) if is_datetime else np.zeros(len(data_filtered))
+            _, cycles = _season_and_cycle(data_filtered['t_original'], season_type)
             season_range = [1]
 
 
@@ -368,12 +430,14 @@ def seasonal_trend_test(
             user_mode=large_dataset_mode
         )
 
-        # SEASONAL-SPECIFIC: Stratified sampling if needed
-        # We check if tier is fast (2) or aggregate (3) which defaults to fast if not aggregated yet
-        if tier_info_filtered['tier'] >= 2 and n_filtered > 10000 and sens_slope_method != 'ats':
+        # SEASONAL-SPECIFIC: Opt-in stratified sampling
+        # We check if tier is fast (2) or aggregate (3) which defaults to fast if not aggregated yet.
+        # Without `max_per_season`, all observations are scored exactly.
+        if (max_per_season is not None and tier_info_filtered['tier'] >= 2
+                and n_filtered > 10000 and sens_slope_method != 'ats'):
              from ._large_dataset import stratified_seasonal_sampling
 
-             max_per_season_val = max_per_season if max_per_season else 1000
+             max_per_season_val = max_per_season
 
              # Only stratify if we are actually above the effective threshold
              # Check if any season is huge
@@ -422,22 +486,16 @@ def seasonal_trend_test(
             # 4. Construct distribution of S
 
             unique_cycles = data_filtered['cycle'].unique()
-            n_cycles = len(unique_cycles)
 
-            # Calculate observed S
-            s_obs = 0
-            for i in season_range:
-                season_mask = data_filtered['season'] == i
-                season_data = data_filtered[season_mask]
-                n = len(season_data)
-                if n > 1:
-                    s_i, _, _, _ = _mk_score_and_var_censored(
-                        season_data['value'], season_data['t'], season_data['censored'],
-                        season_data['cen_type'], tau_method=tau_method, mk_test_method=mk_test_method,
-                        tie_break_method=tie_break_method
-                    )
-                    s_obs += s_i
-                    total_possible_pairs += n * (n - 1) // 2
+            # Calculate observed S (and the analytic components used for Tau)
+            season_scores = _seasonal_mk_scores(
+                data_filtered['value'], data_filtered['t'], data_filtered['censored'],
+                data_filtered['cen_type'], data_filtered['season'], tau_method=tau_method,
+                mk_test_method=mk_test_method, tie_break_method=tie_break_method,
+                n_jobs=n_jobs, executor=executor
+            )
+            s_obs, var_s_analytic, tau_weighted_sum, denom_sum, total_possible_pairs = \
+                _combine_season_scores(season_scores)
 
             # Bootstrap
             s_boot_dist = np.zeros(n_bootstrap)
@@ -537,18 +595,13 @@ def seasonal_trend_test(
                 # Create synthetic time index
                 boot_data['t_boot'] = np.arange(len(boot_data))
 
-                s_b = 0
-                for i_season in season_range:
-                    mask = boot_data['season'] == i_season
-                    subset = boot_data[mask]
-                    if len(subset) > 1:
-                        s_i, _, _, _ = _mk_score_and_var_censored(
-                            subset['value'], subset['t_boot'], subset['censored'],
-                            subset['cen_type'], tau_method=tau_method, mk_test_method=mk_test_method,
-                            tie_break_method=tie_break_method
-                        )
-                        s_b += s_i
-                s_boot_dist[b] = s_b
+                boot_scores = _seasonal_mk_scores(
+                    boot_data['value'], boot_data['t_boot'], boot_data['censored'],
+                    boot_data['cen_type'], boot_data['season'], tau_method=tau_method,
+                    mk_test_method=mk_test_method, tie_break_method=tie_break_method,
+                    calc_var=False
+                )
+                s_boot_dist[b] = _combine_season_scores(boot_scores)[0]
 
             # Calculate P-value
             p_boot = np.mean(np.abs(s_boot_dist) >= np.abs(s_obs))
@@ -564,55 +617,26 @@ def seasonal_trend_test(
             # Use empirical variance from bootstrap distribution
             var_s = np.var(s_boot_dist, ddof=1)
 
-            # For reference (and for Tau calc), we still need the analytic components
-            # although var_s will be overwritten by the bootstrap estimate above.
-            s_analytic, var_s_analytic, denom = 0, 0, 0
-            tau_weighted_sum = 0
-            denom_sum = 0
-            for i in season_range:
-                season_mask = data_filtered['season'] == i
-                season_data = data_filtered[season_mask]
-                n = len(season_data)
-                if n > 1:
-                    _, var_s_season, d_season, tau_season = _mk_score_and_var_censored(
-                        season_data['value'], season_data['t'], season_data['censored'],
-                        season_data['cen_type'], tau_method=tau_method, mk_test_method=mk_test_method,
-                        tie_break_method=tie_break_method
-                    )
-                    var_s_analytic += var_s_season
-                    if d_season > 0:
-                        tau_weighted_sum += tau_season * d_season
-                        denom_sum += d_season
+            # The analytic components (computed with the observed S above) are kept
+            # for Tau, although var_s is overwritten by the bootstrap estimate.
 
         # --- Standard Analytic Calculation ---
         else:
-            s, var_s, denom = 0, 0, 0
-            all_slopes = []
-            seasonal_slopes = []
-            tau_weighted_sum = 0
-            denom_sum = 0
             sens_slope_notes = set()
-            total_possible_pairs = 0
 
-            for i in season_range:
-                season_mask = data_filtered['season'] == i
-                season_data = data_filtered[season_mask]
-                n = len(season_data)
-
-                if n > 1:
-                    s_season, var_s_season, d_season, tau_season = _mk_score_and_var_censored(
-                        season_data['value'], season_data['t'], season_data['censored'],
-                        season_data['cen_type'], tau_method=tau_method, mk_test_method=mk_test_method,
-                        tie_break_method=tie_break_method
-                    )
-                    s += s_season
-                    var_s += var_s_season
-                    if d_season > 0:
-                        tau_weighted_sum += tau_season * d_season
-                        denom_sum += d_season
+            # All seasons are scored in one grouped pass
+            season_scores = _seasonal_mk_scores(
+                data_filtered['value'], data_filtered['t'], data_filtered['censored'],
+                data_filtered['cen_type'], data_filtered['season'], tau_method=tau_method,
+                mk_test_method=mk_test_method, tie_break_method=tie_break_method,
+                n_jobs=n_jobs, executor=executor
+            )
+            s, var_s, tau_weighted_sum, denom_sum, total_possible_pairs = \
+                _combine_season_scores(season_scores)
 
-                    # Accumulate total pairs for CI scaling
-                    total_possible_pairs += n * (n - 1) // 2
+        # Row positions of each season, shared by the surrogate and slope loops
+        season_rows = _season_rows(season_scores)
+        no_rows = np.zeros(0, dtype=np.intp)
 
         # --- Surrogate Test Integration ---
         surrogate_result = None
@@ -622,11 +646,10 @@ def seasonal_trend_test(
             is_slow_mk = mk_test_method == 'lwp'
 
             if is_large_fast and is_slow_mk and n_surrogates > 100:
-                warnings.warn(
+                _report(
                     "Performance Warning: Large dataset detected with `mk_test_method='lwp'`. "
                     f"Surrogate testing ({n_surrogates} runs) will be very slow (O(N^2)). "
-                    "Consider setting `mk_test_method='robust'` to enable O(N log N) optimization.",
-                    UserWarning
+                    "Consider setting `mk_test_method='robust'` to enable O(N log N) optimization."
                 )
                 analysis_notes.append("Slow surrogate test (suggest mk_test_method='robust')")
 
@@ -717,9 +740,11 @@ def seasonal_trend_test(
                     season_seeds[s_id] = seed_val
 
             # Iterate over seasons
+            surrogate_seasons = []
+            surrogate_payloads = []
             for i in season_range:
-                season_mask = data_filtered['season'] == i
-                season_data = data_filtered[season_mask]
+                rows = season_rows.get(i, no_rows)
+                season_data = data_filtered.iloc[rows]
                 n = len(season_data)
 
                 if n > 1:
@@ -754,10 +779,10 @@ def seasonal_trend_test(
                                             # Filter NaNs then season
                                             if isinstance(v, (pd.Series, pd.DataFrame)):
                                                 v_filt = v[mask_x_to_filtered]
-                                                kwargs_season[k] = v_filt[season_mask.values if hasattr(season_mask, 'values') else season_mask]
+                                                kwargs_season[k] = v_filt.iloc[rows]
                                             else:
                                                 v_filt = np.asarray(v)[mask_x_to_filtered]
-                                                kwargs_season[k] = v_filt[season_mask]
+                                                kwargs_season[k] = v_filt[rows]
                                        else:
                                             kwargs_season[k] = v
                                   else:
@@ -771,9 +796,9 @@ def seasonal_trend_test(
                              # Case 2: Kwarg matches FILTERED data length (len(data_filtered))
                              elif v_len == n_current_filtered:
                                   if isinstance(v, (pd.Series, pd.DataFrame)):
-                                      kwargs_season[k] = v[season_mask.values if hasattr(season_mask, 'values') else season_mask]
+                                      kwargs_season[k] = v.iloc[rows]
                                   else:
-                                      kwargs_season[k] = np.asarray(v)[season_mask]
+                                      kwargs_season[k] = np.asarray(v)[rows]
                              else:
                                   # Length mismatch
                                   kwargs_season[k] = v
@@ -793,8 +818,9 @@ def seasonal_trend_test(
                     # Determine seed for this season (Issue #3)
                     current_seed = season_seeds.get(i) if random_state is not None else None
 
-                    # Run surrogate test for this season
-                    res_season = surrogate_test(
+                    # Surrogate test arguments for this season
+                    surrogate_seasons.append(i)
+                    surrogate_payloads.append(dict(
                         x=season_data['value'],
                         t=season_data['t'],
                         censored=season_data['censored'],
@@ -808,20 +834,26 @@ def seasonal_trend_test(
                         lt_mult=lt_mult,
                         gt_mult=gt_mult,
                         **kwargs_season
-                    )
+                    ))
 
-                    # Validate surrogate result length (Issue #4)
-                    if len(res_season.surrogate_scores) != n_surrogates:
-                        raise RuntimeError(
-                            f"Surrogate generation failed for season {i}: "
-                            f"Expected {n_surrogates} scores, got {len(res_season.surrogate_scores)}."
-                        )
+            # Seasons are independent: run them (in parallel if requested) and
+            # aggregate in season order so the result does not depend on n_jobs
+            season_results = _map_ordered(
+                _season_surrogate_task, surrogate_payloads, n_jobs=n_jobs, executor=executor
+            )
+            for i, res_season in zip(surrogate_seasons, season_results):
+                # Validate surrogate result length (Issue #4)
+                if len(res_season.surrogate_scores) != n_surrogates:
+                    raise RuntimeError(
+                        f"Surrogate generation failed for season {i}: "
+                        f"Expected {n_surrogates} scores, got {len(res_season.surrogate_scores)}."
+                    )
 
-                    total_surrogate_scores += res_season.surrogate_scores
-                    if res_season.notes:
-                        for note in res_season.notes:
-                            if note is not None and note not in surrogate_notes:
-                                surrogate_notes.append(note)
+                total_surrogate_scores += res_season.surrogate_scores
+                if res_season.notes:
+                    for note in res_season.notes:
+                        if note is not None and note not in surrogate_notes:
+                            surrogate_notes.append(note)
 
             # Aggregate results
             # Calculate p-value for the seasonal S
@@ -852,22 +884,14 @@ def seasonal_trend_test(
 
         # LWP-TRENDS Compatibility Mode:
         if ci_method == 'lwp':
-            var_s_ci_accum = 0
-            for i in season_range:
-                season_mask = slope_data['season'] == i
-                season_data = slope_data[season_mask]
-                n = len(season_data)
-                if n > 1:
-                    season_censored = np.zeros_like(season_data['censored'], dtype=bool)
-                    season_cen_type = np.full_like(season_data['cen_type'], 'not')
-
-                    _, var_s_unc, _, _ = _mk_score_and_var_censored(
-                        season_data['value'], season_data['t'], season_censored,
-                        season_cen_type, tau_method=tau_method, mk_test_method=mk_test_method,
-                        tie_break_method=tie_break_method
-                    )
-                    var_s_ci_accum += var_s_unc
-            var_s_for_ci = var_s_ci_accum
+            # Variance of S as if the data were uncensored
+            unc_scores = _seasonal_mk_scores(
+                slope_data['value'], slope_data['t'], np.zeros(len(slope_data), dtype=bool),
+                np.full(len(slope_data), 'not'), slope_data['season'], tau_method=tau_method,
+                mk_test_method=mk_test_method, tie_break_method=tie_break_method,
+                n_jobs=n_jobs, executor=executor
+            )
+            var_s_for_ci = _combine_season_scores(unc_scores)[1]
 
         if sens_slope_method == 'ats':
             # Use Stratified ATS: Sum of within-season scores.
@@ -890,59 +914,48 @@ def seasonal_trend_test(
                 sens_slope_notes.update(overall_ats['notes'])
 
         else: # For 'lwp' or 'unbiased' (nan) methods
-            all_slopes = []
+            # Each season's slopes are kept as a sorted block; the pooled
+            # median and confidence limits are selected across the blocks.
+            slope_pool = _SortedBlocks()
             sens_slope_notes = set()
+            slope_payloads = []
             for i in season_range:
-                season_mask = slope_data['season'] == i
-                season_data = slope_data[season_mask]
+                season_data = slope_data.iloc[season_rows.get(i, no_rows)]
                 n = len(season_data)
                 if n > 1:
-                    season_x = season_data['value'].to_numpy()
-                    season_t = season_data['t'].to_numpy()
-                    season_censored = season_data['censored'].to_numpy()
-                    season_cen_type = season_data['cen_type'].to_numpy()
-                    if np.any(season_censored):
-                        slopes = _sens_estimator_censored_adaptive(
-                            season_x, season_t, season_cen_type,
-                            lt_mult=lt_mult, gt_mult=gt_mult, method=sens_slope_method,
-                            max_pairs=max_pairs if max_pairs else tier_info_filtered['max_pairs'],
-                            random_state=random_state
-                        )
-                    else:
-                        slopes = _sens_estimator_adaptive(
-                            season_x, season_t,
-                            max_pairs=max_pairs if max_pairs else tier_info_filtered['max_pairs'],
-                            random_state=random_state
-                        )
-                    note = get_sens_slope_analysis_note(slopes, season_t, season_cen_type)
-                    if note != "ok":
-                        sens_slope_notes.add(note)
-                    all_slopes.extend(slopes)
+                    slope_payloads.append((
+                        season_data['value'].to_numpy(), season_data['t'].to_numpy(),
+                        season_data['censored'].to_numpy(), season_data['cen_type'].to_numpy(),
+                        dict(lt_mult=lt_mult, gt_mult=gt_mult, method=sens_slope_method,
+                             max_pairs=max_pairs if max_pairs else tier_info_filtered['max_pairs'],
+                             random_state=random_state)
+                    ))
+
+            season_slopes = _map_ordered(
+                _season_slopes_task, slope_payloads, n_jobs=n_jobs, executor=executor
+            )
+            for (_, season_t, _, season_cen_type, _), slopes in zip(slope_payloads, season_slopes):
+                note = get_sens_slope_analysis_note(slopes, season_t, season_cen_type)
+                if note != "ok":
+                    sens_slope_notes.add(note)
+                slope_pool.add(slopes)
 
             if sens_slope_notes:
                 analysis_notes.extend(list(sens_slope_notes))
 
-            if not all_slopes:
-                slope, intercept, lower_ci, upper_ci = np.nan, np.nan, np.nan, np.nan
-                sen_prob, sen_prob_max, sen_prob_min = np.nan, np.nan, np.nan
-            else:
-                all_slopes_arr = np.asarray(all_slopes)
-                slope = np.nanmedian(all_slopes_arr)
-                intercept = np.nanmedian(data_filtered['value']) - np.nanmedian(data_filtered['t']) * slope if pd.notna(slope) else np.nan
-
-                # Pass total_possible_pairs (accumulated from seasons) to correctly scale ranks
-                # when all_slopes_arr contains a subsample of slopes.
-                # If block_bootstrap was used, total_possible_pairs is not calculated above,
-                # but this block is under `else` of block_bootstrap (or inside it but we are in the main else block here).
-                # Wait, the total_possible_pairs calculation was inside the `else` (Standard Analytic) block.
-                # So it is available here.
-
-                lower_ci, upper_ci = _confidence_intervals(
-                    all_slopes_arr, var_s_for_ci, alpha, method=ci_method, total_pairs=total_possible_pairs
-                )
-                sen_prob, sen_prob_max, sen_prob_min = _sen_probability(
-                    all_slopes_arr, var_s_for_ci, total_pairs=total_possible_pairs
-                )
+            # Pass total_possible_pairs (accumulated from seasons) to correctly scale ranks
+            # when the pool contains a subsample of slopes.
+            slope_stats = _slope_summary(
+                slope_pool, var_s_for_ci, alpha, ci_method=ci_method,
+                total_pairs=total_possible_pairs, probability=True,
+                quartiles=tier_info_filtered['strategy'] == 'fast'
+            )
+            slope = slope_stats['slope']
+            intercept = np.nanmedian(data_filtered['value']) - np.nanmedian(data_filtered['t']) * slope if pd.notna(slope) else np.nan
+            lower_ci, upper_ci = slope_stats['lower_ci'], slope_stats['upper_ci']
+            sen_prob = slope_stats['sen_prob']
+            sen_prob_max = slope_stats['sen_prob_max']
+            sen_prob_min = slope_stats['sen_prob_min']
 
         if sens_slope_notes:
             analysis_notes.extend(list(sens_slope_notes))
@@ -973,12 +986,11 @@ def seasonal_trend_test(
 
         # Determine pairs used and approx error if applicable
         if computation_mode == 'fast' and sens_slope_method != 'ats':
-             # Note: For seasonal, this is tricky because we accumulate slopes list
-             # If we used adaptive slope estimation
-             if 'all_slopes_arr' in locals() and len(all_slopes_arr) > 0:
-                 pairs_used = len(all_slopes_arr)
+             # Pairs used are the pooled slopes over all seasons
+             pairs_used = slope_pool.n + slope_pool.n_nan
+             if pairs_used > 0:
                  # Estimate approximation error (IQR / sqrt(K))
-                 iqr = np.percentile(all_slopes_arr, 75) - np.percentile(all_slopes_arr, 25)
+                 iqr = slope_stats['q75'] - slope_stats['q25']
                  approximation_error = 1.96 * iqr / np.sqrt(pairs_used)
              else:
                  pairs_used = None
@@ -1009,13 +1021,12 @@ def seasonal_trend_test(
 
                     slope_units = f"{x_unit} per {slope_scaling.lower()}"
                 except (ValueError, TypeError) as e:
-                    warnings.warn(f"Slope scaling failed: {e}", UserWarning)
+                    _report(f"Slope scaling failed: {e}")
                     slope_units = f"{x_unit} per second" # Fallback
             else:
-                warnings.warn(
+                _report(
                     "Cannot apply `slope_scaling` to a numeric (non-datetime) "
-                    "time vector `t`. The slope's unit is inherited from `t`.",
-                    UserWarning
+                    "time vector `t`. The slope's unit is inherited from `t`."
                 )
                 slope_units = f"{x_unit} per unit of t" # Clarify for numeric time
         elif is_datetime:
@@ -1023,13 +1034,8 @@ def seasonal_trend_test(
         else: # Numeric time without scaling
             slope_units = f"{x_unit} per unit of t"
 
-        # Collect warnings
-        seen_warnings = set()
-        for w in w_log:
-            w_str = str(w.message)
-            if w_str not in seen_warnings:
-                captured_warnings.append(w_str)
-                seen_warnings.add(w_str)
+    # Repeated messages (e.g. one per season) are reported once
+    captured_warnings = list(dict.fromkeys(diagnostics.messages))
 
     results = res(trend, h, p, z, Tau, s, var_s, scaled_slope, intercept, scaled_lower_ci, scaled_upper_ci, C, Cd,
                   '', [], sen_prob, sen_prob_max, sen_prob_min,
@@ -1050,9 +1056,9 @@ def seasonal_trend_test(
     final_notes = [note for note in analysis_notes if note != 'ok']
     final_results = results._replace(classification=classification, analysis_notes=final_notes)
 
-    # Re-issue warnings so they appear in stderr as well
-    for w_str in captured_warnings:
-        warnings.warn(w_str, UserWarning)
+    if plot_path or residual_plot_path:
+        # matplotlib is only loaded when a plot is requested
+        from .plotting import plot_trend, plot_residuals
 
     if plot_path:
         plot_trend(data_filtered, final_results, plot_path, alpha, seasonal_coloring=seasonal_coloring)
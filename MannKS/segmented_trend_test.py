@@ -8,6 +8,7 @@ from typing import Union, Optional, List, Tuple
 from ._segmented import HybridSegmentedTrend as _HybridSegmentedTrend
 from ._datetime import _to_numeric_time, _is_datetime_like
 from ._helpers import _get_slope_scaling_factor, _prepare_data
+from ._diagnostics import _Diagnostics, _report
 
 _Segmented_Trend_Test_Tuple = namedtuple('Segmented_Trend_Test', [
     'n_breakpoints', 'breakpoints', 'breakpoint_cis', 'segments',
@@ -141,26 +142,20 @@ def segmented_trend_test(
         and unscaled slope (units per second). If you wish to reconstruct the line using
         the scaled slope, you must adjust the time variable accordingly.
     """
-    # Capture warnings
-    captured_warnings = []
-
-    with warnings.catch_warnings(record=True) as w_log:
-        warnings.simplefilter("always")
+    # Diagnostics reported during this call are collected for this call only
+    with _Diagnostics() as diagnostics:
 
         # 1. Data Prep
         data_filtered, is_datetime = _prepare_data(x, t, hicensor)
-        data_filtered = data_filtered.sort_values('t')
+        data_filtered = data_filtered.sort_by_time(is_datetime=False)
 
-        x_val = data_filtered['value'].to_numpy()
-        t_numeric = data_filtered['t'].to_numpy()
-        censored = data_filtered['censored'].to_numpy()
-        cen_type = data_filtered['cen_type'].to_numpy()
+        x_val = data_filtered.value
+        t_numeric = data_filtered.t
+        censored = data_filtered.censored
+        cen_type = data_filtered.cen_type
 
         if len(x_val) < 2:
-            warnings.warn("Insufficient data for segmented analysis.", UserWarning)
-            # Collect warnings (including the one we just issued)
-            for w in w_log:
-                captured_warnings.append(str(w.message))
+            _report("Insufficient data for segmented analysis.")
 
             return SegmentedTrendResult(
                 n_breakpoints=0,
@@ -174,7 +169,7 @@ def segmented_trend_test(
                 selection_summary=None,
                 bootstrap_samples=None,
                 alpha=alpha,
-                warnings=captured_warnings,
+                warnings=diagnostics.messages,
                 computation_mode='insufficient'
             )
 
@@ -249,9 +244,9 @@ def segmented_trend_test(
                     segments_list['upper_ci'] *= factor
                     segments_list['slope_units'] = f"units per {slope_scaling}"
                 except Exception as e:
-                    warnings.warn(f"Slope scaling failed: {e}", UserWarning)
+                    _report(f"Slope scaling failed: {e}")
             else:
-                 warnings.warn("slope_scaling requires datetime inputs.", UserWarning)
+                 _report("slope_scaling requires datetime inputs.")
         elif not segments_list.empty:
              # Store raw slopes as per_second just in case plotting needs it
              segments_list['slope_per_second'] = segments_list['slope']
@@ -259,14 +254,6 @@ def segmented_trend_test(
              segments_list['upper_ci_per_second'] = segments_list['upper_ci']
              segments_list['slope_units'] = "units per second" if is_datetime else "units per time"
 
-        # Collect warnings
-        for w in w_log:
-            captured_warnings.append(str(w.message))
-
-    # Re-issue warnings if desired (optional, but polite since we suppressed them)
-    for w_str in captured_warnings:
-        warnings.warn(w_str, UserWarning)
-
     return SegmentedTrendResult(
         n_breakpoints=n_bp,
         breakpoints=breakpoints_final,
@@ -279,7 +266,7 @@ def segmented_trend_test(
         selection_summary=hybrid_model.selection_summary_,
         bootstrap_samples=hybrid_model.bootstrap_samples_,
         alpha=alpha,
-        warnings=captured_warnings,
+        warnings=diagnostics.messages,
         computation_mode='hybrid'
     )
 
@@ -5,7 +5,6 @@ and Sen's slope estimator to handle unequally spaced time series data.
 from collections import namedtuple
 import numpy as np
 import pandas as pd
-import warnings
 from scipy.stats import norm
 from ._stats import (_z_score, _p_value, _sens_estimator_unequal_spacing,
                      _confidence_intervals, _mk_probability,
@@ -13,12 +12,13 @@ from ._stats import (_z_score, _p_value, _sens_estimator_unequal_spacing,
                      _sen_probability, _sens_estimator_adaptive,
                      _sens_estimator_censored_adaptive)
 from ._ats import ats_slope
-from ._helpers import (_prepare_data, _aggregate_by_group, _value_for_time_increment, _preprocessing)
-from ._large_dataset import detect_size_tier
-from .plotting import plot_trend, plot_residuals
+from ._helpers import (_prepare_data, _preprocessing, _group_codes, _aggregate_groups,
+                       _time_increment_rows, _as_datetime_index)
+from ._large_dataset import detect_size_tier, select_aggregation_period
 from .analysis_notes import get_analysis_note, get_sens_slope_analysis_note
 from .classification import classify_trend
 from ._surrogate import surrogate_test
+from ._diagnostics import _Diagnostics, _report
 
 
 from typing import Union, Tuple, Optional
@@ -77,10 +77,13 @@ def trend_test(
        - Typical error (slope): < 0.5% of true slope.
        - Note: Censored data falls back to $O(N)$ memory / $O(N^2)$ time algorithm.
 
-    3. **Aggregate Mode (n > 50,000)**: Temporal aggregation recommended
-       - Use agg_method='median' or 'robust_median' with agg_period
-       - Reduces to manageable size before analysis
-       - Preserves long-term trend while reducing noise
+    3. **Aggregate Mode (n > 50,000)**: Automatic temporal aggregation
+       - If no aggregation is requested, datetime data are aggregated to
+         'robust_median' values of the finest period (day, week, month,
+         quarter or year) that leaves at most 5,000 values with good data
+         coverage; the choice is reported in `analysis_notes`
+       - Pass agg_method/agg_period to choose the aggregation yourself
+       - Falls back to Fast Mode for numeric `t` or if no period qualifies
 
     Parameters
     ----------
@@ -234,11 +237,8 @@ def trend_test(
 
     analysis_notes = []
 
-    # We will capture warnings from the main execution block
-    captured_warnings = []
-
-    with warnings.catch_warnings(record=True) as w_log:
-        warnings.simplefilter("always")  # Cause all warnings to always be triggered.
+    # Diagnostics reported by the kernels are collected for this call only
+    with _Diagnostics() as diagnostics:
 
         # --- EXECUTION BLOCK START ---
         # Detect size tier before filtering
@@ -251,15 +251,12 @@ def trend_test(
 
         # Add warnings from tier detection
         for w in tier_info['warnings']:
-            warnings.warn(w, UserWarning)
+            _report(w)
 
         data_filtered, is_datetime = _prepare_data(x, t, hicensor)
 
         # Ensure data is sorted by time for correct autocorrelation handling (bootstrap/surrogates)
-        if is_datetime:
-            data_filtered = data_filtered.sort_values(by='t_original')
-        else:
-            data_filtered = data_filtered.sort_values(by='t')
+        data_filtered = data_filtered.sort_by_time(is_datetime)
 
         note = get_analysis_note(data_filtered, values_col='value', censored_col='censored')
         analysis_notes.append(note)
@@ -268,19 +265,33 @@ def trend_test(
 
         # Sample size validation
         if n < 2:
-             # Manually collect warnings before returning
-            for w in w_log:
-                 captured_warnings.append(str(w.message))
-
             return res('no trend', False, np.nan, 0, 0, 0, 0, np.nan, np.nan,
                     np.nan, np.nan, np.nan, np.nan, 'insufficient data', analysis_notes,
                     np.nan, np.nan, np.nan, 0, 0, 0, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, '',
-                    np.nan, np.nan, None, captured_warnings,
+                    np.nan, np.nan, None, diagnostics.messages,
                     'insufficient', None, None, None)
 
         if min_size is not None and n < min_size:
             analysis_notes.append(f'sample size ({n}) below minimum ({min_size})')
 
+        # 'aggregate' strategy: choose a period and aggregate to robust medians,
+        # unless the user already asked for an aggregation
+        auto_aggregation = None
+        if tier_info['use_aggregation'] and agg_method == 'none' and agg_period is None:
+            if is_datetime:
+                auto_aggregation = select_aggregation_period(
+                    data_filtered.t_original,
+                    min_periods=max(min_size or 0, 10)
+                )
+                if auto_aggregation is not None:
+                    agg_method = 'robust_median'
+                    agg_period = auto_aggregation['agg_period']
+                else:
+                    analysis_notes.append('Automatic aggregation skipped: no period met the target '
+                                          'size with sufficient data coverage; using fast mode')
+            else:
+                analysis_notes.append('Automatic aggregation requires datetime `t`; using fast mode')
+
 
         # Handle tied timestamps and temporal aggregation
         lwp_methods = ['lwp', 'lwp_median', 'lwp_robust_median']
@@ -293,7 +304,6 @@ def trend_test(
                 raise ValueError(f"`agg_method='{agg_method}'` can only be used with datetime-like inputs for `t`.")
 
             # LWP aggregation selects one value per time period (e.g., year, month).
-            t_datetime = pd.to_datetime(data_filtered['t_original'])
             period_map = {
                 'year': 'Y', 'month': 'M', 'quarter': 'Q',
                 'week': 'W', 'day': 'D',
@@ -310,48 +320,42 @@ def trend_test(
                                 f"Must be one of {list(period_map.keys())}.")
 
             period_freq = period_map[effective_period]
-            group_key = t_datetime.dt.to_period(period_freq)
+            period_codes = _group_codes(_as_datetime_index(data_filtered.t_original).to_period(period_freq))
 
-            if data_filtered['censored'].any() and agg_method in ['median', 'lwp_median']:
+            if data_filtered.censored.any() and agg_method in ['median', 'lwp_median']:
                 analysis_notes.append(f"'{agg_method}' aggregation used with censored data")
 
             if agg_method == 'lwp':
-                data_filtered = _value_for_time_increment(data_filtered, group_key, period_freq)
+                data_filtered = data_filtered.take(
+                    _time_increment_rows(data_filtered.t_original, period_codes, period_freq))
             else:
                 # Map lwp_median -> median, lwp_robust_median -> robust_median for the helper
                 # For standard methods (e.g., 'median', 'mean') used with agg_period, use the method name directly.
                 helper_method = agg_method.replace('lwp_', '')
+                data_filtered = _aggregate_groups(data_filtered, period_codes, helper_method, is_datetime)
 
-                # Need to assign group key to the dataframe to use it in groupby
-                # We copy to avoid settingWithCopy warnings on the view
-                data_filtered = data_filtered.copy()
-                data_filtered['period_group'] = group_key
-
-                agg_data_list = [
-                    _aggregate_by_group(group, helper_method, is_datetime)
-                    for _, group in data_filtered.groupby('period_group')
-                ]
-                data_filtered = pd.concat(agg_data_list, ignore_index=True)
-                data_filtered = data_filtered.drop(columns=['period_group'], errors='ignore')
-
-        elif len(data_filtered['t']) != len(np.unique(data_filtered['t'])):
+        elif len(data_filtered.t) != len(np.unique(data_filtered.t)):
             if agg_method == 'none':
                 analysis_notes.append('tied timestamps present without aggregation')
             else:
                 # Standard aggregation for tied timestamps (exact matches).
-                if data_filtered['censored'].any() and agg_method not in ['robust_median']:
+                if data_filtered.censored.any() and agg_method not in ['robust_median']:
                     analysis_notes.append(f"'{agg_method}' aggregation used with censored data")
 
-                agg_data_list = [
-                    _aggregate_by_group(group, agg_method, is_datetime)
-                    for _, group in data_filtered.groupby('t')
-                ]
-                data_filtered = pd.concat(agg_data_list, ignore_index=True)
+                data_filtered = _aggregate_groups(
+                    data_filtered, _group_codes(data_filtered.t), agg_method, is_datetime)
 
-        x_filtered = data_filtered['value'].to_numpy()
-        t_filtered = data_filtered['t'].to_numpy()
-        censored_filtered = data_filtered['censored'].to_numpy()
-        cen_type_filtered = data_filtered['cen_type'].to_numpy()
+        if auto_aggregation is not None:
+            analysis_notes.append(
+                f"Automatic aggregation: {n} observations reduced to {len(data_filtered)} "
+                f"{auto_aggregation['agg_period']} medians (robust_median, "
+                f"{auto_aggregation['coverage']:.0%} of periods with data)"
+            )
+
+        x_filtered = data_filtered.value
+        t_filtered = data_filtered.t
+        censored_filtered = data_filtered.censored
+        cen_type_filtered = data_filtered.cen_type
 
         # Re-check size after aggregation
         n_filtered = len(x_filtered)
@@ -365,13 +369,10 @@ def trend_test(
 
 
         if len(x_filtered) < 2:
-            # Manually collect warnings before returning
-            for w in w_log:
-                 captured_warnings.append(str(w.message))
             return res('no trend', False, np.nan, 0, 0, 0, 0, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan,
                     'insufficient data post-aggregation', analysis_notes,
                     np.nan, np.nan, np.nan, 0, 0, 0, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, '',
-                    np.nan, np.nan, None, captured_warnings,
+                    np.nan, np.nan, None, diagnostics.messages,
                     'insufficient', None, None, None)
 
         # --- Autocorrelation Handling ---
@@ -582,13 +583,12 @@ def trend_test(
                     scaled_upper_ci = upper_ci * factor
                     slope_units = f"{x_unit} per {slope_scaling.lower()}"
                 except (ValueError, TypeError) as e:
-                    warnings.warn(f"Slope scaling failed: {e}", UserWarning)
+                    _report(f"Slope scaling failed: {e}")
                     slope_units = f"{x_unit} per second" # Fallback
             else:
-                warnings.warn(
+                _report(
                     "Cannot apply `slope_scaling` to a numeric (non-datetime) "
-                    "time vector `t`. The slope's unit is inherited from `t`.",
-                    UserWarning
+                    "time vector `t`. The slope's unit is inherited from `t`."
                 )
                 slope_units = f"{x_unit} per unit of t" # Clarify for numeric time
         elif is_datetime:
@@ -603,7 +603,7 @@ def trend_test(
         n_censor_levels = len(np.unique(x_filtered[censored_filtered])) if np.sum(censored_filtered) > 0 else 0
 
         # Calculate large dataset metadata
-        computation_mode = tier_info_filtered['strategy']
+        computation_mode = 'aggregate' if auto_aggregation is not None else tier_info_filtered['strategy']
 
         if computation_mode == 'fast' and len(slopes) > 0:
             pairs_used = len(slopes)
@@ -632,11 +632,10 @@ def trend_test(
             is_slow_mk = mk_test_method == 'lwp'
 
             if is_large_fast and is_slow_mk and n_surrogates > 100:
-                warnings.warn(
+                _report(
                     "Performance Warning: Large dataset detected with `mk_test_method='lwp'`. "
                     f"Surrogate testing ({n_surrogates} runs) will be very slow (O(N^2)). "
-                    "Consider setting `mk_test_method='robust'` to enable O(N log N) optimization.",
-                    UserWarning
+                    "Consider setting `mk_test_method='robust'` to enable O(N log N) optimization."
                 )
                 analysis_notes.append("Slow surrogate test (suggest mk_test_method='robust')")
 
@@ -655,14 +654,14 @@ def trend_test(
             # Note: trend_test performs filtering (NaN removal) via _prepare_data.
             # If the user passed array-like args (e.g. 'dy') in surrogate_kwargs corresponding
             # to the original data, they must be sliced to match 'x_filtered' / 't_filtered'.
-            # However, _prepare_data returns a new DataFrame 'data_filtered'.
+            # However, _prepare_data returns a new container 'data_filtered'.
             # We don't have a boolean mask relative to original X unless we reconstruct it.
             # _prepare_data logic: filters NaNs in x or t.
             # If input was DataFrame, index might be preserved.
 
             kwargs_filtered = {}
             # If input X was array, we lost the index map unless we trust lengths?
-            # _prepare_data returns 'data_filtered' which is a DataFrame.
+            # _prepare_data returns 'data_filtered' which is a _SeriesData.
             # If the filtered length != original length, we have a mismatch.
             n_orig = len(x_arr)
             n_filt = len(x_filtered)
@@ -671,9 +670,9 @@ def trend_test(
             # by time, so even if n_orig == n_filt, the order might have changed.
             # We need to slice/reorder kwargs to match the sorted data.
 
-            if 'original_index' in data_filtered.columns:
+            if data_filtered.original_index is not None:
                  # Robust path: Use integer positions tracked during preparation
-                 kept_indices = data_filtered['original_index'].values
+                 kept_indices = data_filtered.original_index
 
                  for k, v in kwargs_base.items():
                      if hasattr(v, '__len__') and len(v) == n_orig and not isinstance(v, str):
@@ -760,16 +759,12 @@ def trend_test(
 
         # --- EXECUTION BLOCK END ---
 
-        # Collect warnings
-        for w in w_log:
-             captured_warnings.append(str(w.message))
-
     results = res(trend, h, p, z, Tau, s, var_s, scaled_slope, intercept, scaled_lower_ci, scaled_upper_ci, C, Cd,
                   '', [], sen_prob, sen_prob_max, sen_prob_min,
                   prop_censored, prop_unique, n_censor_levels,
                   slope_per_second, lower_ci, upper_ci,
                   scaled_slope, scaled_lower_ci, scaled_upper_ci, slope_units,
-                  acf1, n_eff, block_size_used, captured_warnings,
+                  acf1, n_eff, block_size_used, diagnostics.messages,
                   computation_mode, pairs_used, approximation_error,
                   surrogate_result)
 
@@ -785,14 +780,14 @@ def trend_test(
 
     final_results = results._replace(classification=classification, analysis_notes=final_notes)
 
-    # Re-issue warnings so they appear in stderr as well
-    for w_str in captured_warnings:
-        warnings.warn(w_str, UserWarning)
+    if plot_path or residual_plot_path:
+        # matplotlib is only loaded when a plot is requested
+        from .plotting import plot_trend, plot_residuals
 
     if plot_path:
-        plot_trend(data_filtered, final_results, plot_path, alpha, seasonal_coloring=seasonal_coloring)
+        plot_trend(data_filtered.to_frame(), final_results, plot_path, alpha, seasonal_coloring=seasonal_coloring)
 
     if residual_plot_path:
-        plot_residuals(data_filtered, final_results, residual_plot_path)
+        plot_residuals(data_filtered.to_frame(), final_results, residual_plot_path)
 
     return final_results
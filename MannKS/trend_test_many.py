@@ -0,0 +1,398 @@
+"""
+Batch trend tests over the groups of a long-format DataFrame.
+
+`trend_test_many` partitions the rows once by sort order and then runs one
+trend test per group, either through `trend_test` (optionally in a worker
+pool) or through a vectorised kernel that scores all eligible groups in a
+single grouped Mann-Kendall pass. The results are returned as one tidy
+DataFrame with a row per group.
+"""
+from collections import namedtuple
+from concurrent.futures import Executor
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .trend_test import trend_test
+from .seasonal_trend_test import seasonal_trend_test
+from ._datetime import _is_datetime_like
+from ._helpers import _preprocessing, _get_slope_scaling_factor
+from ._large_dataset import detect_size_tier
+from ._diagnostics import _Diagnostics, _report
+from ._parallel import _map_ordered, _resolve_n_jobs
+from ._stats import (_z_score, _p_value, _mk_probability, _confidence_intervals,
+                     _sen_probability, _sens_estimator_adaptive, _seasonal_mk_scores)
+from .classification import classify_trend
+
+# Result fields that hold lists or objects and are left out of the table
+_NON_SCALAR_FIELDS = ('analysis_notes', 'warnings', 'surrogate_result')
+
+# Scalar fields of a `trend_test` result, in result order
+_TREND_COLUMNS = [
+    'trend', 'h', 'p', 'z', 'Tau', 's', 'var_s', 'slope', 'intercept',
+    'lower_ci', 'upper_ci', 'C', 'Cd', 'classification',
+    'sen_probability', 'sen_probability_max', 'sen_probability_min',
+    'prop_censored', 'prop_unique', 'n_censor_levels',
+    'slope_per_second', 'lower_ci_per_second', 'upper_ci_per_second',
+    'scaled_slope', 'scaled_lower_ci', 'scaled_upper_ci', 'slope_units',
+    'acf1', 'n_effective', 'block_size_used',
+    'computation_mode', 'pairs_used', 'approximation_error'
+]
+
+# trend_test options the kernel reproduces (or that have no effect on
+# uncensored data), with the values it supports
+_KERNEL_SUPPORTED_KWARGS = {
+    'tau_method': ('a', 'b'),
+    'mk_test_method': ('lwp', 'robust'),
+    'tie_break_method': ('lwp', 'robust'),
+    'ci_method': ('lwp', 'direct'),
+    'sens_slope_method': ('lwp', 'unbiased', 'nan', 'ats'),
+    'agg_method': ('none',),
+    'autocorr_method': ('none',),
+    'surrogate_method': ('none',),
+    'hicensor': (False, True),
+    'large_dataset_mode': ('auto', 'full', 'fast'),
+}
+_KERNEL_PASSTHROUGH_KWARGS = {
+    'alpha', 'category_map', 'continuous_confidence', 'lt_mult', 'gt_mult',
+    'min_size', 'max_pairs', 'random_state', 'slope_scaling', 'x_unit'
+}
+
+_GroupTrend = namedtuple('_GroupTrend', ['trend', 'C'])
+
+
+def trend_test_many(
+    df: pd.DataFrame,
+    by: Union[str, List[str]],
+    value_col: str = 'value',
+    time_col: str = 'time',
+    seasonal: bool = False,
+    engine: str = 'full',
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    batch_size: Optional[int] = None,
+    **kwargs
+) -> pd.DataFrame:
+    """
+    Runs a trend test for every group of a long-format DataFrame.
+
+    The rows are partitioned once by sorting on the group keys, so no
+    per-group filtering or `groupby` iteration is needed. A group whose test
+    raises is recorded with its error message instead of aborting the run.
+
+    Args:
+        df (pd.DataFrame): One row per observation. If it also has the
+            'censored' and 'cen_type' columns of `prepare_censored_data`, the
+            censoring is passed to the tests.
+        by (Union[str, List[str]]): Column(s) identifying a group (e.g.
+            ['site', 'parameter']). Rows with a missing key are ignored.
+        value_col (str): The name of the value column.
+        time_col (str): The name of the time column.
+        seasonal (bool): Whether to use `seasonal_trend_test` (True) or
+            `trend_test` (False) for each group.
+        engine (str): How the groups are tested.
+            - 'full' (default): Calls `trend_test` (or `seasonal_trend_test`)
+              for every group.
+            - 'kernel': Scores all uncensored groups without tied timestamps
+              in one vectorised Mann-Kendall pass and computes their Sen's
+              slopes directly, skipping the per-call preparation of
+              `trend_test`. Gives the same values as 'full'. Other groups
+              fall back to `trend_test`. Options that change the test
+              (aggregation, autocorrelation correction, surrogates, ...) and
+              seasonal tests are not supported.
+        n_jobs (Optional[int]): Number of worker processes for the groups run
+            through `trend_test`. None or 1 runs serially; -1 uses all CPUs.
+            Results do not depend on `n_jobs`.
+        executor (Optional[concurrent.futures.Executor]): An existing executor
+            to run the batches on. Takes precedence over `n_jobs` and is not
+            shut down.
+        batch_size (Optional[int]): Number of groups per task. Defaults to all
+            groups when serial, and to about four batches per worker otherwise.
+        **kwargs: Additional arguments passed to `trend_test` or
+            `seasonal_trend_test` (e.g. `alpha`, `period`, `slope_scaling`).
+
+    Returns:
+        pd.DataFrame: One row per group, sorted by the group keys. Columns are
+        the group keys, the scalar fields of the trend test result (except
+        `analysis_notes`), a 'warnings' column with the list of diagnostics
+        of each group and an 'error' column that is None for groups tested
+        successfully.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    required_cols = by + [time_col, value_col]
+    if not by or not all(col in df.columns for col in required_cols):
+        raise ValueError(f"df DataFrame must contain the following columns: {required_cols}")
+    valid_engines = ['full', 'kernel']
+    if engine not in valid_engines:
+        raise ValueError(f"Invalid `engine`. Must be one of {valid_engines}.")
+    if batch_size is not None and (not isinstance(batch_size, (int, np.integer)) or batch_size < 1):
+        raise ValueError("`batch_size` must be a positive integer.")
+    n_workers = 1 if executor is not None else _resolve_n_jobs(n_jobs)
+    if engine == 'kernel':
+        if seasonal:
+            raise ValueError("engine='kernel' does not support seasonal=True.")
+        for key, value in kwargs.items():
+            if key in _KERNEL_PASSTHROUGH_KWARGS:
+                continue
+            if key not in _KERNEL_SUPPORTED_KWARGS or value not in _KERNEL_SUPPORTED_KWARGS[key]:
+                raise ValueError(
+                    f"engine='kernel' does not support `{key}={value!r}`. Use engine='full'."
+                )
+
+    # --- 1. Partition the rows once ---
+    keys, order, bounds = _partition_groups(df, by)
+    n_groups = len(keys)
+
+    censored_input = all(col in df.columns for col in ['censored', 'cen_type'])
+    values = df[value_col].to_numpy()[order]
+    times = df[time_col].to_numpy()[order]
+    censored = df['censored'].to_numpy(dtype=bool)[order] if censored_input else None
+    cen_type = df['cen_type'].to_numpy()[order] if censored_input else None
+
+    rows = [None] * n_groups
+    pending = list(range(n_groups))
+    if engine == 'kernel' and n_groups:
+        rows, pending = _kernel_groups(values, times, censored, bounds, kwargs)
+
+    # --- 2. Remaining groups through trend_test, in batches ---
+    group_tasks = []
+    for k in pending:
+        sl = slice(bounds[k], bounds[k + 1])
+        if censored_input:
+            x_group = pd.DataFrame({'value': values[sl], 'censored': censored[sl], 'cen_type': cen_type[sl]})
+        else:
+            x_group = values[sl]
+        group_tasks.append((k, x_group, times[sl]))
+
+    if batch_size is None:
+        parallel = executor is not None or n_workers > 1
+        batch_size = max(1, -(-len(group_tasks) // (4 * n_workers))) if parallel else max(1, len(group_tasks))
+    payloads = [
+        (group_tasks[i:i + batch_size], seasonal, kwargs)
+        for i in range(0, len(group_tasks), batch_size)
+    ]
+    batches = _map_ordered(_test_group_batch, payloads, n_jobs=n_jobs, executor=executor)
+    for batch in batches:
+        for k, row in batch:
+            rows[k] = row
+
+    # --- 3. Tidy table ---
+    fields = next((list(row) for row in rows if row is not None and row['error'] is None), None)
+    if fields is None:
+        fields = list(_TREND_COLUMNS) + ['warnings', 'error']
+    columns = {col: keys[col].to_numpy() for col in by}
+    for f in fields:
+        columns[f] = [row.get(f, np.nan) for row in rows]
+
+    for k, row in enumerate(rows):
+        if row['error'] is not None:
+            label = ', '.join(str(keys[col].iloc[k]) for col in by)
+            _report(f"Failed to calculate trend for group {label}: {row['error']}")
+
+    return pd.DataFrame(columns, columns=by + fields)
+
+
+def _partition_groups(df, by):
+    """
+    Sorts the rows by group once.
+
+    Returns the unique keys (a DataFrame, in sorted order), the row order that
+    makes every group contiguous and the group bounds in that order.
+    """
+    # Rows with a missing key get a NaN group number
+    codes = df.groupby(by, sort=True, dropna=True).ngroup().to_numpy(dtype=float, na_value=-1)
+    codes = codes.astype(np.int64)
+    keep = np.flatnonzero(codes >= 0)
+    order = keep[np.argsort(codes[keep], kind='stable')]
+    n_groups = int(codes.max()) + 1 if len(keep) else 0
+    bounds = np.searchsorted(codes[order], np.arange(n_groups + 1))
+    keys = df[by].iloc[order[bounds[:-1]]].reset_index(drop=True)
+    return keys, order, bounds
+
+
+def _result_row(result):
+    """The scalar fields of a trend test result, its warnings and an empty 'error'."""
+    row = {f: v for f, v in zip(result._fields, result) if f not in _NON_SCALAR_FIELDS}
+    row['warnings'] = list(result.warnings)
+    row['error'] = None
+    return row
+
+
+def _test_group_batch(payload):
+    """
+    Worker entry point: tests a batch of groups with `trend_test` or
+    `seasonal_trend_test`.
+
+    Returns one (group index, row) pair per group. Rows are plain dicts
+    because the result namedtuple types cannot be pickled by reference.
+    """
+    group_tasks, seasonal, test_kwargs = payload
+    test = seasonal_trend_test if seasonal else trend_test
+    out = []
+    for k, x_group, t_group in group_tasks:
+        try:
+            row = _result_row(test(x=x_group, t=t_group, **test_kwargs))
+        except Exception as e:
+            row = {'warnings': [], 'error': str(e)}
+        out.append((k, row))
+    return out
+
+
+def _kernel_groups(values, times, censored, bounds, kwargs):
+    """
+    Tests the eligible groups with the grouped Mann-Kendall kernel.
+
+    A group is eligible when it is uncensored, has at least two observations
+    after missing values are dropped, and has no tied timestamps. Its row
+    reproduces the scalar fields of `trend_test`.
+
+    Returns:
+        tuple: (rows, pending), where rows holds the result dict of every
+        eligible group (None elsewhere) and pending lists the other groups.
+    """
+    alpha = kwargs.get('alpha', 0.05)
+    tau_method = kwargs.get('tau_method', 'b')
+    mk_test_method = kwargs.get('mk_test_method', 'lwp')
+    tie_break_method = kwargs.get('tie_break_method', 'lwp')
+    ci_method = kwargs.get('ci_method', 'lwp')
+    sens_slope_method = kwargs.get('sens_slope_method', 'lwp')
+    continuous_confidence = kwargs.get('continuous_confidence', True)
+    category_map = kwargs.get('category_map')
+    large_dataset_mode = kwargs.get('large_dataset_mode', 'auto')
+    max_pairs = kwargs.get('max_pairs')
+    random_state = kwargs.get('random_state')
+    slope_scaling = kwargs.get('slope_scaling')
+    x_unit = kwargs.get('x_unit', 'units')
+
+    n_groups = len(bounds) - 1
+    group_of = np.repeat(np.arange(n_groups), np.diff(bounds))
+    is_datetime = _is_datetime_like(np.asarray(times))
+    with np.errstate(all='ignore'):
+        x_all = np.asarray(_preprocessing(values)[0], dtype=float)
+        t_all = np.asarray(_preprocessing(times)[0], dtype=float)
+
+    # Same missing-value rule as `_prepare_data`
+    valid = ~np.isnan(x_all) & ~np.isnan(t_all)
+    x_all, t_all, group_of = x_all[valid], t_all[valid], group_of[valid]
+    n_valid = np.bincount(group_of, minlength=n_groups)
+
+    eligible = n_valid >= 2
+    if censored is not None:
+        eligible &= np.bincount(group_of, weights=censored[valid], minlength=n_groups) == 0
+    # Groups with tied timestamps are left to trend_test, whose ordering of
+    # tied observations the kernel does not reproduce
+    tie_order = np.lexsort((t_all, group_of))
+    g_sorted, t_sorted = group_of[tie_order], t_all[tie_order]
+    tied = (g_sorted[1:] == g_sorted[:-1]) & (t_sorted[1:] == t_sorted[:-1])
+    eligible[np.unique(g_sorted[1:][tied])] = False
+
+    rows = [None] * n_groups
+    pending = [k for k in range(n_groups) if not eligible[k]]
+    use = eligible[group_of]
+    if not use.any():
+        return rows, pending
+
+    scores = _seasonal_mk_scores(
+        x_all[use], t_all[use], np.zeros(int(use.sum()), dtype=bool),
+        np.full(int(use.sum()), 'not'), group_of[use], tau_method=tau_method,
+        mk_test_method=mk_test_method, tie_break_method=tie_break_method
+    )
+    xs = x_all[use][scores.order]
+    ts = t_all[use][scores.order]
+    scale_factor = _get_slope_scaling_factor(slope_scaling) if slope_scaling and is_datetime else None
+
+    for k, start, n, s, var_s, tau in zip(scores.season, scores.starts, scores.n,
+                                          scores.s, scores.var_s, scores.tau):
+        # Diagnostics are handled per group, as by `trend_test`
+        with _Diagnostics() as diagnostics:
+            row = _kernel_row(
+                xs[start:start + n], ts[start:start + n], s, var_s, tau, is_datetime,
+                alpha, ci_method, sens_slope_method, continuous_confidence, category_map,
+                large_dataset_mode, max_pairs, random_state, slope_scaling, x_unit, scale_factor
+            )
+        row['warnings'] = diagnostics.messages
+        rows[int(k)] = row
+
+    return rows, pending
+
+
+def _kernel_row(x, t, s, var_s, tau, is_datetime, alpha, ci_method, sens_slope_method,
+                continuous_confidence, category_map, large_dataset_mode, max_pairs,
+                random_state, slope_scaling, x_unit, scale_factor):
+    """
+    The scalar `trend_test` fields of one uncensored, time-ordered group.
+
+    S, its variance and Tau come from the grouped kernel; the remaining
+    statistics use the same helpers as `trend_test`.
+    """
+    n = len(x)
+    tier_info = detect_size_tier(n, user_mode=large_dataset_mode)
+    for msg in tier_info['warnings']:
+        _report(msg)
+
+    z = _z_score(s, var_s)
+    p, h, trend = _p_value(z, alpha, continuous_confidence=continuous_confidence)
+    # Uncensored data: the CI variance equals the test variance
+    C, Cd = _mk_probability(p, s)
+
+    slopes = _sens_estimator_adaptive(
+        x, t, max_pairs=max_pairs if max_pairs else tier_info['max_pairs'],
+        random_state=random_state
+    )
+    slope = np.nanmedian(slopes) if len(slopes) > 0 else np.nan
+    intercept = np.nan
+    if not np.isnan(slope):
+        intercept = np.nanmedian(x) - np.nanmedian(t) * slope
+    total_pairs = None if sens_slope_method == 'ats' else n * (n - 1) // 2
+    lower_ci, upper_ci = _confidence_intervals(slopes, var_s, alpha, method=ci_method, total_pairs=total_pairs)
+    sen_prob, sen_prob_max, sen_prob_min = _sen_probability(slopes, var_s, total_pairs=total_pairs)
+
+    scaled_slope, scaled_lower_ci, scaled_upper_ci = slope, lower_ci, upper_ci
+    if slope_scaling and pd.notna(slope):
+        if is_datetime:
+            scaled_slope = slope * scale_factor
+            scaled_lower_ci = lower_ci * scale_factor
+            scaled_upper_ci = upper_ci * scale_factor
+            slope_units = f"{x_unit} per {slope_scaling.lower()}"
+        else:
+            _report(
+                "Cannot apply `slope_scaling` to a numeric (non-datetime) "
+                "time vector `t`. The slope's unit is inherited from `t`."
+            )
+            slope_units = f"{x_unit} per unit of t"
+    elif is_datetime:
+        slope_units = f"{x_unit} per second"
+    else:
+        slope_units = f"{x_unit} per unit of t"
+
+    computation_mode = tier_info['strategy']
+    pairs_used = approximation_error = None
+    if computation_mode == 'fast' and len(slopes) > 0:
+        pairs_used = len(slopes)
+        valid_slopes = slopes[~np.isnan(slopes)]
+        if len(valid_slopes) > 0:
+            iqr = np.percentile(valid_slopes, 75) - np.percentile(valid_slopes, 25)
+            approximation_error = 1.96 * iqr / np.sqrt(pairs_used)
+        else:
+            approximation_error = np.nan
+
+    if continuous_confidence:
+        classification = classify_trend(_GroupTrend(trend=trend, C=C), category_map=category_map)
+    else:
+        classification = trend.title() if trend != 'no trend' else 'No Trend'
+
+    values = [
+        trend, h, p, z, tau, s, var_s, scaled_slope, intercept,
+        scaled_lower_ci, scaled_upper_ci, C, Cd, classification,
+        sen_prob, sen_prob_max, sen_prob_min,
+        np.float64(0.0), len(np.unique(x)) / n, 0,
+        slope, lower_ci, upper_ci,
+        scaled_slope, scaled_lower_ci, scaled_upper_ci, slope_units,
+        0.0, n, None,
+        computation_mode, pairs_used, approximation_error
+    ]
+    row = dict(zip(_TREND_COLUMNS, values))
+    row['warnings'] = []
+    row['error'] = None
+    return row
@@ -72,3 +72,29 @@ def test_censored_flag_propagation():
                 assert surr_cen[i] == True, f"Surrogate value at rank {rank} should be censored"
             else:
                 assert surr_cen[i] == False, f"Surrogate value at rank {rank} should NOT be censored"
+
+def test_batched_censored_flag_propagation():
+    """
+    Verify the surrogate bank is scored with censoring flags mapped by row-wise rank.
+    """
+    x = np.array([10, 20, 30, 40, 50])
+    t = np.arange(5)
+    censored = np.array([True, False, False, False, True])
+    cen_type = np.array(['lt', 'not', 'not', 'not', 'lt'], dtype=object)
+
+    with patch('MannKS._surrogate._mk_score_batch') as mock_batch:
+        mock_batch.return_value = np.zeros(3)
+        surrogate_test(
+            x, t, censored=censored, cen_type=cen_type,
+            method='iaaft', n_surrogates=3, random_state=42,
+            lt_mult=0.5
+        )
+
+        args, kwargs = mock_batch.call_args
+        bank = args[0]
+        bank_cen = kwargs['censored']
+        assert bank.shape == (3, 5)
+        for row, row_cen in zip(bank, bank_cen):
+            ranks = np.argsort(np.argsort(row, kind='stable'), kind='stable')
+            # Imputed ranks 0 and 2 are censored (see test above)
+            np.testing.assert_array_equal(row_cen, np.isin(ranks, [0, 2]))
@@ -43,8 +43,8 @@ def test_seasonal_stratification_n15000():
     # x = trend + seasonality + noise
     x = 0.01 * t + seasonality * 10 + np.random.normal(0, 5, n)
 
-    # Must provide period for numeric time
-    result = seasonal_trend_test(x, t, period=period)
+    # Must provide period for numeric time. Stratification is opt-in via max_per_season.
+    result = seasonal_trend_test(x, t, period=period, max_per_season=1000)
 
     # Should trigger stratification because n > 10000
     # Note: result.computation_mode reflects the overall strategy ('fast' here)
@@ -78,8 +78,8 @@ def test_heavy_ties():
     x[:int(0.8*n)] = 0
 
     # Expect warning about heavy ties
-    with pytest.warns(UserWarning, match="Heavy ties detected"):
-        result = trend_test(x, t, mk_test_method='robust')
+    result = trend_test(x, t, mk_test_method='robust')
+    assert any("Heavy ties detected" in w for w in result.warnings)
 
     assert result.computation_mode == 'fast'
     # Result should be valid
@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 import pandas as pd
 from MannKS import trend_test, seasonal_trend_test
-from MannKS.preprocessing import prepare_censored_data
+from MannKS.preprocessing import prepare_censored_data, read_censored_csv
 
 # Unit tests for the new `prepare_censored_data` function
 def test_prepare_censored_data_valid():
@@ -66,6 +66,38 @@ def test_prepare_censored_data_mixed_censoring_warning():
     with pytest.warns(UserWarning, match="Value 5.0 has conflicting censoring types"):
         prepare_censored_data(x2)
 
+def test_prepare_censored_data_mixed_types():
+    """Test bulk parsing of mixed strings, numbers and missing values."""
+    x = pd.Series([' <1.5', 2, np.nan, '>3', '4e1', True, ' 7 '], dtype=object)
+    expected_df = pd.DataFrame({
+        'value': [1.5, 2.0, np.nan, 3.0, 40.0, 1.0, 7.0],
+        'censored': [True, False, False, True, False, False, False],
+        'cen_type': ['lt', 'not', 'not', 'gt', 'not', 'not', 'not']
+    })
+    pd.testing.assert_frame_equal(prepare_censored_data(x), expected_df)
+    with pytest.raises(ValueError, match="Could not convert non-string value 'None' to a float."):
+        prepare_censored_data(['<1', None])
+
+def test_read_censored_csv(tmp_path):
+    """Test the chunked CSV reader against prepare_censored_data."""
+    path = tmp_path / "lab.csv"
+    raw = ['<5', '3.2', '', '>10', '5', '4.1', '<0.5']
+    pd.DataFrame({'site': list('AABBBCC'), 'conc': raw}).to_csv(path, index=False)
+
+    with pytest.warns(UserWarning, match="Value 5.0 has conflicting censoring types"):
+        result = read_censored_csv(path, value_col='conc', chunksize=3)
+
+    assert list(result.columns) == ['site', 'value', 'censored', 'cen_type']
+    assert result['site'].tolist() == list('AABBBCC')
+    with pytest.warns(UserWarning):
+        expected = prepare_censored_data([np.nan if v == '' else v for v in raw])
+    pd.testing.assert_frame_equal(result[['value', 'censored', 'cen_type']], expected)
+
+    with pytest.raises(ValueError, match="chunksize"):
+        read_censored_csv(path, value_col='conc', chunksize=0)
+    with pytest.raises(ValueError, match="not found"):
+        read_censored_csv(path, value_col='value')
+
 def test_hicensor_rule_trend_test():
     """Test the hicensor rule in trend_test."""
     x = ['<5', 3, 2, '<10', 8, 1] # More sensitive to hicensor
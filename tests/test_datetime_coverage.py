@@ -47,3 +47,58 @@ def test_get_agg_func_various_periods(agg_period, date_str, expected_group):
         result = func(dates)
         val = result.iloc[0] if isinstance(result, pd.Series) else result[0]
         assert val == expected_group
+
+# --- Tests for the vectorised calendar layer ---
+
+@pytest.mark.parametrize("tz", [None, 'Pacific/Auckland'])
+def test_season_and_cycle_codes_match_pandas(tz):
+    """Season, cycle and aggregation codes agree with the pandas accessors."""
+    import numpy as np
+    from MannKS._datetime import _season_and_cycle, _get_cycle_identifier
+
+    dates = pd.date_range('1899-12-25', '2031-01-05', freq='37h')
+    if tz is not None:
+        dates = dates.tz_localize('UTC').tz_convert(tz)
+    dt = pd.Series(dates).dt
+    iso = dt.isocalendar()
+    expected = {
+        'month': dt.month, 'quarter': dt.quarter, 'day_of_week': dt.dayofweek,
+        'day_of_year': dt.dayofyear, 'week_of_year': iso.week,
+        'biweekly': (iso.week - 1) // 2, 'hour': dt.hour, 'second': dt.second,
+    }
+    for season_type, values in expected.items():
+        # Object arrays of Timestamps give the same (wall-clock) codes
+        for t in [dates, np.asarray(pd.Series(dates))]:
+            seasons, cycles = _season_and_cycle(t, season_type)
+            np.testing.assert_array_equal(seasons, np.asarray(values, dtype=np.int64))
+            np.testing.assert_array_equal(cycles, _get_cycle_identifier(dates, season_type))
+
+    np.testing.assert_array_equal(_get_cycle_identifier(dates, 'day_of_week'),
+                                  np.asarray(iso.year * 100 + iso.week))
+    np.testing.assert_array_equal(_get_agg_func('week')(dates), np.asarray(iso.year * 100 + iso.week))
+    np.testing.assert_array_equal(_get_agg_func('quarter')(dates), np.asarray(dt.year * 10 + dt.quarter))
+
+
+def test_numeric_time_and_ranks():
+    """Datetimes convert to UTC seconds whatever their unit or time zone."""
+    import datetime
+    import numpy as np
+    from MannKS._datetime import _to_numeric_time, _get_time_ranks
+    from MannKS._helpers import _preprocessing
+
+    dates = pd.date_range('2020-01-01 22:00', periods=3, freq='h', tz='Pacific/Auckland')
+    expected = dates.asi8 / 1e9
+    np.testing.assert_array_equal(_to_numeric_time(pd.Series(dates)), expected)
+    if hasattr(dates, 'as_unit'):
+        # Non-nanosecond units only exist on pandas >= 2.0
+        np.testing.assert_array_equal(_to_numeric_time(pd.Series(dates.as_unit('us'))), expected)
+    np.testing.assert_array_equal(_to_numeric_time(np.asarray(pd.Series(dates))), expected)
+    np.testing.assert_array_equal(_preprocessing(np.asarray(pd.Series(dates)))[0], expected)
+
+    naive = np.array([datetime.datetime(2020, 1, 1, 5), None], dtype=object)
+    np.testing.assert_array_equal(_preprocessing(naive)[0], [1577854800.0, np.nan])
+    np.testing.assert_array_equal(
+        _preprocessing(np.array(['2020-01-01T00:00:00.7', 'NaT'], dtype='datetime64[ms]'))[0],
+        [1577836800.0, np.nan])
+
+    np.testing.assert_array_equal(_get_time_ranks(None, np.array([2021, 2019, 2021, 2020])), [3.0, 1.0, 3.0, 2.0])
@@ -95,3 +95,90 @@ def test_fast_mk_ties_in_x():
     )
 
     assert s_fast == s_slow
+
+@pytest.mark.parametrize("mk_test_method", ['robust', 'lwp'])
+@pytest.mark.parametrize("force_inversion", [False, True])
+def test_mk_score_batch_matches_per_row(mk_test_method, force_inversion, monkeypatch):
+    """
+    Verify the batched bank scorer reproduces the per-row S statistic for
+    censored data with ties in x and t, on both the sign-sum and the
+    inversion-counting paths.
+    """
+    import MannKS._stats as stats_mod
+    if force_inversion:
+        monkeypatch.setattr(stats_mod, '_BATCH_SIGN_SUM_MAX_PAIRS', 0)
+
+    rng = np.random.default_rng(7)
+    n_rows, n = 6, 57
+    x = np.round(rng.normal(0, 3, (n_rows, n))) / 2
+    t = rng.integers(0, 30, n).astype(float)
+    censored = rng.random((n_rows, n)) < 0.3
+    cen_type = np.where(censored, np.where(rng.random((n_rows, n)) < 0.5, 'lt', 'gt'), 'not')
+
+    expected = [
+        _mk_score_and_var_censored(
+            x[i], t, censored[i], cen_type[i],
+            mk_test_method=mk_test_method, calc_var=False
+        )[0]
+        for i in range(n_rows)
+    ]
+    result = stats_mod._mk_score_batch(x, t, censored, cen_type, mk_test_method=mk_test_method)
+    np.testing.assert_array_equal(result, expected)
+
+    # Uncensored rows
+    result_unc = stats_mod._mk_score_batch(x, t, mk_test_method=mk_test_method)
+    expected_unc = [
+        _mk_score_and_var_censored(
+            x[i], t, np.zeros(n, bool), np.full(n, 'not'),
+            mk_test_method=mk_test_method, calc_var=False
+        )[0]
+        for i in range(n_rows)
+    ]
+    np.testing.assert_array_equal(result_unc, expected_unc)
+
+def test_mk_score_and_var_batch_matches_per_row():
+    """Batched S and variance agree with the per-row calculation."""
+    from MannKS._stats import _mk_score_and_var_batch
+    rng = np.random.default_rng(3)
+    x = np.round(rng.normal(0, 2, (5, 35)))
+    t = rng.integers(0, 20, 35).astype(float)
+
+    for censored in [np.zeros(35, bool), rng.random(35) < 0.3]:
+        cen_type = np.where(censored, 'lt', 'not')
+        s, var_s = _mk_score_and_var_batch(x, t, censored, cen_type,
+                                           mk_test_method='lwp', tie_break_method='lwp')
+        expected = [
+            _mk_score_and_var_censored(row, t, censored, cen_type,
+                                       mk_test_method='lwp', tie_break_method='lwp')[:2]
+            for row in x
+        ]
+        np.testing.assert_allclose(s, [e[0] for e in expected])
+        np.testing.assert_allclose(var_s, [e[1] for e in expected])
+
+
+@pytest.mark.parametrize("mk_test_method", ['robust', 'lwp'])
+def test_seasonal_mk_scores_match_per_season(mk_test_method):
+    from MannKS._stats import _seasonal_mk_scores
+
+    rng = np.random.default_rng(4)
+    n = 1400
+    x = np.round(rng.normal(size=n), 1)
+    t = rng.integers(0, n, n).astype(float)
+    # One large season exercises the O(n log n) per-season path
+    seasons = np.where(rng.random(n) < 0.45, 0, rng.integers(1, 25, n))
+    censored = (rng.random(n) < 0.05) & (seasons % 3 == 0)
+    cen_type = np.where(censored, 'lt', 'not')
+
+    scores = _seasonal_mk_scores(x, t, censored, cen_type, seasons,
+                                 mk_test_method=mk_test_method, tie_break_method='lwp',
+                                 chunk_elements=100_000)
+
+    order = np.argsort(t, kind='stable')
+    for k, season in enumerate(scores.season):
+        m = seasons[order] == season
+        expected = _mk_score_and_var_censored(
+            x[order][m], t[order][m], censored[order][m], cen_type[order][m],
+            mk_test_method=mk_test_method, tie_break_method='lwp'
+        )
+        assert scores.n[k] == m.sum()
+        assert (scores.s[k], scores.var_s[k], scores.d[k], scores.tau[k]) == expected
@@ -1,5 +1,6 @@
 import datetime
 import os
+import warnings
 import numpy as np
 import pandas as pd
 import pytest
@@ -7,9 +8,11 @@ import pytest
 # Import internal functions to be tested
 from MannKS._helpers import (
     _preprocessing,
-    _aggregate_censored_median,
     _value_for_time_increment,
-    _aggregate_by_group
+    _prepare_data,
+    _SeriesData,
+    _group_codes,
+    _aggregate_groups
 )
 
 # --- Tests for _preprocessing ---
@@ -30,11 +33,11 @@ def test_preprocessing_2d_array():
     assert x_flat.ndim == 1
     np.testing.assert_array_equal(x_flat, np.array([1, 2, 3]))
 
-# --- Tests for _aggregate_censored_median ---
+# --- Tests for robust_median aggregation ---
 
-def test_aggregate_censored_median_empty_mode():
+def test_aggregate_robust_median_empty_mode():
     """
-    Test _aggregate_censored_median when the mode of cen_type is empty.
+    Test 'robust_median' aggregation when the mode of cen_type is empty.
     This happens when censored data points have NaN cen_type values.
     """
     group = pd.DataFrame({
@@ -44,11 +47,12 @@ def test_aggregate_censored_median_empty_mode():
         't_original': [1, 2, 3],
         't': [1, 2, 3]
     })
-    result_df = _aggregate_censored_median(group, is_datetime=False)
-    assert len(result_df) == 1
-    assert result_df['value'].iloc[0] == 5.0
-    assert not result_df['censored'].iloc[0]
-    assert result_df['cen_type'].iloc[0] == 'not'
+    result = _aggregate_groups(_SeriesData.from_frame(group), np.zeros(3, dtype=np.int64),
+                               'robust_median', is_datetime=False)
+    assert len(result) == 1
+    assert result.value[0] == 5.0
+    assert not result.censored[0]
+    assert result.cen_type[0] == 'not'
 
 
 # --- Tests for _value_for_time_increment ---
@@ -72,15 +76,100 @@ def test_value_for_time_increment_datetime():
     assert len(result_df) == 2
     assert all(item in result_df['value'].values for item in expected_values)
 
-# --- Tests for _aggregate_by_group ---
+# --- Tests for _aggregate_groups ---
 
-def test_aggregate_by_group_middle_lwp_numeric():
-    """Test _aggregate_by_group with 'middle_lwp' and numeric time."""
-    group = pd.DataFrame({
-        'value': [10, 20, 30],
-        't': [2000.1, 2000.5, 2000.9]
+def test_aggregate_groups_middle_lwp_numeric():
+    """Test _aggregate_groups with 'middle_lwp' and numeric time."""
+    t = np.array([2000.1, 2000.5, 2000.9])
+    data = _SeriesData(np.array([10.0, 20.0, 30.0]), np.zeros(3, dtype=bool),
+                       np.full(3, 'not', dtype=object), t, t)
+    result = _aggregate_groups(data, np.zeros(3, dtype=np.int64), 'middle_lwp', is_datetime=False)
+    assert len(result) == 1
+    assert result.value[0] == 20
+    assert result.t[0] == 2000.5
+
+
+# --- Tests for _prepare_data ---
+
+def test_prepare_data_series_container():
+    """Test _prepare_data returns filtered arrays that round-trip through a DataFrame."""
+    x = pd.DataFrame({
+        'value': [3.0, np.nan, 1.0, 0.5, 2.0],
+        'censored': [False, False, True, False, False],
+        'cen_type': ['not', 'not', 'lt', 'not', 'not']
+    })
+    t = pd.to_datetime(['2001-01-01', '2002-01-01', '2000-01-01', '2003-01-01', '2000-01-01'])
+    data, is_datetime = _prepare_data(x, t, hicensor=True)
+
+    assert is_datetime
+    assert isinstance(data, _SeriesData)
+    assert len(data) == 4
+    np.testing.assert_array_equal(data.original_index, [0, 2, 3, 4])
+    # HiCensor: values below the largest '<' limit become censored at that limit
+    np.testing.assert_array_equal(data.value, [3.0, 1.0, 1.0, 2.0])
+    np.testing.assert_array_equal(data.cen_type, ['not', 'lt', 'lt', 'not'])
+
+    ordered = data.sort_by_time(is_datetime)
+    np.testing.assert_array_equal(ordered['original_index'], [2, 4, 0, 3])
+
+    frame = ordered.to_frame()
+    assert list(frame.columns) == ['value', 'censored', 'cen_type', 't_original', 't', 'original_index']
+    roundtrip = _SeriesData.from_frame(frame.drop(columns='original_index'))
+    assert roundtrip.original_index is None
+    np.testing.assert_array_equal(roundtrip.t, ordered.t)
+    with pytest.raises(KeyError):
+        roundtrip['original_index']
+
+    with pytest.raises(ValueError, match="same length"):
+        _prepare_data(np.arange(3.0), np.arange(4.0), hicensor=False)
+
+
+def _aggregate_group_reference(group, agg_method):
+    """One group aggregated row by row with pandas, as the LWP-TRENDS rules describe."""
+    from MannKS._datetime import _get_theoretical_midpoint
+    if agg_method == 'middle':
+        return group.iloc[np.argmin(np.abs(group['t'] - group['t'].mean()))]
+    if agg_method == 'middle_lwp':
+        midpoint = _get_theoretical_midpoint(group['t_original'].reset_index(drop=True))
+        return group.iloc[np.argmin(np.abs(group['t_original'] - midpoint).to_numpy())]
+    median = group['value'].median()
+    cens = group[group['censored']]
+    is_censored = bool(len(cens)) and median <= cens['value'].max()
+    return pd.Series({
+        'value': median,
+        'censored': is_censored,
+        'cen_type': cens['cen_type'].mode().iloc[0] if is_censored else 'not',
+        't_original': group['t_original'].median(),
+        't': group['t'].median(),
+    })
+
+
+@pytest.mark.parametrize("agg_method", ['median', 'robust_median', 'middle', 'middle_lwp'])
+def test_aggregate_groups_matches_per_group(agg_method):
+    """Test the vectorised _aggregate_groups against a per-group pandas reference."""
+    rng = np.random.default_rng(0)
+    n = 60
+    t = pd.DatetimeIndex(pd.to_datetime('2000-01-01') + pd.to_timedelta(rng.integers(0, 700, n), unit='D'))
+    x = pd.DataFrame({
+        'value': np.round(rng.uniform(0, 5, n), 1),
+        'censored': rng.random(n) < 0.3,
     })
-    result_df = _aggregate_by_group(group, agg_method='middle_lwp', is_datetime=False)
-    assert len(result_df) == 1
-    assert result_df['value'].iloc[0] == 20
-    assert result_df['t'].iloc[0] == 2000.5
+    x['cen_type'] = np.where(x['censored'], np.where(rng.random(n) < 0.7, 'lt', 'gt'), 'not')
+    data, is_datetime = _prepare_data(x, t, hicensor=False)
+    period = pd.DatetimeIndex(data.t_original).to_period('M')
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = _aggregate_groups(data, _group_codes(period), agg_method, is_datetime)
+
+    frame = data.to_frame()
+    expected = pd.DataFrame([
+        _aggregate_group_reference(group, agg_method) for _, group in frame.groupby(period.to_numpy())
+    ])
+    np.testing.assert_array_equal(result.value, expected['value'])
+    np.testing.assert_array_equal(result.censored, expected['censored'].astype(bool))
+    np.testing.assert_array_equal(result.cen_type, expected['cen_type'])
+    np.testing.assert_array_equal(result.t, expected['t'])
+    np.testing.assert_array_equal(result.t_original, expected['t_original'].to_numpy())
+    if agg_method.startswith('middle'):
+        np.testing.assert_array_equal(result.original_index, expected['original_index'])
@@ -3,7 +3,7 @@ import pytest
 import numpy as np
 import pandas as pd
 from MannKS import trend_test, prepare_censored_data
-from MannKS._large_dataset import fast_sens_slope, detect_size_tier
+from MannKS._large_dataset import fast_sens_slope, detect_size_tier, select_aggregation_period
 
 def test_fast_sens_slope_accuracy():
     """Verify fast mode matches full mode within error bounds."""
@@ -116,3 +116,43 @@ def test_censored_fast_mode():
     assert result.computation_mode == 'fast'
     assert result.slope > 0.4  # Should still detect trend
     assert result.h == True
+
+
+def test_select_aggregation_period():
+    """The finest period under the target size with good coverage is chosen."""
+    t = pd.date_range('2000-01-01', periods=60000, freq='3h')
+
+    # 7,500 days exceeds the 5,000 target; weeks do not
+    choice = select_aggregation_period(t)
+    assert choice['agg_period'] == 'week'
+    assert choice['coverage'] == 1.0
+
+    assert select_aggregation_period(t, target_n=10000)['agg_period'] == 'day'
+
+    # Months with data in only a third of the record fail the coverage rule;
+    # every quarter has data
+    sparse = t[(t.month % 3) == 0]
+    assert select_aggregation_period(sparse, target_n=500)['agg_period'] == 'quarter'
+
+    # No period leaves between min_periods and target_n values
+    assert select_aggregation_period(t[:20]) is None
+    assert select_aggregation_period(t, target_n=5) is None
+
+
+def test_aggregate_tier_auto_aggregation():
+    """Tier 3 datetime data are aggregated automatically and the choice is reported."""
+    rng = np.random.default_rng(0)
+    n = 60000
+    t = pd.date_range('2000-01-01', periods=n, freq='3h')
+    x = np.arange(n) * 0.001 + rng.normal(0, 1, n)
+
+    result = trend_test(x, t, slope_scaling='year')
+
+    assert result.computation_mode == 'aggregate'
+    assert any('Automatic aggregation' in note and 'week' in note for note in result.analysis_notes)
+    # 0.001 per 3 hours
+    assert abs(result.slope - 0.001 * 8 * 365.25) < 0.05
+
+    # An explicit aggregation is left alone
+    explicit = trend_test(x, t, agg_method='median', agg_period='month', large_dataset_mode='aggregate')
+    assert not any('Automatic aggregation' in note for note in explicit.analysis_notes)
@@ -63,3 +63,222 @@ def test_power_test_invalid_unit():
 
     with pytest.raises(ValueError, match="Invalid `slope_scaling` parameter"):
         power_test(x, t, slopes=[1.0], n_simulations=5, n_surrogates=20, slope_scaling='foobar')
+
+@pytest.mark.parametrize("null_mode", ['per_realization', 'shared'])
+def test_power_test_shared_null_modes(null_mode):
+    """Fast null modes give a sensible, reproducible power curve."""
+    rng = np.random.default_rng(0)
+    t = np.arange(60.0)
+    x = rng.normal(0, 1, 60)
+
+    kwargs = dict(slopes=[0.0, 0.5], n_simulations=20, n_surrogates=50,
+                  random_state=3, null_mode=null_mode)
+    res = power_test(x, t, **kwargs)
+    res_repeat = power_test(x, t, **kwargs)
+
+    assert res.null_mode == null_mode
+    np.testing.assert_array_equal(res.power, res_repeat.power)
+    assert res.power[0] <= 0.3
+    assert res.power[1] == 1.0
+
+def test_power_test_shared_null_bank_count():
+    """'per_realization' runs one inner surrogate test per noise realisation, 'shared' runs one."""
+    from unittest.mock import patch
+    from MannKS._surrogate import surrogate_test as real_surrogate_test
+
+    t = np.arange(30.0)
+    x = np.random.default_rng(1).normal(0, 1, 30)
+    slopes = [0.0, 0.1, 0.2, np.nan]
+
+    with patch('MannKS.power.surrogate_test', side_effect=real_surrogate_test) as mock_test:
+        res = power_test(x, t, slopes=slopes, n_simulations=4, n_surrogates=20,
+                         random_state=0, null_mode='per_realization')
+        assert mock_test.call_count == 4
+    assert np.isnan(res.power[3])
+
+    with patch('MannKS.power.surrogate_test', side_effect=real_surrogate_test) as mock_test:
+        power_test(x, t, slopes=slopes, n_simulations=4, n_surrogates=20,
+                   random_state=0, null_mode='shared')
+        assert mock_test.call_count == 1
+
+def test_power_test_invalid_null_mode():
+    with pytest.raises(ValueError, match="null_mode"):
+        power_test(np.random.normal(0, 1, 20), np.arange(20), slopes=[0.1],
+                   n_simulations=2, n_surrogates=20, null_mode='fast')
+
+def test_power_test_adaptive_mdt_search():
+    """Adaptive search brackets the MDT with fewer simulations than a dense grid."""
+    rng = np.random.default_rng(0)
+    t = np.arange(60.0)
+    x = rng.normal(0, 1, 60)
+    common = dict(n_simulations=60, n_surrogates=50, random_state=1, null_mode='per_realization')
+
+    grid = power_test(x, t, slopes=np.linspace(0, 0.1, 21), **common)
+    res = power_test(x, t, slopes=[0, 0.1], target_power=0.8, mdt_tol=0.02, **common)
+
+    lo, hi = res.mdt_interval
+    assert hi - lo <= 0.02
+    assert lo <= res.min_detectable_trend <= hi
+    # The interval ends are probes whose power is confidently below / above the target
+    power = res.simulation_results.set_index('slope')['power']
+    assert power[lo] < 0.8 < power[hi]
+    assert abs(res.min_detectable_trend - grid.min_detectable_trend) < 0.01
+    assert res.simulation_results['n_simulations'].sum() < grid.simulation_results['n_simulations'].sum()
+    assert np.all(np.diff(res.slopes) > 0)
+
+def test_power_test_adaptive_mdt_not_reached():
+    rng = np.random.default_rng(0)
+    t = np.arange(30.0)
+    x = rng.normal(0, 1, 30)
+    with pytest.warns(UserWarning, match="not reached"):
+        res = power_test(x, t, slopes=[0, 1e-4], n_simulations=20, n_surrogates=20,
+                         random_state=0, null_mode='shared', target_power=0.8)
+    assert np.isnan(res.min_detectable_trend)
+    assert res.mdt_interval is None
+
+def test_power_test_adaptive_mdt_unresolved_and_low_bracket():
+    rng = np.random.default_rng(0)
+    t = np.arange(60.0)
+    x = rng.normal(0, 1, 60)
+    common = dict(n_simulations=20, n_surrogates=50, random_state=1, null_mode='per_realization')
+
+    # Too few simulations to resolve a narrow interval around the MDT
+    with pytest.warns(UserWarning, match="wider than `mdt_tol`"):
+        res = power_test(x, t, slopes=[0, 0.1], target_power=0.8, mdt_tol=1e-4, **common)
+    lo, hi = res.mdt_interval
+    assert lo <= res.min_detectable_trend <= hi
+
+    # Target already reached at the bottom of the bracket: the MDT may be lower
+    with pytest.warns(UserWarning, match="already reached"):
+        res = power_test(x, t, slopes=[0.5, 1.0], target_power=0.8, **common)
+    assert res.min_detectable_trend == 0.5
+    assert res.mdt_interval == (-np.inf, 0.5)
+
+def test_power_test_adaptive_mdt_validation():
+    x = np.random.normal(0, 1, 20)
+    t = np.arange(20)
+    with pytest.raises(ValueError, match="target_power"):
+        power_test(x, t, slopes=[0, 1], target_power=1.5)
+    with pytest.raises(ValueError, match="bracket"):
+        power_test(x, t, slopes=[0.5], target_power=0.8)
+
+def test_power_test_parallel_matches_serial():
+    rng = np.random.default_rng(0)
+    t = np.arange(40.0)
+    x = rng.normal(0, 1, 40)
+    kwargs = dict(slopes=[0.0, 0.05, np.nan], n_simulations=8, n_surrogates=20, random_state=11)
+
+    serial = power_test(x, t, **kwargs)
+    parallel = power_test(x, t, n_jobs=2, **kwargs)
+    pd.testing.assert_frame_equal(serial.simulation_results, parallel.simulation_results)
+
+def test_power_test_checkpoint_resume(tmp_path):
+    rng = np.random.default_rng(0)
+    t = np.arange(40.0)
+    x = rng.normal(0, 1, 40)
+    ckpt = tmp_path / "power.npz"
+    kwargs = dict(slopes=[0.0, 0.05], n_simulations=15, n_surrogates=20, random_state=5)
+
+    reference = power_test(x, t, **kwargs)
+
+    class Interrupt(Exception):
+        pass
+
+    def stop_after_first_batch(done, total):
+        if done > 0:
+            raise Interrupt
+
+    with pytest.raises(Interrupt):
+        power_test(x, t, checkpoint_path=str(ckpt), progress=stop_after_first_batch, **kwargs)
+    assert ckpt.exists()
+
+    calls = []
+    resumed = power_test(x, t, checkpoint_path=str(ckpt),
+                         progress=lambda done, total: calls.append((done, total)), **kwargs)
+    # Resumed run starts from the completed cells, not from zero
+    assert calls[0][0] > 0
+    assert calls[-1] == (30, 30)
+    pd.testing.assert_frame_equal(reference.simulation_results, resumed.simulation_results)
+
+    with pytest.raises(ValueError, match="different power_test arguments"):
+        power_test(x, t, checkpoint_path=str(ckpt), **{**kwargs, 'random_state': 6})
+
+def test_power_test_checkpoint_fingerprints_long_arrays(tmp_path):
+    """A change deep inside a long array option invalidates the checkpoint."""
+    rng = np.random.default_rng(1)
+    n = 2000
+    t = np.arange(float(n))
+    x = rng.normal(0, 1, n)
+    dy = np.ones(n)
+    ckpt = tmp_path / "power.npz"
+    kwargs = dict(slopes=[0.0], n_simulations=20, n_surrogates=20, random_state=5,
+                  surrogate_method='iaaft', checkpoint_path=str(ckpt))
+
+    class Interrupt(Exception):
+        pass
+
+    def stop_after_first_batch(done, total):
+        if done > 0:
+            raise Interrupt
+
+    with pytest.raises(Interrupt):
+        power_test(x, t, surrogate_kwargs={'dy': dy}, progress=stop_after_first_batch, **kwargs)
+
+    changed = dy.copy()
+    changed[n // 2] = 2.0
+    with pytest.raises(ValueError, match="different power_test arguments"):
+        power_test(x, t, surrogate_kwargs={'dy': changed}, **kwargs)
+
+def test_power_test_parallel_options_validation():
+    x = np.random.normal(0, 1, 20)
+    t = np.arange(20)
+    with pytest.raises(ValueError, match="n_jobs"):
+        power_test(x, t, slopes=[0.1], n_simulations=2, n_surrogates=20, n_jobs=0)
+    with pytest.raises(ValueError, match="per_test"):
+        power_test(x, t, slopes=[0.1], n_simulations=2, n_surrogates=20,
+                   n_jobs=2, null_mode='shared')
+
+def test_power_test_analytic_mc_surface():
+    """Analytic MK power: batched scoring and a power surface over sample sizes."""
+    rng = np.random.default_rng(0)
+    t = np.arange(80.0)
+    x = rng.normal(0, 1, 80)
+    slopes = [0.0, 0.01, 0.03, 0.1]
+
+    res = power_test(x, t, slopes=slopes, n_simulations=200, method='analytic_mc',
+                     sample_sizes=[20, 40, 80], random_state=0)
+
+    assert res.power_surface.shape == (3, 4)
+    np.testing.assert_array_equal(res.power_surface[-1], res.power)
+    assert res.power[0] < 0.15
+    assert res.power[-1] == 1.0
+    # Power grows with sample size for a fixed trend
+    assert res.power_surface[0, 2] <= res.power_surface[2, 2]
+    assert set(res.simulation_results['sample_size']) == {20, 40, 80}
+
+def test_power_test_analytic_mc_matches_trend_test():
+    """Each simulated series is judged exactly as trend_test would judge it."""
+    from unittest.mock import patch
+    from MannKS import trend_test
+
+    rng = np.random.default_rng(1)
+    t = np.arange(30.0)
+    x = rng.normal(0, 1, 30)
+    noise = rng.normal(0, 1, (25, 30))
+
+    with patch('MannKS.power._iaaft_surrogates', return_value=noise):
+        res = power_test(x, t, slopes=[0.05], n_simulations=25, method='analytic_mc')
+
+    t_centered = t - t.mean()
+    expected = sum(trend_test(row + 0.05 * t_centered, t).h for row in noise)
+    assert res.simulation_results['n_detected'][0] == expected
+
+def test_power_test_analytic_mc_validation():
+    x = np.random.normal(0, 1, 20)
+    t = np.arange(20)
+    with pytest.raises(ValueError, match="method"):
+        power_test(x, t, slopes=[0.1], method='exact')
+    with pytest.raises(ValueError, match="sample_sizes"):
+        power_test(x, t, slopes=[0.1], n_simulations=5, method='analytic_mc', sample_sizes=[50])
+    with pytest.raises(ValueError, match="sample_sizes"):
+        power_test(x, t, slopes=[0.1], n_simulations=5, sample_sizes=[10])
@@ -2,9 +2,10 @@
 Tests for the regional_test function.
 """
 import unittest
+from unittest import mock
 import pandas as pd
 import numpy as np
-from MannKS import trend_test, regional_test
+from MannKS import trend_test, regional_test, regional_trend_pipeline
 
 class TestRegionalAggregation(unittest.TestCase):
     def test_regional_test_basic(self):
@@ -122,6 +123,99 @@ class TestRegionalAggregation(unittest.TestCase):
         self.assertEqual(result.TAU, 0.5)
         self.assertTrue(np.isnan(result.CT))
 
+    def test_regional_test_blocked_correlation_matches_dense(self):
+        """The tiled float32 correlation engine agrees with the dense matrix."""
+        rng = np.random.default_rng(1)
+        n_sites, n_times = 40, 50
+        dates = pd.date_range('2000-01-01', periods=n_times, freq='MS')
+        common = rng.normal(size=n_times)
+        values = common * rng.uniform(0, 1, (n_sites, 1)) + rng.normal(size=(n_sites, n_times)) + 100
+        sites = [f's{i}' for i in range(n_sites)]
+        time_series_data = pd.DataFrame({
+            'site': np.repeat(sites, n_times),
+            'time': np.tile(dates, n_sites),
+            'value': values.ravel()
+        })
+        # Missing observations make the correlations pairwise-complete
+        time_series_data = time_series_data[rng.random(len(time_series_data)) > 0.2]
+        trend_results = pd.DataFrame({
+            'site': sites,
+            's': rng.integers(-40, 80, n_sites),
+            'C': rng.uniform(0.5, 1, n_sites)
+        })
+
+        dense = regional_test(trend_results, time_series_data, corr_engine='dense')
+        blocked = regional_test(trend_results, time_series_data, corr_engine='blocked', corr_block_size=7)
+        self.assertAlmostEqual(blocked.CorrectedVarTAU, dense.CorrectedVarTAU, delta=1e-6 * dense.CorrectedVarTAU)
+        self.assertEqual(blocked.DT, dense.DT)
+
+        # A constant site has undefined correlations in both engines
+        time_series_data.loc[time_series_data['site'] == 's3', 'value'] = 5.0
+        self.assertTrue(np.isnan(regional_test(trend_results, time_series_data, corr_engine='dense').CorrectedVarTAU))
+        self.assertTrue(np.isnan(regional_test(trend_results, time_series_data, corr_engine='blocked').CorrectedVarTAU))
+
+        with self.assertRaises(ValueError):
+            regional_test(trend_results, time_series_data, corr_engine='sparse')
+
+    def test_regional_trend_pipeline_matches_site_loop(self):
+        """The pipeline reproduces a per-site loop followed by regional_test."""
+        rng = np.random.default_rng(0)
+        dates = pd.date_range('2000-01-01', periods=25, freq='YE')
+        frames = [
+            pd.DataFrame({'site': f'S{k}', 'time': dates,
+                          'value': rng.normal(size=25) + 0.1 * np.arange(25) * (k % 3 - 0.5)})
+            for k in range(9)
+        ]
+        long_df = pd.concat(frames, ignore_index=True).sample(frac=1, random_state=1)
+
+        loop_results = []
+        for site, site_data in long_df.groupby('site'):
+            res_dict = trend_test(x=site_data['value'], t=site_data['time'], min_size=None)._asdict()
+            res_dict['site'] = site
+            loop_results.append(res_dict)
+        expected = regional_test(pd.DataFrame(loop_results), long_df)
+
+        result = regional_trend_pipeline(long_df, min_size=None, batch_size=4)
+        self.assertEqual(result.regional, expected)
+        self.assertEqual(list(result.site_results['site']), sorted(long_df['site'].unique()))
+        self.assertTrue(result.site_results['error'].isna().all())
+        np.testing.assert_array_equal(result.site_results['slope'],
+                                      [r['slope'] for r in loop_results])
+
+        pooled = regional_trend_pipeline(long_df, min_size=None, n_jobs=2)
+        pd.testing.assert_frame_equal(pooled.site_results, result.site_results)
+
+    def test_regional_trend_pipeline_isolates_site_failures(self):
+        """A failing site is recorded and excluded instead of aborting the run."""
+        import importlib
+        batch_module = importlib.import_module("MannKS.trend_test_many")
+
+        dates = pd.date_range('2000-01-01', periods=20, freq='YE')
+        long_df = pd.concat([
+            pd.DataFrame({'site': site, 'time': dates, 'value': np.arange(20.0) * sign})
+            for site, sign in [('A', 1), ('B', 1), ('C', -1)]
+        ], ignore_index=True)
+
+        real_trend_test = batch_module.trend_test
+
+        def flaky_trend_test(x, t, **kwargs):
+            if x[0] == 0 and x[1] < 0:
+                raise RuntimeError("sensor offline")
+            return real_trend_test(x, t, **kwargs)
+
+        with mock.patch.object(batch_module, 'trend_test', flaky_trend_test):
+            with self.assertWarns(UserWarning):
+                result = regional_trend_pipeline(long_df, min_size=None)
+
+        errors = result.site_results.set_index('site')['error']
+        self.assertEqual(errors['C'], 'sensor offline')
+        self.assertTrue(np.isnan(result.site_results.set_index('site').loc['C', 's']))
+        self.assertEqual(result.regional.M, 2)
+        self.assertEqual(result.regional.DT, 'Increasing')
+
+        with self.assertRaises(ValueError):
+            regional_trend_pipeline(long_df.drop(columns='value'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -209,3 +209,157 @@ def test_compare_periods_seasonal():
     # Significant change
     assert comparison['significant_change'] == True
     assert comparison['slope_difference'] > 3.0
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'tau_method': 'a', 'continuous_confidence': False}])
+def test_rolling_incremental_engine_matches_full(kwargs):
+    rng = np.random.default_rng(7)
+    n = 300
+    # Rounded values create ties; a repeated time checks time-tie handling
+    x = np.round(rng.normal(size=n) + 0.004 * np.arange(n), 1)
+    t = np.arange(n, dtype=float)
+    t[10] = t[9]
+
+    full = rolling_trend_test(x, t, window=60, step=7, **kwargs)
+    inc = rolling_trend_test(x, t, window=60, step=7, engine='incremental', **kwargs)
+
+    assert len(full) == len(inc) > 0
+    assert list(full.columns) == list(inc.columns)
+    for col in ['n_obs', 'slope', 'lower_ci', 'upper_ci', 'p_value', 'C', 'Cd', 'tau', 's', 'intercept']:
+        np.testing.assert_allclose(inc[col].astype(float), full[col].astype(float), equal_nan=True)
+    assert (inc['classification'] == full['classification']).all()
+
+
+def test_rolling_incremental_engine_datetime_scaling():
+    rng = np.random.default_rng(3)
+    dates = pd.date_range('2000-01-01', periods=400, freq='D')
+    x = rng.normal(size=400) + 0.01 * np.arange(400)
+
+    full = rolling_trend_test(x, dates, window='120D', step='30D', slope_scaling='year')
+    inc = rolling_trend_test(x, dates, window='120D', step='30D', slope_scaling='year', engine='incremental')
+
+    np.testing.assert_allclose(inc['scaled_slope'], full['scaled_slope'])
+    np.testing.assert_allclose(inc['slope_per_second'], full['slope_per_second'])
+    assert (inc['window_center'] == full['window_center']).all()
+
+
+def test_rolling_incremental_engine_validation():
+    x = np.arange(50, dtype=float)
+    t = np.arange(50)
+
+    with pytest.raises(ValueError, match="Invalid `engine`"):
+        rolling_trend_test(x, t, window=20, engine='fast')
+    with pytest.raises(ValueError, match="seasonal"):
+        rolling_trend_test(x, t, window=20, seasonal=True, engine='incremental')
+    with pytest.raises(ValueError, match="autocorr_method"):
+        rolling_trend_test(x, t, window=20, engine='incremental', autocorr_method='yue_wang')
+
+    x_nan = x.copy()
+    x_nan[3] = np.nan
+    with pytest.raises(ValueError, match="missing values"):
+        rolling_trend_test(x_nan, t, window=20, engine='incremental')
+
+    df = pd.DataFrame({'value': x, 'censored': [True] + [False] * 49, 'cen_type': ['lt'] + ['not'] * 49})
+    with pytest.raises(ValueError, match="censored"):
+        rolling_trend_test(df, t, window=20, engine='incremental')
+
+
+def test_rolling_unsorted_input_matches_sorted():
+    rng = np.random.default_rng(11)
+    t = np.arange(120, dtype=float)
+    x = rng.normal(size=120) + 0.02 * t
+    perm = rng.permutation(120)
+
+    sorted_res = rolling_trend_test(x, t, window=40, step=10)
+    shuffled_res = rolling_trend_test(x[perm], t[perm], window=40, step=10)
+
+    np.testing.assert_array_equal(shuffled_res['n_obs'], sorted_res['n_obs'])
+    np.testing.assert_allclose(shuffled_res['slope'], sorted_res['slope'])
+    np.testing.assert_allclose(shuffled_res['s'], sorted_res['s'])
+
+
+def test_rolling_no_window_cap():
+    t = np.arange(12000, dtype=float)
+    x = np.sin(t / 50.0)
+    res = rolling_trend_test(x, t, window=10, step=1, engine='incremental')
+    # The former implementation refused more than 10,000 windows
+    assert len(res) > 10000
+
+
+def test_rolling_non_positive_step_raises():
+    t = np.arange(50, dtype=float)
+    with pytest.raises(ValueError, match="`step` must be positive"):
+        rolling_trend_test(t, t, window=10, step=-1)
+
+
+def test_rolling_parallel_matches_serial():
+    from concurrent.futures import ThreadPoolExecutor
+
+    rng = np.random.default_rng(5)
+    dates = pd.date_range('2010-01-01', periods=200, freq='D')
+    values = rng.normal(size=200) + 0.01 * np.arange(200)
+    df = pd.DataFrame({
+        'value': values,
+        'censored': values < -1,
+        'cen_type': np.where(values < -1, 'lt', 'not'),
+    })
+    perm = rng.permutation(200)
+    df, dates = df.iloc[perm].reset_index(drop=True), dates[perm]
+
+    serial = rolling_trend_test(df, dates, window='60D', step='20D', random_state=1)
+    pooled = rolling_trend_test(df, dates, window='60D', step='20D', random_state=1, n_jobs=2)
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        threaded = rolling_trend_test(df, dates, window='60D', step='20D', random_state=1, executor=ex)
+
+    assert len(serial) > 0
+    pd.testing.assert_frame_equal(pooled, serial)
+    pd.testing.assert_frame_equal(threaded, serial)
+
+
+def test_rolling_parallel_incremental_raises():
+    t = np.arange(50, dtype=float)
+    with pytest.raises(ValueError, match="only supported with engine='full'"):
+        rolling_trend_test(t, t, window=20, engine='incremental', n_jobs=2)
+
+
+def test_compare_periods_parallel():
+    t = np.arange(100)
+    x = np.concatenate([t[:50] * 0.1, t[50:] * (-0.1)])
+
+    serial = compare_periods(x, t, breakpoint=50)
+    pooled = compare_periods(x, t, breakpoint=50, n_jobs=2)
+
+    assert pooled['before']._fields == serial['before']._fields
+    assert pooled['before'].slope == serial['before'].slope
+    assert pooled['after'].slope == serial['after'].slope
+    assert pooled['significant_change'] == serial['significant_change']
+
+
+def test_select_sorted_blocks_matches_sort():
+    from MannKS._order_stats import _select_sorted_blocks, _order_statistics
+
+    rng = np.random.default_rng(2)
+    # Rounded values give many duplicates across blocks
+    blocks = [np.sort(np.round(rng.normal(size=size), 2)) for size in (3000, 0, 1, 2500, 4000)]
+    union = np.sort(np.concatenate(blocks))
+    for k in [0, 1, 4000, 4750, len(union) - 1]:
+        assert _select_sorted_blocks(blocks, k) == union[k]
+
+    many = [np.sort(rng.normal(size=50)) for _ in range(40)]
+    many_union = np.sort(np.concatenate(many))
+    stats = _order_statistics(many, [0, 999, 1000, 1999])
+    assert stats == {k: many_union[k] for k in [0, 999, 1000, 1999]}
+
+
+@pytest.mark.parametrize("window,step", [(120, 60), (120, 10)])
+def test_rolling_incremental_slope_blocks_exact(window, step):
+    rng = np.random.default_rng(9)
+    t = np.sort(rng.uniform(0, 600, 500))
+    t[50:53] = t[50]
+    x = np.round(rng.normal(size=500) + 0.002 * t, 1)
+
+    for ci_method in ['lwp', 'direct']:
+        full = rolling_trend_test(x, t, window=window, step=step, ci_method=ci_method)
+        inc = rolling_trend_test(x, t, window=window, step=step, ci_method=ci_method, engine='incremental')
+        for col in ['slope', 'lower_ci', 'upper_ci', 'intercept']:
+            np.testing.assert_array_equal(inc[col].astype(float), full[col].astype(float))
@@ -31,8 +31,8 @@ def test_slope_scaling_numeric_warning():
     x = np.array([1, 2, 3, 4, 5])
     t = np.array([2000, 2001, 2002, 2003, 2004])
 
-    with pytest.warns(UserWarning, match="Cannot apply `slope_scaling`"):
-        result = trend_test(x, t, x_unit='m', slope_scaling='year')
+    result = trend_test(x, t, x_unit='m', slope_scaling='year')
+    assert any("Cannot apply `slope_scaling`" in w for w in result.warnings)
 
     # The slope should be unscaled, and the units should reflect this
     assert result.slope == 1.0
@@ -47,8 +47,8 @@ def test_invalid_scaling_unit():
     x = np.array([1, 2, 3, 4, 5])
     t = pd.to_datetime(['2000-01-01', '2001-01-01', '2002-01-01', '2003-01-01', '2004-01-01'])
 
-    with pytest.warns(UserWarning, match="Slope scaling failed"):
-        result = trend_test(x, t, x_unit='m', slope_scaling='invalid_unit')
+    result = trend_test(x, t, x_unit='m', slope_scaling='invalid_unit')
+    assert any("Slope scaling failed" in w for w in result.warnings)
 
     # Should fall back to units/sec
     assert result.slope_units == 'm per second'
@@ -126,11 +126,11 @@ def test_seasonal_scaling_variations():
     assert res_num_raw.slope_per_second == res_num_raw.slope # Not scaled
 
     # --- 3. Numeric Input, With Scaling (Should Warn) ---
-    with pytest.warns(UserWarning, match="Cannot apply `slope_scaling`"):
-        res_num_scaled = seasonal_trend_test(
-            values_num, t_num, season_type='month', period=12,
-            slope_scaling='year'
-        )
+    res_num_scaled = seasonal_trend_test(
+        values_num, t_num, season_type='month', period=12,
+        slope_scaling='year'
+    )
+    assert any("Cannot apply `slope_scaling`" in w for w in res_num_scaled.warnings)
 
     # Result should be identical to raw numeric result
     assert res_num_scaled.slope_units == "units per unit of t"
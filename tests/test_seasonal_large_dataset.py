@@ -89,3 +89,26 @@ def test_seasonal_large_dataset_no_stratification_needed():
     # Check Confidence Intervals are valid
     assert not np.isnan(result.lower_ci)
     assert not np.isnan(result.upper_ci)
+
+
+def test_seasonal_large_dataset_exact_by_default():
+    """
+    Without `max_per_season`, large seasonal datasets are scored on every
+    observation, so S and the p-value do not depend on `random_state`.
+    """
+    rng = np.random.default_rng(0)
+    t = np.arange(12000)
+    values = 0.001 * t + np.sin(2 * np.pi * (t % 24) / 24) + rng.normal(0, 1, len(t))
+
+    results = [
+        seasonal_trend_test(x=values, t=t, period=24, large_dataset_mode='fast', random_state=seed)
+        for seed in (1, 2)
+    ]
+
+    assert results[0].s == results[1].s
+    assert results[0].p == results[1].p
+    assert not any("stratified sampling" in note for note in results[0].analysis_notes)
+
+    exact = seasonal_trend_test(x=values, t=t, period=24, large_dataset_mode='full')
+    assert results[0].s == exact.s
+    assert results[0].var_s == exact.var_s
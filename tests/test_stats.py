@@ -62,3 +62,39 @@ def test_sens_estimator_censored_ambiguity_logic():
     sens_slope = np.median(slopes)
 
     assert sens_slope == 0.0
+
+
+@pytest.mark.parametrize("sizes", [(40, 0, 7, 25), (30000, 25000)])
+@pytest.mark.parametrize("ci_method", ['lwp', 'direct'])
+def test_slope_summary_matches_pooled_slopes(sizes, ci_method):
+    """
+    Order statistics of per-season blocks reproduce the pooled-array results.
+    """
+    from MannKS._stats import _sen_probability
+    from MannKS._order_stats import _SortedBlocks, _slope_summary
+
+    rng = np.random.default_rng(4)
+    blocks = [np.round(rng.normal(0.1, 1, size=size), 1) for size in sizes]
+    blocks[0][:5] = np.nan
+    pooled = np.concatenate(blocks)
+    var_s, alpha = 2000.0, 0.1
+
+    pool = _SortedBlocks()
+    for block in blocks:
+        pool.add(block)
+    stats = _slope_summary(pool, var_s, alpha, ci_method=ci_method,
+                           total_pairs=2 * len(pooled), probability=True)
+
+    assert pool.n_nan == 5
+    assert stats['slope'] == np.nanmedian(pooled)
+    assert (stats['lower_ci'], stats['upper_ci']) == _confidence_intervals(
+        pooled, var_s, alpha, method=ci_method, total_pairs=2 * len(pooled))
+    assert (stats['sen_prob'], stats['sen_prob_max'], stats['sen_prob_min']) == _sen_probability(
+        pooled, var_s, total_pairs=2 * len(pooled))
+
+    valid = pooled[~np.isnan(pooled)]
+    clean = _SortedBlocks()
+    clean.add(valid)
+    quartiles = _slope_summary(clean, var_s, alpha, quartiles=True)
+    assert quartiles['q25'] == np.percentile(valid, 25)
+    assert quartiles['q75'] == np.percentile(valid, 75)
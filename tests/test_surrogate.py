@@ -1,4 +1,5 @@
 
+import warnings
 import pytest
 import numpy as np
 import pandas as pd
@@ -330,6 +331,32 @@ def test_seasonal_trend_test_surrogate():
     assert res.trend != 'no trend'
 
 
+def test_seasonal_trend_test_n_jobs_matches_serial():
+    """Season-parallel execution gives the same result as the serial run."""
+    from concurrent.futures import ThreadPoolExecutor
+    from MannKS import prepare_censored_data
+
+    rng = np.random.default_rng(7)
+    dates = pd.date_range("2000-01-01", periods=240, freq="ME")
+    values = rng.normal(size=240) + 0.01 * np.arange(240)
+    x = prepare_censored_data([f"<{v:.1f}" if v < -1 else f"{v:.2f}" for v in values])
+    kwargs = dict(surrogate_method='iaaft', n_surrogates=50, max_pairs=40, random_state=3)
+
+    serial = seasonal_trend_test(x, dates, **kwargs)
+    pooled = seasonal_trend_test(x, dates, n_jobs=2, **kwargs)
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        threaded = seasonal_trend_test(x, dates, executor=ex, **kwargs)
+
+    for res in (pooled, threaded):
+        for field in ['s', 'var_s', 'slope', 'lower_ci', 'upper_ci', 'p', 'sen_probability']:
+            assert getattr(res, field) == getattr(serial, field)
+        np.testing.assert_array_equal(res.surrogate_result.surrogate_scores,
+                                      serial.surrogate_result.surrogate_scores)
+        assert res.analysis_notes == serial.analysis_notes
+
+    with pytest.raises(ValueError, match="n_jobs"):
+        seasonal_trend_test(x, dates, n_jobs=0)
+
 def test_seasonal_trend_test_block_bootstrap():
     """Test seasonal trend test with block bootstrap."""
     # Create 5 years of monthly data
@@ -379,14 +406,14 @@ def test_large_dataset_performance_warning():
     with pytest.MonkeyPatch.context() as m:
         m.setattr(tt_module, 'surrogate_test', mock_surrogate)
 
-        with pytest.warns(UserWarning, match="Performance Warning"):
-            trend_test(
-                x, t,
-                surrogate_method='iaaft',
-                n_surrogates=101, # > 100 to trigger warning
-                mk_test_method='lwp',
-                random_state=42
-            )
+        result = trend_test(
+            x, t,
+            surrogate_method='iaaft',
+            n_surrogates=101, # > 100 to trigger warning
+            mk_test_method='lwp',
+            random_state=42
+        )
+        assert any("Performance Warning" in w for w in result.warnings)
 
 
 def test_seasonal_surrogate_kwargs_alignment():
@@ -425,3 +452,146 @@ def test_seasonal_surrogate_kwargs_alignment():
             n_surrogates=10,
             surrogate_kwargs={'dy': dy}
         )
+
+
+def test_reduce_frequency_grid_preserves_band_power():
+    """Log-binning caps the grid size and preserves total spectral power."""
+    from MannKS._surrogate import _reduce_frequency_grid
+
+    rng = np.random.default_rng(0)
+    freq = np.linspace(0.001, 5.0, 5000)
+    power = rng.uniform(0, 1, len(freq)) / (1 + freq)
+
+    freq_r, power_r, err = _reduce_frequency_grid(freq, power, max_frequencies=100)
+
+    assert len(freq_r) <= 100
+    assert np.all(np.diff(freq_r) > 0)
+    assert np.isclose(np.sum(power_r), np.sum(power))
+    assert 0 < err < 1
+
+    # No reduction needed: grid returned unchanged with zero error
+    freq_same, power_same, err_same = _reduce_frequency_grid(freq[:50], power[:50], max_frequencies=100)
+    assert len(freq_same) == 50
+    assert err_same == 0.0
+
+
+@pytest.mark.skipif(not HAS_ASTROPY, reason="Astropy not installed")
+def test_lomb_scargle_max_frequencies():
+    """Capping the frequency grid bounds synthesis and is reported in the notes."""
+    rng = np.random.default_rng(42)
+    n = 200
+    t = np.sort(rng.uniform(0, 5000, n))
+    x = rng.standard_normal(n)
+
+    surrogates, info = _lomb_scargle_surrogates(
+        x, t, n_surrogates=5, random_state=42, max_frequencies=64, return_info=True
+    )
+    assert surrogates.shape == (5, n)
+    assert info['n_frequencies'] <= 64
+    assert info['n_frequencies_original'] > 64
+    # Rank adjustment still preserves the amplitude distribution
+    assert np.allclose(np.sort(surrogates[0]), np.sort(x))
+
+    res = surrogate_test(x, t, method='lomb_scargle', n_surrogates=20,
+                         random_state=42, max_frequencies=64)
+    assert any("Frequency grid reduced" in note for note in res.notes)
+
+@pytest.fixture
+def surrogate_cache(tmp_path):
+    from MannKS import set_cache_dir
+    set_cache_dir(tmp_path / "cache")
+    yield tmp_path / "cache"
+    set_cache_dir(None)
+
+def test_surrogate_cache_iaaft_roundtrip(surrogate_cache):
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.normal(size=64))
+
+    with warnings.catch_warnings(record=True) as first_warnings:
+        warnings.simplefilter("always")
+        first = _iaaft_surrogates(x, n_surrogates=20, random_state=3)
+    # The bank and its record of stalled surrogates
+    assert len(list(surrogate_cache.glob("*.npy"))) == 2
+
+    with warnings.catch_warnings(record=True) as second_warnings:
+        warnings.simplefilter("always")
+        second = _iaaft_surrogates(x, n_surrogates=20, random_state=3)
+    assert isinstance(second, np.memmap)
+    np.testing.assert_array_equal(first, second)
+    # A cache hit reports the same convergence diagnostics
+    assert any("IAAFT convergence stalled" in str(w.message) for w in first_warnings)
+    assert [str(w.message) for w in second_warnings] == [str(w.message) for w in first_warnings]
+
+    # Different seeds, or no seed, are not served from the cache
+    third = _iaaft_surrogates(x, n_surrogates=20, random_state=4)
+    assert not np.array_equal(first, third)
+    _iaaft_surrogates(x, n_surrogates=20, random_state=None)
+    assert len(list(surrogate_cache.glob("*.npy"))) == 4
+
+@pytest.mark.skipif(not HAS_ASTROPY, reason="astropy not installed")
+def test_surrogate_cache_lomb_scargle(surrogate_cache):
+    rng = np.random.default_rng(1)
+    t = np.sort(rng.uniform(0, 50, 60))
+    x = np.sin(t / 5) + rng.normal(size=60)
+
+    first, info_first = _lomb_scargle_surrogates(
+        x, t, n_surrogates=10, random_state=5, max_frequencies=20, return_info=True
+    )
+    # Periodogram + bank
+    assert len(list(surrogate_cache.glob("*.npy"))) == 2
+
+    second, info_second = _lomb_scargle_surrogates(
+        x, t, n_surrogates=10, random_state=5, max_frequencies=20, return_info=True
+    )
+    np.testing.assert_array_equal(first, second)
+    assert info_first == info_second
+
+    res_a = surrogate_test(x, t, method='lomb_scargle', n_surrogates=10, random_state=5)
+    res_b = surrogate_test(x, t, method='lomb_scargle', n_surrogates=10, random_state=5)
+    np.testing.assert_array_equal(res_a.surrogate_scores, res_b.surrogate_scores)
+
+def test_surrogate_cache_lru_eviction(tmp_path):
+    from MannKS import set_cache_dir, clear_cache
+    from MannKS import _cache
+    import os, time
+
+    set_cache_dir(tmp_path, max_size_mb=0.05)
+    try:
+        x = np.random.default_rng(2).normal(size=128)
+        # Each bank is 20 x 128 float64 = ~20 KB; only two fit in 50 KB
+        for seed in range(3):
+            _iaaft_surrogates(x, n_surrogates=20, random_state=seed)
+            time.sleep(0.01)
+        keys = [_cache._cache_key('iaaft', x, 20, 100, 1e-6, seed) for seed in range(3)]
+        exists = [os.path.exists(tmp_path / (k + '.npy')) for k in keys]
+        assert exists == [False, True, True]
+
+        clear_cache()
+        assert not list(tmp_path.glob("*.npy"))
+    finally:
+        set_cache_dir(None)
+
+def test_surrogate_cache_store_failure_leaves_no_temp_file(surrogate_cache, monkeypatch):
+    from MannKS import _cache
+
+    def full_disk(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(_cache.np, 'save', full_disk)
+    arr = np.arange(10.0)
+    assert _cache._cache_store('key', arr) is arr
+    assert list(surrogate_cache.iterdir()) == []
+
+def test_power_test_does_not_cache_simulated_series(surrogate_cache):
+    from MannKS import power_test
+    x = np.random.default_rng(0).normal(size=40)
+    power_test(x, np.arange(40.0), slopes=[0.0, 0.1], n_simulations=5, n_surrogates=20,
+               surrogate_method='iaaft', random_state=1)
+    # Only the noise bank of the observed series (and its stall record)
+    assert len(list(surrogate_cache.glob("*.npy"))) == 2
+
+def test_set_cache_dir_validation(tmp_path):
+    from MannKS import set_cache_dir, get_cache_dir
+    with pytest.raises(ValueError):
+        set_cache_dir(tmp_path, max_size_mb=0)
+    assert get_cache_dir() is None
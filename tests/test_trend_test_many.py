@@ -0,0 +1,109 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from MannKS import trend_test, trend_test_many, prepare_censored_data
+
+
+def _long_frame(seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2000-01-01', periods=36, freq='MS')
+    frames = []
+    for site in range(6):
+        for param in ['N', 'P']:
+            n = int(rng.integers(1, 36))
+            values = np.round(rng.normal(size=n) + 0.05 * np.arange(n) * (site % 3 - 1), 1)
+            times = dates[:n]
+            if site == 4 and n > 3:
+                # Tied timestamps
+                times = times.where(np.arange(n) != 3, times[2])
+            frames.append(pd.DataFrame({'site': f'S{site}', 'param': param, 'time': times, 'value': values}))
+    df = pd.concat(frames, ignore_index=True).sample(frac=1, random_state=1)
+    df.loc[df.index[:4], 'value'] = np.nan
+    return df
+
+
+def test_trend_test_many_matches_grouped_loop():
+    df = _long_frame()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = trend_test_many(df, by=['site', 'param'], min_size=None, slope_scaling='year')
+        for (site, param), group in df.groupby(['site', 'param']):
+            expected = trend_test(group['value'], group['time'], min_size=None, slope_scaling='year')
+            row = result[(result['site'] == site) & (result['param'] == param)].iloc[0]
+            for field in ['s', 'var_s', 'p', 'slope', 'lower_ci', 'upper_ci', 'classification']:
+                assert row[field] == getattr(expected, field) or (
+                    pd.isna(row[field]) and pd.isna(getattr(expected, field)))
+            assert row['warnings'] == expected.warnings
+
+    assert list(zip(result['site'], result['param'])) == sorted(set(zip(df['site'], df['param'])))
+    assert result['error'].isna().all()
+    assert 'analysis_notes' not in result.columns
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {'ci_method': 'direct', 'tau_method': 'a', 'mk_test_method': 'robust'},
+    {'sens_slope_method': 'ats', 'continuous_confidence': False},
+    {'large_dataset_mode': 'fast', 'max_pairs': 40, 'random_state': 1},
+])
+def test_trend_test_many_kernel_matches_full(kwargs):
+    df = _long_frame()
+    values = df['value'].to_numpy()
+    # One censored group falls back to trend_test
+    raw = [f"<{v}" if (s == 'S1' and v < 0) else str(v) for s, v in zip(df['site'], values)]
+    censored = prepare_censored_data(raw)
+    censored.index = df.index
+    df = df.drop(columns='value').join(censored)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        full = trend_test_many(df, by=['site', 'param'], min_size=None, **kwargs)
+        kernel = trend_test_many(df, by=['site', 'param'], min_size=None, engine='kernel', **kwargs)
+    if kwargs.get('sens_slope_method') == 'ats':
+        # The censored ATS intervals come from an unseeded bootstrap
+        full, kernel = full[full['site'] != 'S1'], kernel[kernel['site'] != 'S1']
+    pd.testing.assert_frame_equal(kernel, full)
+
+
+def test_trend_test_many_parallel_and_failures(monkeypatch):
+    import importlib
+    batch_module = importlib.import_module("MannKS.trend_test_many")
+    df = _long_frame()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        serial = trend_test_many(df, by='site', min_size=None)
+        pooled = trend_test_many(df, by='site', min_size=None, n_jobs=2)
+    pd.testing.assert_frame_equal(pooled, serial)
+
+    real_trend_test = batch_module.trend_test
+    df.loc[df['site'] == 'S2', 'value'] = 999.0
+
+    def flaky_trend_test(x, t, **kwargs):
+        if np.any(np.asarray(x) == 999.0):
+            raise RuntimeError("bad group")
+        return real_trend_test(x, t, **kwargs)
+
+    monkeypatch.setattr(batch_module, 'trend_test', flaky_trend_test)
+    with pytest.warns(UserWarning, match="group S2: bad group"):
+        result = trend_test_many(df, by='site', min_size=None, batch_size=2)
+    row = result.set_index('site').loc['S2']
+    assert row['error'] == 'bad group'
+    assert row['warnings'] == []
+    assert np.isnan(row['s'])
+    assert result.set_index('site').drop('S2')['error'].isna().all()
+
+
+def test_trend_test_many_validation():
+    df = _long_frame()
+    with pytest.raises(ValueError, match="must contain"):
+        trend_test_many(df, by='basin')
+    with pytest.raises(ValueError, match="engine"):
+        trend_test_many(df, by='site', engine='vectorised')
+    with pytest.raises(ValueError, match="does not support `agg_method='median'`"):
+        trend_test_many(df, by='site', engine='kernel', agg_method='median')
+    with pytest.raises(ValueError, match="seasonal"):
+        trend_test_many(df, by='site', engine='kernel', seasonal=True)
@@ -8,7 +8,7 @@ from MannKS._datetime import (_is_datetime_like, _get_season_func,
                                  _get_cycle_identifier)
 from MannKS._stats import (_rle_lengths, _z_score,
                              _mk_score_and_var_censored)
-from MannKS._helpers import (_missing_values_analysis, _aggregate_censored_median)
+from MannKS._helpers import (_missing_values_analysis, _aggregate_groups, _SeriesData)
 
 class TestUtilsCoverage(unittest.TestCase):
 
@@ -54,11 +54,16 @@ class TestUtilsCoverage(unittest.TestCase):
 
 class TestAggregateCensoredMedian(unittest.TestCase):
 
+    @staticmethod
+    def _robust_median(group):
+        codes = np.zeros(len(group), dtype=np.int64)
+        return _aggregate_groups(_SeriesData.from_frame(group), codes, 'robust_median', is_datetime=False)
+
     def test_empty_group(self):
-        """Test that an empty group returns an empty DataFrame."""
+        """Test that an empty series aggregates to no rows."""
         group = pd.DataFrame({'value': [], 'censored': [], 'cen_type': [], 't_original': [], 't': []})
-        result = _aggregate_censored_median(group, is_datetime=False)
-        self.assertTrue(result.empty)
+        result = self._robust_median(group)
+        self.assertEqual(len(result), 0)
 
     def test_nan_cen_type_mode(self):
         """Test that a group with only NaN cen_types for censored data is handled."""
@@ -72,12 +77,11 @@ class TestAggregateCensoredMedian(unittest.TestCase):
         # The median is 2, and the max censored value is 2, so `is_censored` would be true.
         # However, since the mode of cen_type for censored data is empty, it should
         # fall back to 'not' and `is_censored` should become False.
-        result = _aggregate_censored_median(group, is_datetime=False)
-        self.assertIsInstance(result, pd.DataFrame)
+        result = self._robust_median(group)
         self.assertEqual(len(result), 1)
-        self.assertEqual(result['value'].iloc[0], 2.0)
-        self.assertFalse(result['censored'].iloc[0])
-        self.assertEqual(result['cen_type'].iloc[0], 'not')
+        self.assertEqual(result.value[0], 2.0)
+        self.assertFalse(result.censored[0])
+        self.assertEqual(result.cen_type[0], 'not')
 
 class TestNumericalStability(unittest.TestCase):
 
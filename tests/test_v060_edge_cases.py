@@ -17,7 +17,7 @@ def test_unsorted_aggregation_surrogate_alignment_correctness():
     t_dt = pd.to_datetime(t, unit='D', origin='2020-01-01')
 
     # 2. Run trend_test with 1-to-1 aggregation (agg_period='day')
-    # This should SUCCEED because _aggregate_by_group preserves original_index for singletons.
+    # This should SUCCEED because _aggregate_groups preserves original_index for singletons.
     try:
         trend_test(
             x, t_dt,
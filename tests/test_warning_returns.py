@@ -3,6 +3,8 @@ import pytest
 import numpy as np
 import pandas as pd
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from MannKS import set_emit_warnings
 from MannKS.trend_test import trend_test
 from MannKS.seasonal_trend_test import seasonal_trend_test
 from MannKS.segmented_trend_test import segmented_trend_test
@@ -111,6 +113,64 @@ def test_regional_test_return_warnings():
     # or rely on the fact that we proved capture mechanism works in other tests.
     # The 'warnings' field existence is the API contract we are testing.
 
+def test_warnings_not_emitted_by_default():
+    """Diagnostics are returned in the result but not issued as warnings."""
+    t = np.arange(10)
+    x = np.arange(10)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        res = trend_test(x, t, slope_scaling='year')
+
+    assert any("Cannot apply `slope_scaling`" in w for w in res.warnings)
+
+def test_warnings_emitted_when_enabled():
+    """set_emit_warnings(True) re-issues the diagnostics as UserWarnings."""
+    t = np.arange(10)
+    x = np.arange(10)
+
+    set_emit_warnings(True)
+    try:
+        with pytest.warns(UserWarning, match="Cannot apply `slope_scaling`"):
+            res = trend_test(x, t, slope_scaling='year')
+    finally:
+        set_emit_warnings(False)
+
+    assert len(res.warnings) == 1
+
+def test_warnings_thread_isolation():
+    """Concurrent calls on different threads collect only their own diagnostics."""
+    t = np.arange(30)
+    x = np.arange(30)
+    scalings = ['year', None] * 8
+
+    def run(scaling):
+        return trend_test(x, t, slope_scaling=scaling).warnings
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        results = list(ex.map(run, scalings))
+
+    for scaling, warns in zip(scalings, results):
+        if scaling is None:
+            assert warns == []
+        else:
+            assert len(warns) == 1
+            assert "Cannot apply `slope_scaling`" in warns[0]
+
+def test_rolling_warnings_with_thread_executor():
+    """Windows run on worker threads return their diagnostics without touching warnings.filters."""
+    t = np.arange(40)
+    x = np.arange(40)
+    filters_before = list(warnings.filters)
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        res = rolling_trend_test(x, t, window=10, step=10, slope_scaling='year', engine='full', executor=ex)
+
+    assert warnings.filters == filters_before
+    assert len(res) == 4
+    for warns in res['warnings']:
+        assert any("Cannot apply `slope_scaling`" in w for w in warns)
+
 if __name__ == "__main__":
     # Allow running directly
     pytest.main([__file__])